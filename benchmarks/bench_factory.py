@@ -0,0 +1,98 @@
+"""Build N SVGRenderButtons one by one and with build_svg_widgets.
+
+Run headless with ``QT_QPA_PLATFORM=offscreen python benchmarks/bench_factory.py``.
+Both variants are measured the same way. ``work`` is the time spent
+constructing the widgets plus the time spent inside the event loop until
+every icon is set. It leaves out the idle time spent waiting for the
+widgets' 100 ms load timers and the 16 ms update tick. ``shown`` is the
+wall time until the last icon appears, timer waits included. When
+construction outlasts the timers, there is nothing left to wait for and
+the two times agree.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtWidgets import QApplication, QWidget, QGridLayout
+
+from pyside6_svg_widgets import SVGRenderButton, build_svg_widgets
+from pyside6_svg_widgets.QAbstract import get_color, _cached_svg_pixmap
+
+STYLE = "SVGRenderButton {icon-color: #2d2d2d;} SVGRenderButton:hover {icon-color: #0078d4;}"
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24">' \
+      '<path d="M{0} 2 L22 12 L{0} 22 Z"/></svg>'
+
+
+def make_panel():
+    panel = QWidget()
+    panel.setStyleSheet(STYLE)
+    QGridLayout(panel)
+    panel.show()
+    return panel
+
+
+def wait_for_icons(app, widgets, timeout=10.0):
+    """Process events until every widget has its icon; returns the time spent processing them."""
+    busy = 0.0
+    deadline = time.perf_counter() + timeout
+    while True:
+        # At least one pass for both variants, so layout and paint of the panel are counted alike
+        started = time.perf_counter()
+        app.processEvents()
+        busy += time.perf_counter() - started
+        if not any(w.icon().isNull() for w in widgets) or time.perf_counter() > deadline:
+            return busy
+        time.sleep(0.0005)
+
+
+def one_by_one(app, svgs):
+    panel = make_panel()
+    start = time.perf_counter()
+    widgets = []
+    for i, svg in enumerate(svgs):
+        widget = SVGRenderButton(svg, (24, 24), panel)
+        panel.layout().addWidget(widget, i // 25, i % 25)
+        widgets.append(widget)
+    built = time.perf_counter() - start
+    busy = wait_for_icons(app, widgets)
+    shown = time.perf_counter() - start
+    panel.deleteLater()
+    return built, busy, shown
+
+
+def batched(app, svgs):
+    panel = make_panel()
+    start = time.perf_counter()
+    widgets = build_svg_widgets([(svg, (24, 24)) for svg in svgs], parent=panel)
+    for i, widget in enumerate(widgets):
+        panel.layout().addWidget(widget, i // 25, i % 25)
+    built = time.perf_counter() - start
+    busy = wait_for_icons(app, widgets)
+    shown = time.perf_counter() - start
+    panel.deleteLater()
+    return built, busy, shown
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=500)
+    parser.add_argument("--icons", type=int, default=20, help="distinct SVGs")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    svgs = [SVG.format(2 + i % args.icons) for i in range(args.count)]
+
+    for name, run in (("one by one", one_by_one), ("build_svg_widgets", batched)):
+        get_color.cache_clear()
+        _cached_svg_pixmap.cache_clear()
+        built, busy, shown = run(app, svgs)
+        print(f"{name:>18}: work {(built + busy) * 1000:7.1f} ms (construct {built * 1000:7.1f} + events"
+              f" {busy * 1000:7.1f}), icons shown after {shown * 1000:7.1f} ms for {args.count} widgets")
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark cases for pyqt5_svg_widgets."""
+from common import Timer, result, environment, spin, nested, colors, SVG_PATH
+
+from PyQt5.QtCore import QPoint, QSize, Qt, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt5.QtGui import QColor
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication, QWidget, QGridLayout
+
+from pyqt5_svg_widgets.QAbstract import (
+    SvgWidget, SvgButton, SvgLabel, SvgRadioButton, SvgToolButton,
+    SwitchButton, SegmentedToggleGroup, ToggleSwitchGroup, SvgRenderer
+)
+
+BINDING = "pyqt5"
+
+LIGHT = """
+QWidget { background-color: #ffffff; color: #2d2d2d; selection-background-color: #0078d4; }
+SwitchButton { qproperty-checkedBackground: #0078d4; qproperty-uncheckedBackground: #c8c8c8; }
+"""
+DARK = LIGHT.replace("#ffffff", "#1e1e1e").replace("#2d2d2d", "#f0f0f0").replace("#0078d4", "#4cc2ff")
+
+FACTORIES = {
+    "SvgWidget": lambda parent: SvgWidget(SVG_PATH, parent),
+    "SvgButton": lambda parent: SvgButton(SVG_PATH, "Item", parent),
+    "SvgLabel": lambda parent: SvgLabel(SVG_PATH, "Item", parent),
+    "SvgRadioButton": lambda parent: SvgRadioButton(SVG_PATH, "Item", parent),
+    "SvgToolButton": lambda parent: SvgToolButton(SVG_PATH, "Item", parent),
+    "SwitchButton": lambda parent: SwitchButton(parent),
+    "ToggleSwitchGroup": lambda parent: ToggleSwitchGroup(["One", "Two", "Three"], parent),
+    "SegmentedToggleGroup": lambda parent: SegmentedToggleGroup(["One", "Two", "Three"], parent),
+}
+
+
+def panel(app, theme=LIGHT):
+    root = QWidget()
+    root.setStyleSheet(theme)
+    QGridLayout(root)
+    root.resize(1200, 900)
+    root.show()
+    QTest.qWaitForWindowExposed(root)
+    return root
+
+
+def populate(app, build, parent, count, columns=20):
+    layout = parent.layout() or QGridLayout(parent)
+    widgets = []
+    for i in range(count):
+        widget = build(parent)
+        layout.addWidget(widget, i // columns, i % columns)
+        widgets.append(widget)
+    return widgets
+
+
+def dispose(app, root):
+    root.hide()
+    root.deleteLater()
+    spin(app, 0.01)
+
+
+def bench_construct(app, count, repeat):
+    out = []
+    for name, build in FACTORIES.items():
+        timer = Timer()
+        for _ in range(repeat):
+            root = panel(app)
+            with timer:
+                populate(app, build, root, count)
+                # These widgets paint on demand, so the first paint belongs here
+                app.processEvents()
+            dispose(app, root)
+        out.append(result(BINDING, "construct", timer.samples, count, widget=name))
+    return out
+
+
+def bench_hover_press(app, count, repeat):
+    out = []
+    for name, build in FACTORIES.items():
+        root = panel(app)
+        widgets = populate(app, build, root, count)
+        app.processEvents()
+        timer = Timer()
+        for _ in range(repeat):
+            with timer:
+                for widget in widgets:
+                    center = widget.rect().center()
+                    QTest.mouseMove(widget, center)
+                    QTest.mousePress(widget, Qt.LeftButton, Qt.NoModifier, center)
+                    QTest.mouseRelease(widget, Qt.LeftButton, Qt.NoModifier, center)
+                QTest.mouseMove(root, QPoint(root.width() - 1, root.height() - 1))
+                app.processEvents()
+        out.append(result(BINDING, "hover_press_cycle", timer.samples, count, widget=name))
+        dispose(app, root)
+    return out
+
+
+def bench_theme_switch(app, count, repeat, depths):
+    out = []
+    for name in ("SvgButton", "SwitchButton"):
+        for depth in depths:
+            root = panel(app)
+            leaf = nested(QWidget, QGridLayout, root, depth)
+            populate(app, FACTORIES[name], leaf, count)
+            app.processEvents()
+            timer = Timer()
+            for i in range(repeat):
+                with timer:
+                    root.setStyleSheet(DARK if i % 2 == 0 else LIGHT)
+                    app.processEvents()
+            out.append(result(BINDING, "theme_switch", timer.samples, count, widget=name, depth=depth))
+            dispose(app, root)
+    return out
+
+
+def bench_render(app, count, repeat):
+    out = []
+    palette = [QColor(c) for c in colors(count)]
+    for size in (24, 64):
+        timer = Timer()
+        for _ in range(repeat):
+            # The raster cache is shared by all renderers: start every repeat cold
+            SvgRenderer._cache.clear()
+            renderer = SvgRenderer(SVG_PATH)
+            with timer:
+                for color in palette:
+                    renderer.render(QSize(size, size), color)
+        out.append(result(BINDING, "SvgRenderer.render", timer.samples, count, size=size))
+
+        renderer = SvgRenderer(SVG_PATH)
+        renderer.render(QSize(size, size), palette[0])
+        timer = Timer()
+        for _ in range(repeat):
+            with timer:
+                for _ in palette:
+                    renderer.render(QSize(size, size), palette[0])
+        out.append(result(BINDING, "SvgRenderer.render_hit", timer.samples, count, size=size))
+    return out
+
+
+def run(count, repeat, depths):
+    app = QApplication.instance() or QApplication([])
+    results = []
+    results += bench_construct(app, count, repeat)
+    results += bench_hover_press(app, count, repeat)
+    results += bench_theme_switch(app, count, repeat, depths)
+    results += bench_render(app, count, repeat)
+    return {"environment": environment(BINDING, QT_VERSION_STR, PYQT_VERSION_STR), "results": results}
@@ -0,0 +1,159 @@
+"""Benchmark cases for pyside6_svg_widgets."""
+from common import Timer, result, environment, spin, nested, colors, read_svg, SVG_PATH
+
+import PySide6
+from PySide6.QtCore import QPoint, Qt, qVersion
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QWidget, QGridLayout
+
+from pyside6_svg_widgets import (
+    QIconSvg, QSvgButton, QSvgButtonIcon, QDropButton,
+    SVGRenderButton, SVGRenderIcon, SVGRenderRadioButton, IconUpdateScheduler
+)
+from pyside6_svg_widgets.QAbstract import get_color, svg_to_pixmap, cached_svg_pixmap, _cached_svg_pixmap
+
+BINDING = "pyside6"
+
+LIGHT = """
+SVGRenderButton, SVGRenderIcon, SVGRenderRadioButton, QIconSvg, QSvgButton, QSvgButtonIcon, QDropButton
+{icon-color: #2d2d2d;}
+SVGRenderButton:hover, SVGRenderIcon:hover, SVGRenderRadioButton:hover, QIconSvg:hover, QSvgButton:hover,
+QSvgButtonIcon:hover, QDropButton:hover {icon-color: #0078d4;}
+SVGRenderButton:pressed, SVGRenderIcon:pressed, SVGRenderRadioButton:pressed, QIconSvg:pressed,
+QSvgButton:pressed, QSvgButtonIcon:pressed, QDropButton:pressed {icon-color: #005a9e;}
+"""
+DARK = LIGHT.replace("#2d2d2d", "#f0f0f0").replace("#0078d4", "#4cc2ff").replace("#005a9e", "#99ebff")
+
+
+def factories(svg):
+    return {
+        "QIconSvg": lambda parent: QIconSvg(SVG_PATH, parent),
+        "QSvgButton": lambda parent: QSvgButton(SVG_PATH, parent),
+        "QSvgButtonIcon": lambda parent: QSvgButtonIcon(SVG_PATH, parent),
+        "QDropButton": lambda parent: QDropButton("Item", SVG_PATH, SVG_PATH, SVG_PATH, parent=parent),
+        "QDropButton(flat)": lambda parent: QDropButton("Item", SVG_PATH, SVG_PATH, SVG_PATH, parent=parent, flat=True),
+        "SVGRenderButton": lambda parent: SVGRenderButton(svg, (24, 24), parent),
+        "SVGRenderIcon": lambda parent: SVGRenderIcon(svg, (24, 24), parent),
+        "SVGRenderRadioButton": lambda parent: SVGRenderRadioButton(svg, (24, 24), parent),
+    }
+
+
+def panel(app, theme=LIGHT):
+    root = QWidget()
+    root.setStyleSheet(theme)
+    QGridLayout(root)
+    root.resize(1200, 900)
+    root.show()
+    QTest.qWaitForWindowExposed(root)
+    return root
+
+
+def populate(app, build, parent, count, columns=25):
+    layout = parent.layout() or QGridLayout(parent)
+    widgets = []
+    for i in range(count):
+        widget = build(parent)
+        layout.addWidget(widget, i // columns, i % columns)
+        widgets.append(widget)
+    return widgets
+
+
+def dispose(app, root):
+    root.hide()
+    root.deleteLater()
+    spin(app, 0.01)
+
+
+def settle(app):
+    # The widgets load 100 ms after construction; updates land one frame later
+    spin(app, 0.15)
+    IconUpdateScheduler.instance().flush()
+
+
+def bench_construct(app, svg, count, repeat):
+    out = []
+    for name, build in factories(svg).items():
+        timer = Timer()
+        for _ in range(repeat):
+            root = panel(app)
+            with timer:
+                populate(app, build, root, count)
+            settle(app)
+            dispose(app, root)
+        out.append(result(BINDING, "construct", timer.samples, count, widget=name))
+    return out
+
+
+def bench_hover_press(app, svg, count, repeat):
+    out = []
+    for name, build in factories(svg).items():
+        root = panel(app)
+        widgets = populate(app, build, root, count)
+        settle(app)
+        timer = Timer()
+        for _ in range(repeat):
+            with timer:
+                for widget in widgets:
+                    center = widget.rect().center()
+                    QTest.mouseMove(widget, center)
+                    QTest.mousePress(widget, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier, center)
+                    QTest.mouseRelease(widget, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier, center)
+                QTest.mouseMove(root, QPoint(root.width() - 1, root.height() - 1))
+                IconUpdateScheduler.instance().flush()
+                app.processEvents()
+        out.append(result(BINDING, "hover_press_cycle", timer.samples, count, widget=name))
+        dispose(app, root)
+    return out
+
+
+def bench_theme_switch(app, svg, count, repeat, depths):
+    out = []
+    for depth in depths:
+        root = panel(app)
+        leaf = nested(QWidget, QGridLayout, root, depth)
+        populate(app, factories(svg)["SVGRenderButton"], leaf, count)
+        settle(app)
+        timer = Timer()
+        for i in range(repeat):
+            with timer:
+                root.setStyleSheet(DARK if i % 2 == 0 else LIGHT)
+                app.processEvents()
+                IconUpdateScheduler.instance().flush()
+                app.processEvents()
+        out.append(result(BINDING, "theme_switch", timer.samples, count, widget="SVGRenderButton", depth=depth))
+        dispose(app, root)
+    return out
+
+
+def bench_render(app, svg, count, repeat):
+    out = []
+    palette = colors(count)
+    for size in (24, 64):
+        timer = Timer()
+        for _ in range(repeat):
+            with timer:
+                for color in palette:
+                    svg_to_pixmap(svg, size, size, color)
+        out.append(result(BINDING, "svg_to_pixmap", timer.samples, count, size=size))
+
+        _cached_svg_pixmap.cache_clear()
+        cached_svg_pixmap(svg, size, size, palette[0])
+        timer = Timer()
+        for _ in range(repeat):
+            with timer:
+                for _ in palette:
+                    cached_svg_pixmap(svg, size, size, palette[0])
+        out.append(result(BINDING, "cached_svg_pixmap_hit", timer.samples, count, size=size))
+    return out
+
+
+def run(count, repeat, depths):
+    app = QApplication.instance() or QApplication([])
+    svg = read_svg()
+    results = []
+    results += bench_construct(app, svg, count, repeat)
+    results += bench_hover_press(app, svg, count, repeat)
+    results += bench_theme_switch(app, svg, count, repeat, depths)
+    results += bench_render(app, svg, count, repeat)
+    get_color.cache_clear()
+    return {"environment": environment(BINDING, qVersion(), PySide6.__version__), "results": results}
@@ -0,0 +1,81 @@
+"""Helpers shared by the binding-specific benchmark cases."""
+import os
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SVG_PATH = os.path.join(ROOT, "x.svg")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def read_svg() -> str:
+    with open(SVG_PATH, encoding="utf-8") as file:
+        return file.read()
+
+
+def colors(count: int):
+    """Distinct colors, so that per-color caches are missed on purpose."""
+    return ["#%06x" % ((i * 2654435761) & 0xFFFFFF) for i in range(count)]
+
+
+class Timer:
+    """Collects wall-clock samples of one case."""
+
+    def __init__(self):
+        self.samples = []
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append(time.perf_counter() - self._start)
+        return False
+
+
+def result(binding: str, case: str, samples, items: int, **params) -> dict:
+    best = min(samples)
+    return {
+        "binding": binding,
+        "case": case,
+        "params": params,
+        "items": items,
+        "repeat": len(samples),
+        "min_s": round(best, 6),
+        "median_s": round(statistics.median(samples), 6),
+        "per_item_us": round(best / max(items, 1) * 1e6, 3),
+    }
+
+
+def environment(binding: str, qt_version: str, binding_version: str) -> dict:
+    return {
+        "binding": binding,
+        "binding_version": binding_version,
+        "qt_version": qt_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qpa": os.environ.get("QT_QPA_PLATFORM"),
+    }
+
+
+def spin(app, seconds: float):
+    """Run the event loop for ``seconds``, so deferred loads and timers fire."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def nested(widget_class, layout_class, root, depth: int):
+    """A chain of ``depth`` laid out plain widgets below ``root``; returns the innermost."""
+    parent = root
+    for _ in range(depth):
+        child = widget_class(parent)
+        layout_class(child).setContentsMargins(0, 0, 0, 0)
+        parent.layout().addWidget(child)
+        parent = child
+    return parent
@@ -0,0 +1,103 @@
+"""Import cost of both packages, measured with ``python -X importtime``.
+
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --binding pyside6 --repeat 10 --output imports.json
+
+Every statement runs in a fresh interpreter. The report gives the wall time
+of the statement (minimum over the repeats), the total ``-X importtime``
+reports for it and the modules with the largest self time.
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+
+from common import ROOT
+
+STATEMENTS = {
+    "pyside6": [
+        "import PySide6.QtWidgets",
+        "import pyside6_svg_widgets",
+        "from pyside6_svg_widgets import instrument",
+        "from pyside6_svg_widgets import QIconSvg",
+        "from pyside6_svg_widgets import SvgIconView",
+        "from pyside6_svg_widgets import *",
+    ],
+    "pyqt5": [
+        "import PyQt5.QtWidgets",
+        "import pyqt5_svg_widgets",
+        "from pyqt5_svg_widgets.QAbstract import SvgButton",
+    ],
+}
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+PROGRAM = "import time\nstarted = time.perf_counter()\n{statement}\nprint(time.perf_counter() - started)\n"
+
+
+def measure(statement):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROGRAM.format(statement=statement)],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    if process.returncode:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    modules = {}
+    total = 0
+    for line in process.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        own, cumulative, indent, name = match.groups()
+        modules[name] = int(own)
+        if not indent:
+            total += int(cumulative)
+    return float(process.stdout.strip().splitlines()[-1]), total, modules
+
+
+def run(binding, repeat, top):
+    results = []
+    for statement in STATEMENTS[binding]:
+        try:
+            samples = [measure(statement) for _ in range(repeat)]
+        except RuntimeError as error:
+            results.append({"binding": binding, "statement": statement, "error": str(error)})
+            continue
+        wall, total, modules = min(samples, key=lambda sample: sample[0])
+        heaviest = sorted(modules.items(), key=lambda item: -item[1])[:top]
+        results.append({
+            "binding": binding,
+            "statement": statement,
+            "wall_ms": round(wall * 1000, 2),
+            "importtime_ms": round(total / 1000, 2),
+            "modules": len(modules),
+            "heaviest": {name: round(us / 1000, 2) for name, us in heaviest},
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--binding", choices=sorted(STATEMENTS), action="append")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="heaviest modules to list per statement")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args()
+
+    results = []
+    for binding in args.binding or sorted(STATEMENTS):
+        results += run(binding, args.repeat, args.top)
+
+    for result in results:
+        if "error" in result:
+            print(f"{result['statement']:<50} {result['error']}")
+        else:
+            print(f"{result['statement']:<50} {result['wall_ms']:>9.2f} ms  {result['modules']:>4} modules")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
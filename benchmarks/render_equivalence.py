@@ -0,0 +1,323 @@
+"""Render-equivalence and cost report for the SVG render paths.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/render_equivalence.py --output equivalence.json
+
+Renders every SVG of the corpus at several sizes and colors through each
+render path and compares the result with the reference path: the 10x
+oversampled output of ``svg_to_pixmap`` scaled to the final icon size. The
+widgets no longer show that render; they show exact renders for the
+screen's device pixel ratio. The reference is kept as the quality
+baseline, against which those renders are checked. Paths:
+
+- ``svg_to_pixmap``            reference, 10x render + SourceIn fill, scaled down
+- ``svg_to_pixmap(dpr=2)``     exact render for a 200% screen, compared scaled down
+- ``SVGRenderButton.updateIcon`` the icon a widget ends up with
+- ``colored_svg_pixmap``       exact-size render used by flat QDropButton
+- ``QIconSvg.updateIcon``      exact-size render of the path-based label
+- ``pyqt5.SvgRenderer.render`` pyqt5_svg_widgets, rendered in a separate process
+
+New candidate paths are added with ``--path module:function`` (a callable
+``(svg_text, width, height, color) -> QImage | QPixmap``, PySide6). Each
+result records max/mean channel difference, share of pixels over the
+tolerance, median render time and raster bytes. The exit status is 1 when
+a path does not match, so CI can run it as a gate.
+"""
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from common import SVG_PATH  # noqa: E402  (sets the offscreen platform and sys.path)
+
+SIZES = (16, 24, 48)
+COLORS = ("#000000", "#d13438", "#0078d4")
+
+BUILTIN = {
+    "stroke.svg": '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24">'
+                  '<path d="M4 12h16M12 4v16" stroke="#000" stroke-width="2" fill="none"/></svg>',
+    "shapes.svg": '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24">'
+                  '<circle cx="8" cy="8" r="5"/><rect x="12" y="12" width="9" height="9" rx="2"/></svg>',
+    "opacity.svg": '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24">'
+                   '<path d="M2 2h20v20H2z" fill-opacity="0.4"/><path d="M7 7h10v10H7z"/></svg>',
+    "wide.svg": '<svg xmlns="http://www.w3.org/2000/svg" width="48" height="24" viewBox="0 0 48 24">'
+                '<path d="M2 12l10-10v6h24V2l10 10-10 10v-6H12v6z"/></svg>',
+}
+
+
+def corpus(directory):
+    items = {}
+    if directory:
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".svg"):
+                with open(os.path.join(directory, name), encoding="utf-8") as file:
+                    items[name] = file.read()
+    else:
+        with open(SVG_PATH, encoding="utf-8") as file:
+            items[os.path.basename(SVG_PATH)] = file.read()
+        items.update(BUILTIN)
+    return items
+
+
+def write_corpus(items, folder):
+    paths = {}
+    for name, text in items.items():
+        path = os.path.join(folder, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        paths[name] = path
+    return paths
+
+
+def timed(render, repeat):
+    samples = []
+    image = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        image = render()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return image, samples[len(samples) // 2]
+
+
+# --- pyqt5 worker -----------------------------------------------------------
+
+def pyqt5_worker(args):
+    from PyQt5.QtCore import QSize
+    from PyQt5.QtGui import QColor
+    from PyQt5.QtWidgets import QApplication
+    from pyqt5_svg_widgets.QAbstract import SvgRenderer
+
+    app = QApplication.instance() or QApplication([])
+    timings = {}
+    for name, path in json.loads(args.files).items():
+        for size in SIZES:
+            for color in COLORS:
+                def render():
+                    # Rasters are shared between renderers, measure the render and not the cache hit
+                    SvgRenderer._cache.clear()
+                    return SvgRenderer(path).render(QSize(size, size), QColor(color))
+
+                pixmap, seconds = timed(render, args.repeat)
+                target = os.path.join(args.workdir, f"pyqt5-{name}-{size}-{color[1:]}.png")
+                pixmap.toImage().save(target)
+                timings[os.path.basename(target)] = {"seconds": seconds, "bytes": pixmap.width() * pixmap.height() * 4}
+    json.dump(timings, sys.stdout)
+    app.quit()
+
+
+# --- pyside6 paths and comparison --------------------------------------------
+
+def pyside6_paths(files, extra):
+    from PySide6.QtCore import QSize, QByteArray, Qt
+    from PySide6.QtWidgets import QWidget
+    from pyside6_svg_widgets import SVGRenderButton, QIconSvg, IconUpdateScheduler
+    from pyside6_svg_widgets.QAbstract import svg_to_pixmap, colored_svg_pixmap, _cached_svg_pixmap, _widget_rasters
+    from pyside6_svg_widgets.memory import pixmap_bytes
+
+    IconUpdateScheduler.instance().setEnabled(False)
+    host = QWidget()
+
+    def reference(name, svg, size, color):
+        pixmap = svg_to_pixmap(svg, size, size, color)
+        scaled = pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                               Qt.TransformationMode.SmoothTransformation)
+        return scaled.toImage(), pixmap_bytes(pixmap)
+
+    # Every timed render starts from empty caches, so all paths are timed cold
+    def update_icon(name, svg, size, color):
+        _cached_svg_pixmap.cache_clear()
+        button = SVGRenderButton(None, (size, size), host)
+        button.svg_string = svg
+        button.updateIcon(color)
+        image = button.icon().pixmap(QSize(size, size)).toImage()
+        peak = max((pixmap_bytes(button.icon().pixmap(s)) for s in button.icon().availableSizes()), default=0)
+        button.deleteLater()
+        return image, peak
+
+    def exact_2x(name, svg, size, color):
+        pixmap = svg_to_pixmap(svg, size, size, color, 2.0)
+        return pixmap.toImage(), pixmap_bytes(pixmap)
+
+    def colored(name, svg, size, color):
+        colored_svg_pixmap.cache_clear()
+        pixmap = colored_svg_pixmap(files[name], size, size, color)
+        return pixmap.toImage(), pixmap_bytes(pixmap)
+
+    def icon_label(name, svg, size, color):
+        _widget_rasters.clear()
+        label = QIconSvg(None, host)
+        label.svg_path = files[name]
+        label.svg_data = QByteArray(svg.encode("utf-8"))
+        label.size = (size, size)
+        label.applyIcon(color)
+        pixmap = label.pixmap()
+        label.deleteLater()
+        return pixmap.toImage(), pixmap_bytes(pixmap)
+
+    paths = {
+        "svg_to_pixmap": reference,
+        "SVGRenderButton.updateIcon": update_icon,
+        "svg_to_pixmap(dpr=2)": exact_2x,
+        "colored_svg_pixmap": colored,
+        "QIconSvg.updateIcon": icon_label,
+    }
+    for spec in extra:
+        module_name, _, attribute = spec.partition(":")
+        function = getattr(importlib.import_module(module_name), attribute)
+
+        def candidate(name, svg, size, color, function=function):
+            result = function(svg, size, size, color)
+            image = result.toImage() if hasattr(result, "toImage") else result
+            return image, pixmap_bytes(image)
+
+        paths[spec] = candidate
+    return paths
+
+
+def compare(reference, image, tolerance):
+    """Channel differences of two images, compared as premultiplied ARGB32."""
+    from PySide6.QtGui import QImage
+    from PySide6.QtCore import Qt
+
+    fmt = QImage.Format.Format_ARGB32_Premultiplied
+    reference = reference.convertToFormat(fmt)
+    if image.size() != reference.size():
+        image = image.scaled(reference.size(), Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    image = image.convertToFormat(fmt)
+
+    width, height = reference.width(), reference.height()
+    worst = total = bad = 0
+    for y in range(height):
+        a = bytes(reference.constScanLine(y))[:width * 4]
+        b = bytes(image.constScanLine(y))[:width * 4]
+        for x in range(0, width * 4, 4):
+            diff = max(abs(a[x + i] - b[x + i]) for i in range(4))
+            total += diff
+            worst = max(worst, diff)
+            if diff > tolerance:
+                bad += 1
+    pixels = max(width * height, 1)
+    return {"max_diff": worst, "mean_diff": round(total / pixels, 3), "bad_ratio": round(bad / pixels, 5)}
+
+
+def pyside6_main(args, items, files, workdir, pyqt5_timings):
+    from PySide6.QtGui import QImage
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    paths = pyside6_paths(files, args.path)
+    results = []
+    for name, svg in items.items():
+        for size in SIZES:
+            for color in COLORS:
+                reference, ref_seconds = timed(lambda: paths["svg_to_pixmap"](name, svg, size, color), args.repeat)
+                ref_image, ref_bytes = reference
+                case = {"svg": name, "size": size, "color": color}
+                results.append(dict(case, path="svg_to_pixmap", seconds=ref_seconds, bytes=ref_bytes,
+                                    max_diff=0, mean_diff=0.0, bad_ratio=0.0, ok=True))
+
+                candidates = {}
+                for path_name, render in paths.items():
+                    if path_name == "svg_to_pixmap":
+                        continue
+                    (image, raster), seconds = timed(lambda: render(name, svg, size, color), args.repeat)
+                    candidates[path_name] = (image, seconds, raster)
+
+                png = f"pyqt5-{name}-{size}-{color[1:]}.png"
+                if png in pyqt5_timings:
+                    timing = pyqt5_timings[png]
+                    candidates["pyqt5.SvgRenderer.render"] = (
+                        QImage(os.path.join(workdir, png)), timing["seconds"], timing["bytes"])
+
+                for path_name, (image, seconds, raster) in candidates.items():
+                    diff = compare(ref_image, image, args.tolerance)
+                    ok = diff["bad_ratio"] <= args.max_bad
+                    results.append(dict(case, path=path_name, seconds=seconds, bytes=raster, ok=ok, **diff))
+                    if not ok and args.diff_dir:
+                        os.makedirs(args.diff_dir, exist_ok=True)
+                        stem = f"{name}-{size}-{color[1:]}"
+                        ref_image.save(os.path.join(args.diff_dir, f"{stem}-reference.png"))
+                        image.save(os.path.join(args.diff_dir, f"{stem}-{path_name.replace(':', '_')}.png"))
+    app.processEvents()
+    return results
+
+
+def summarize(results):
+    summary = {}
+    for result in results:
+        entry = summary.setdefault(result["path"], {"cases": 0, "failed": 0, "seconds": 0.0, "bytes": 0,
+                                                    "max_diff": 0})
+        entry["cases"] += 1
+        entry["failed"] += 0 if result["ok"] else 1
+        entry["seconds"] += result["seconds"]
+        entry["bytes"] = max(entry["bytes"], result["bytes"])
+        entry["max_diff"] = max(entry["max_diff"], result["max_diff"])
+    for entry in summary.values():
+        entry["mean_ms"] = round(entry.pop("seconds") * 1000 / entry["cases"], 4)
+        entry["peak_raster_bytes"] = entry.pop("bytes")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of .svg files (x.svg and built-in shapes by default)")
+    parser.add_argument("--path", action="append", default=[], metavar="MODULE:FUNCTION",
+                        help="candidate render path to compare")
+    parser.add_argument("--tolerance", type=int, default=24, help="allowed channel difference (0-255)")
+    parser.add_argument("--max-bad", type=float, default=0.05, help="allowed share of pixels over tolerance")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-pyqt5", action="store_true", help="skip the pyqt5_svg_widgets path")
+    parser.add_argument("--diff-dir", help="save reference and mismatching images here")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--pyqt5-worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--files", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.pyqt5_worker:
+        pyqt5_worker(args)
+        return
+
+    items = corpus(args.corpus)
+    with tempfile.TemporaryDirectory() as workdir:
+        files = write_corpus(items, workdir)
+        pyqt5_timings, pyqt5_error = {}, None
+        if not args.no_pyqt5:
+            command = [sys.executable, os.path.abspath(__file__), "--pyqt5-worker", "--repeat", str(args.repeat),
+                       "--files", json.dumps(files), "--workdir", workdir]
+            process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            if process.returncode == 0:
+                pyqt5_timings = json.loads(process.stdout)
+            else:
+                pyqt5_error = "\n".join(process.stderr.strip().splitlines()[-5:])
+
+        results = pyside6_main(args, items, files, workdir, pyqt5_timings)
+
+    report = {
+        "reference": "svg_to_pixmap",
+        "tolerance": args.tolerance,
+        "max_bad": args.max_bad,
+        "summary": summarize(results),
+        "results": results,
+    }
+    if pyqt5_error:
+        report["pyqt5_error"] = pyqt5_error
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+    sys.exit(0 if all(result["ok"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Headless benchmark suite for pyside6_svg_widgets and pyqt5_svg_widgets.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/run.py --output results.json
+
+Each binding runs in its own process (PySide6 and PyQt5 cannot share one
+QApplication). The JSON report holds one entry per binding with its
+environment and a list of results; every result has ``binding``, ``case``,
+``params``, ``items``, ``min_s``, ``median_s`` and ``per_item_us``. Pass
+``--compare old.json`` to print the cases that got slower.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BINDINGS = ("pyside6", "pyqt5")
+
+
+def run_worker(binding, args):
+    sys.path.insert(0, HERE)
+    from common import ROOT  # noqa: F401  (sets the offscreen platform and sys.path)
+    module = __import__(f"cases_{binding}")
+    report = module.run(args.count, args.repeat, args.depths)
+    json.dump(report, sys.stdout)
+
+
+def run_binding(binding, args):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    command = [
+        sys.executable, os.path.abspath(__file__), "--worker", binding,
+        "--count", str(args.count), "--repeat", str(args.repeat),
+        "--depths", *map(str, args.depths),
+    ]
+    process = subprocess.run(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if process.returncode != 0:
+        tail = process.stderr.strip().splitlines()[-5:]
+        return {"environment": {"binding": binding}, "error": "\n".join(tail), "results": []}
+    return json.loads(process.stdout)
+
+
+def key(result):
+    return result["binding"], result["case"], json.dumps(result["params"], sort_keys=True)
+
+
+def compare(report, baseline_path, threshold):
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = {key(r): r for run in json.load(file)["runs"] for r in run["results"]}
+
+    regressions = []
+    for run in report["runs"]:
+        for current in run["results"]:
+            before = baseline.get(key(current))
+            if before and current["per_item_us"] > before["per_item_us"] * (1 + threshold):
+                regressions.append((current, before))
+
+    for current, before in regressions:
+        print(f"slower: {current['binding']} {current['case']} {current['params']} "
+              f"{before['per_item_us']} -> {current['per_item_us']} us/item", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--binding", choices=BINDINGS + ("all",), default="all")
+    parser.add_argument("-n", "--count", type=int, default=200, help="widgets or renders per case")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 5, 10], help="parent depths for theme switches")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="report cases slower than this earlier report")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown for --compare")
+    parser.add_argument("--worker", choices=BINDINGS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args)
+        return
+
+    bindings = BINDINGS if args.binding == "all" else (args.binding,)
+    report = {"runs": [run_binding(binding, args) for binding in bindings]}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    failed = any("error" in run for run in report["runs"])
+    if args.compare and compare(report, args.compare, args.threshold):
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
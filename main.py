@@ -1,10 +1,13 @@
+import argparse
+import itertools
 import sys
+import time
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QHBoxLayout,
-    QPushButton, QColorDialog, QComboBox, QLabel
+    QPushButton, QColorDialog, QComboBox, QLabel, QGridLayout, QScrollArea
 )
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent
 from PyQt5.QtGui import QPalette, QColor
 from pyqt5_svg_widgets.QAbstract import SvgButton, SvgLabel, SvgRadioButton, SvgToolButton, ToggleSwitchGroup, \
     SwitchButton
@@ -369,9 +372,190 @@ class SvgWidgetsExample(QMainWindow):
             """)
 
 
+STRESS_CLASSES = {
+    "SvgButton": lambda i, parent: SvgButton(svg_path="x.svg", text=f"Кнопка {i}", parent=parent),
+    "SvgLabel": lambda i, parent: SvgLabel(svg_path="x.svg", text=f"Метка {i}", parent=parent),
+    "SvgRadioButton": lambda i, parent: SvgRadioButton(svg_path="x.svg", text=f"Опция {i}", parent=parent),
+    "SvgToolButton": lambda i, parent: SvgToolButton(svg_path="x.svg", text=f"Инструмент {i}", parent=parent),
+    "SwitchButton": lambda i, parent: SwitchButton(parent),
+    "ToggleSwitchGroup": lambda i, parent: ToggleSwitchGroup(["Off", "Yes", "Auto"], parent),
+}
+
+
+class FrameStats:
+    """Скользящее окно интервалов кадров, длительности отрисовки и задержки цикла событий"""
+
+    def __init__(self):
+        self.reset()
+        self.frames = 0
+
+    def reset(self):
+        self.intervals = []
+        self.paints = []
+        self.latencies = []
+
+    def summary(self):
+        def mean(values):
+            return sum(values) / len(values) * 1000 if values else 0.0
+
+        def peak(values):
+            return max(values) * 1000 if values else 0.0
+
+        interval = mean(self.intervals)
+        return {
+            "fps": 1000 / interval if interval else 0.0,
+            "frame_ms": mean(self.paints),
+            "frame_max_ms": peak(self.paints),
+            "latency_ms": mean(self.latencies),
+            "latency_max_ms": peak(self.latencies),
+        }
+
+
+class StressWindow(SvgWidgetsExample):
+    """Нагрузочный режим демо: много виджетов, вложенность, большие стили,
+    автоматические проходы курсора и смена тем с замером кадров"""
+
+    LATENCY_PROBE = 10
+
+    def __init__(self, count: int, depth: int, rules: int, hover_interval: int, hover_batch: int,
+                 theme_interval: int, columns: int):
+        # Дополнительные правила добавляются к каждой теме, чтобы увеличить таблицу стилей
+        self.extra_rules = "\n".join(
+            f"QWidget#stressRule{i} {{ color: #{i * 2654435761 % 0xffffff:06x}; padding: {i % 7}px; }}"
+            for i in range(rules)
+        )
+        super().__init__()
+        self.setWindowTitle("SVG Widgets Stress Test")
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        self.centralWidget().layout().addWidget(scroll, 1)
+
+        # Цепочка вложенных контейнеров, виджеты живут в самом глубоком
+        container = QWidget()
+        scroll.setWidget(container)
+        for _ in range(depth):
+            layout = QVBoxLayout(container)
+            layout.setContentsMargins(0, 0, 0, 0)
+            child = QWidget(container)
+            layout.addWidget(child)
+            container = child
+        grid = QGridLayout(container)
+
+        self.stress_widgets = []
+        for name, build in STRESS_CLASSES.items():
+            for i in range(count):
+                widget = build(i, container)
+                position = len(self.stress_widgets)
+                grid.addWidget(widget, position // columns, position % columns)
+                self.stress_widgets.append(widget)
+
+        self.stats = FrameStats()
+        self._last_frame = None
+        self._hovered = []
+        self._hover_batch = hover_batch
+        self._hover_position = 0
+        self._themes = itertools.cycle([self.applyDarkTheme, self.applyBlueTheme,
+                                        self.applyGreenTheme, self.applyLightTheme])
+
+        self.readout = QLabel()
+        self.statusBar().addPermanentWidget(self.readout, 1)
+
+        self._probe_time = time.perf_counter()
+        self.probe = QTimer(self)
+        self.probe.timeout.connect(self._probeLatency)
+        self.probe.start(self.LATENCY_PROBE)
+
+        self.readout_timer = QTimer(self)
+        self.readout_timer.timeout.connect(self._updateReadout)
+        self.readout_timer.start(500)
+
+        self.hover_timer = QTimer(self)
+        self.hover_timer.timeout.connect(self._hoverStep)
+        if hover_interval > 0:
+            self.hover_timer.start(hover_interval)
+
+        self.theme_timer = QTimer(self)
+        self.theme_timer.timeout.connect(lambda: next(self._themes)())
+        if theme_interval > 0:
+            self.theme_timer.start(theme_interval)
+
+    def setStyleSheet(self, style: str):
+        super().setStyleSheet(style + "\n" + getattr(self, "extra_rules", ""))
+
+    def event(self, event):
+        # Виджеты Qt5 рисуются через UpdateRequest окна верхнего уровня
+        if event.type() != QEvent.UpdateRequest:
+            return super().event(event)
+
+        started = time.perf_counter()
+        if self._last_frame is not None:
+            self.stats.intervals.append(started - self._last_frame)
+        self._last_frame = started
+        result = super().event(event)
+        self.stats.paints.append(time.perf_counter() - started)
+        self.stats.frames += 1
+        return result
+
+    def _probeLatency(self):
+        now = time.perf_counter()
+        self.stats.latencies.append(max(0.0, now - self._probe_time - self.LATENCY_PROBE / 1000))
+        self._probe_time = now
+
+    def _hoverStep(self):
+        """Курсор "проходит" по следующей группе виджетов: Leave для предыдущей, Enter для новой"""
+        for widget in self._hovered:
+            QApplication.sendEvent(widget, QEvent(QEvent.Leave))
+        start = self._hover_position
+        self._hovered = self.stress_widgets[start:start + self._hover_batch]
+        self._hover_position = (start + self._hover_batch) % max(len(self.stress_widgets), 1)
+        for widget in self._hovered:
+            QApplication.sendEvent(widget, QEvent(QEvent.Enter))
+
+    def _updateReadout(self):
+        summary = self.stats.summary()
+        self.readout.setText(
+            f"FPS {summary['fps']:.1f} | кадр {summary['frame_ms']:.1f} мс (макс {summary['frame_max_ms']:.1f}) | "
+            f"задержка {summary['latency_ms']:.1f} мс (макс {summary['latency_max_ms']:.1f}) | "
+            f"виджетов {len(self.stress_widgets)}"
+        )
+        self.last_summary = summary
+        self.stats.reset()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="SVG widgets demo")
+    parser.add_argument("--stress", action="store_true", help="нагрузочный режим")
+    parser.add_argument("--count", type=int, default=200, help="виджетов каждого класса")
+    parser.add_argument("--depth", type=int, default=5, help="глубина вложенности контейнеров")
+    parser.add_argument("--rules", type=int, default=0, help="дополнительных правил в таблице стилей")
+    parser.add_argument("--columns", type=int, default=12, help="колонок в сетке виджетов")
+    parser.add_argument("--hover-interval", type=int, default=16, help="мс между шагами курсора, 0 - выкл")
+    parser.add_argument("--hover-batch", type=int, default=10, help="виджетов за шаг курсора")
+    parser.add_argument("--theme-interval", type=int, default=2000, help="мс между сменами темы, 0 - выкл")
+    parser.add_argument("--duration", type=float, default=0, help="выйти через N секунд и напечатать итог")
+    parser.add_argument("--size", default="1920x1080", help="размер окна, например 2560x1440")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = SvgWidgetsExample()
+    args = parse_args(sys.argv[1:])
+    app = QApplication(sys.argv[:1])
+    if args.stress:
+        window = StressWindow(args.count, args.depth, args.rules, args.hover_interval, args.hover_batch,
+                              args.theme_interval, args.columns)
+        width, height = (int(v) for v in args.size.lower().split("x"))
+        window.resize(width, height)
+    else:
+        window = SvgWidgetsExample()
     window.setObjectName(u"mainWidget")
     window.show()
+
+    if args.stress and args.duration:
+        def finish():
+            window._updateReadout()
+            print(window.readout.text())
+            app.quit()
+
+        QTimer.singleShot(int(args.duration * 1000), finish)
     sys.exit(app.exec())
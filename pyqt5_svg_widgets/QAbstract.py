@@ -1,122 +1,149 @@
-from functools import lru_cache
-from functools import lru_cache
+import math
 from typing import Optional, Union, Dict
 
-from PyQt5.QtCore import Qt, QSize, QEvent, pyqtProperty, QRect, pyqtSignal, QPropertyAnimation, QRectF
-from PyQt5.QtGui import QPixmap, QPainter, QIcon, QColor, QPalette, QImage, QFont, QBrush, QPen
+from PyQt5.QtCore import (
+    Qt, QSize, QEvent, pyqtProperty, QRect, pyqtSignal, QPropertyAnimation, QRectF, QPointF,
+    QObject, QTimer, QElapsedTimer
+)
+from PyQt5.QtGui import (
+    QPixmap, QPainter, QIcon, QColor, QPalette, QFont, QBrush, QPen, QStaticText, QFontMetricsF
+)
 from PyQt5.QtSvg import QSvgRenderer
 from PyQt5.QtWidgets import (
-    QPushButton, QWidget, QLabel, QStyle, QStyleOption,
+    QApplication, QPushButton, QWidget, QLabel, QStyle, QStyleOption,
     QRadioButton, QToolButton, QStyleOptionButton, QSizePolicy, QFrame, QStyleOptionFrame, QStyleOptionToolButton, QHBoxLayout, QAbstractButton
 )
 
+from svg_widgets_core import instrument
+from svg_widgets_core.cache import PixmapCache, set_budget, budget
+from svg_widgets_core.render import rasterize
+from svg_widgets_core.style import get_effective_style, parse_style_sheet
+
 # Константы
 DEFAULT_SIZE = 25
 SCALE_FACTOR = 10
 
 class StyleManager:
-    """Менеджер стилей для обработки и кэширования стилей виджетов"""
-    
-    @staticmethod
-    @lru_cache(maxsize=128)
-    def parse_style_sheet(style_sheet: str) -> Dict[str, Dict[str, str]]:
-        """Парсит таблицу стилей и возвращает словарь с правилами"""
-        if not style_sheet:
-            return {}
-            
-        result = {}
-        blocks = style_sheet.split('}')
-        
-        for block in blocks:
-            if not block.strip():
-                continue
+    """Менеджер стилей для обработки и кэширования стилей виджетов
 
-            selector, rules = block.split('{', 1)
-            selector = selector.strip()
-            rules = rules.strip()
-            
-            if selector not in result:
-                result[selector] = {}
-                
-            for rule in rules.split(';'):
-                if ':' in rule:
-                    prop, value = rule.split(':', 1)
-                    result[selector][prop.strip()] = value.strip()
-                    
-        return result
+    Тонкая обертка над svg_widgets_core.style для прежнего кода. Сами SVG виджеты
+    берут цвет иконки через IconStyleMixin
+    """
+
+    # Разбор и кэш таблиц стилей общие с pyside6_svg_widgets
+    parse_style_sheet = staticmethod(parse_style_sheet)
 
     @staticmethod
     def get_effective_style(widget: QWidget, state: str = '') -> Dict[str, str]:
         """Получает эффективные стили для виджета с учетом родительских стилей"""
         styles = {}
+        widget_name = type(widget).__name__
         current = widget
-        
-        while current:
-            if not current.styleSheet():
-                current = current.parentWidget()
-            continue
 
-            parsed = StyleManager.parse_style_sheet(current.styleSheet())
-            widget_name = type(widget).__name__
-            
-            # Проверяем специфичные состояния
-            if state:
-                state_selector = f"{widget_name}:{state}"
-                if state_selector in parsed:
-                    styles.update(parsed[state_selector])
-                    
-            # Базовые стили
-            if widget_name in parsed:
-                styles.update(parsed[widget_name])
-                
+        # Ближайший к виджету стиль важнее, поэтому родители применяются первыми
+        chain = []
+        while current:
+            if current.styleSheet():
+                chain.append(parse_style_sheet(current.styleSheet()))
             current = current.parentWidget()
-            
+
+        # Базовые стили, затем специфичные состояния поверх них
+        selectors = [widget_name] + ([f"{widget_name}:{state}"] if state else [])
+        for selector in selectors:
+            for parsed in reversed(chain):
+                if selector in parsed:
+                    styles.update(parsed[selector])
+
         return styles
 
+    @staticmethod
+    def icon_color(widget: QWidget, hover=False, pressed=False, checked=False) -> Optional[str]:
+        """Цвет icon-color для состояния, как его видят SVG виджеты обеих привязок"""
+        return get_effective_style(widget, hover=hover, pressed=pressed, checked=checked)[0]
+
+class IconStyleMixin:
+    """Цвет иконки по состоянию из QCSS-правил icon-color, как в pyside6_svg_widgets.
+
+    Правила ищутся общим движком svg_widgets_core.style (SvgButton, SvgButton:hover,
+    :pressed, :checked у виджета или его родителей). Без подходящего правила берется
+    цвет палитры, как раньше. Результат запоминается до StyleChange/PaletteChange
+    """
+    _state_colors = None
+
+    def _styleColor(self, role: QPalette.ColorRole, hover=False, pressed=False, checked=False) -> QColor:
+        if self._state_colors is None:
+            self._state_colors = {}
+        key = (role, hover, pressed, checked)
+        color = self._state_colors.get(key)
+        if color is None:
+            name, _ = get_effective_style(self, hover=hover, pressed=pressed, checked=checked)
+            color = self._state_colors[key] = QColor(name) if name else self.palette().color(role)
+        return color
+
+    def event(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.PaletteChange):
+            self._state_colors = None
+        return super().event(event)
+
 class SvgRenderer:
     """Класс для рендеринга SVG с кэшированием"""
+    # Растры общие для всех рендереров одного файла: виджеты с одной иконкой на одном
+    # экране получают один и тот же pixmap. Кэш подчиняется общему бюджету svg_widgets_core.cache
+    _cache = PixmapCache("SvgRenderer", maxsize=None, icon=lambda key: key[0])
+
     def __init__(self, svg_path: str):
         self._renderer = QSvgRenderer(svg_path)
-        self._cache = {}
-        
-    def render(self, size: QSize, color: QColor) -> QPixmap:
-        """Рендерит SVG с заданным размером и цветом"""
-        key = (size.width(), size.height(), color.name())
-        if key in self._cache:
-            return self._cache[key]
-            
-        image = QImage(size, QImage.Format_ARGB32)
-        image.fill(Qt.transparent)
-        
-        painter = QPainter(image)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        
-        # Рендерим SVG
-        self._renderer.render(painter)
-        painter.end()
-        
-        # Применяем цвет
-        if color != Qt.black:
-            image = self._apply_color(image, color)
-            
-        pixmap = QPixmap.fromImage(image)
-        self._cache[key] = pixmap
-        return pixmap
-        
-    def _apply_color(self, image: QImage, color: QColor) -> QImage:
-        """Применяет цвет к изображению"""
-        for x in range(image.width()):
-            for y in range(image.height()):
-                pixel = image.pixelColor(x, y)
-                if pixel.alpha() > 0:
-                    pixel.setRed(color.red())
-                    pixel.setGreen(color.green())
-                    pixel.setBlue(color.blue())
-                    image.setPixelColor(x, y, pixel)
-        return image
-
-class SvgWidget(QWidget):
+        self._svg_path = svg_path
+
+    @classmethod
+    def setBudget(cls, limit: Optional[int]):
+        """Ограничивает суммарный объём кэшей всех рендереров (общий бюджет обеих привязок)"""
+        set_budget(limit)
+
+    @classmethod
+    def totalBytes(cls) -> int:
+        return cls._cache.bytes
+
+    def cacheBytes(self) -> int:
+        """Байты растров этой иконки во всех размерах, цветах и масштабах экрана"""
+        return SvgRenderer._cache.per_icon().get(instrument.icon_name(self._svg_path), 0)
+
+    @classmethod
+    def memoryReport(cls) -> dict:
+        """Байты кэшей по иконкам и по классам виджетов"""
+        icons = cls._cache.per_icon()
+
+        # Общие растры учитываются у каждого виджета, который на них ссылается
+        classes = {}
+        app = QApplication.instance()
+        for widget in app.allWidgets() if app else []:
+            renderer = getattr(widget, "_renderer", None)
+            if isinstance(renderer, SvgRenderer):
+                entry = classes.setdefault(type(widget).__name__, {"widgets": 0, "bytes": 0})
+                entry["widgets"] += 1
+                entry["bytes"] += icons.get(instrument.icon_name(renderer._svg_path), 0)
+
+        return {"budget": budget(), "bytes": cls._cache.bytes, "per_icon": icons, "widget_classes": classes}
+
+    def render(self, size: QSize, color: QColor, dpr: float = 1.0) -> QPixmap:
+        """Рендерит SVG с заданным размером и цветом
+
+        ``dpr`` - devicePixelRatioF() экрана виджета: растр получается
+        size * dpr физических пикселей и рисуется в логическом размере size.
+        """
+        key = (self._svg_path, size.width(), size.height(), color.name(), dpr)
+        pixmap = SvgRenderer._cache.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        # Общий путь растеризации с pyside6_svg_widgets; черный цвет оставляет собственные цвета SVG
+        pixmap = QPixmap(math.ceil(size.width() * dpr), math.ceil(size.height() * dpr))
+        pixmap.fill(Qt.transparent)
+        rasterize(self._renderer, pixmap, QPainter, None if color == Qt.black else color, self._svg_path)
+        pixmap.setDevicePixelRatio(dpr)
+        return SvgRenderer._cache.put(key, pixmap)
+
+class SvgWidget(IconStyleMixin, QWidget):
     """Базовый класс для SVG виджетов"""
     def __init__(self, svg_path: str, parent=None):
         super().__init__(parent)
@@ -162,10 +189,10 @@ class SvgWidget(QWidget):
     def _getColor(self) -> QColor:
         """Получает текущий цвет с учетом состояния"""
         if self._is_pressed:
-            return self.palette().color(QPalette.ButtonText)
+            return self._styleColor(QPalette.ButtonText, pressed=True)
         elif self._is_hovered:
-            return self.palette().color(QPalette.Highlight)
-        return self.palette().color(QPalette.WindowText)
+            return self._styleColor(QPalette.Highlight, hover=True)
+        return self._styleColor(QPalette.WindowText)
         
     def paintEvent(self, event):
         """Отрисовка виджета"""
@@ -180,7 +207,7 @@ class SvgWidget(QWidget):
         self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
         
         # Рисуем SVG
-        pixmap = self._renderer.render(self._size, self._getColor())
+        pixmap = self._renderer.render(self._size, self._getColor(), self.devicePixelRatioF())
         painter.drawPixmap(0, 0, pixmap)
         
         # Рисуем текст
@@ -217,7 +244,7 @@ class SvgWidget(QWidget):
             self.update()
         return super().event(event)
 
-class SvgButton(QPushButton):
+class SvgButton(IconStyleMixin, QPushButton):
     """Кнопка с SVG иконкой"""
     def __init__(self, svg_path: str, text: str = "", parent=None):
         super().__init__(text, parent)
@@ -288,10 +315,10 @@ class SvgButton(QPushButton):
     def _getColor(self) -> QColor:
         """Получает текущий цвет с учетом состояния"""
         if self._is_pressed:
-            return self.palette().color(QPalette.ButtonText)
+            return self._styleColor(QPalette.ButtonText, pressed=True)
         elif self._is_hovered:
-            return self.palette().color(QPalette.Highlight)
-        return self.palette().color(QPalette.WindowText)
+            return self._styleColor(QPalette.Highlight, hover=True)
+        return self._styleColor(QPalette.WindowText)
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -319,7 +346,7 @@ class SvgButton(QPushButton):
         padding = self.style().pixelMetric(QStyle.PM_DefaultFrameWidth, opt, self)
         
         # Рисуем SVG
-        pixmap = self._renderer.render(self._icon_size, self._getColor())
+        pixmap = self._renderer.render(self._icon_size, self._getColor(), self.devicePixelRatioF())
         icon_rect = QRect(margins + padding, 
                          (self.height() - self._icon_size.height()) // 2,
                          self._icon_size.width(), 
@@ -334,7 +361,7 @@ class SvgButton(QPushButton):
             painter.setPen(self._getColor())
             painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, self.text())
 
-class SvgLabel(QLabel):
+class SvgLabel(IconStyleMixin, QLabel):
     """Метка с SVG иконкой"""
     def __init__(self, svg_path: str, text: str = "", parent=None):
         super().__init__(text, parent)
@@ -382,8 +409,8 @@ class SvgLabel(QLabel):
         
     def _getColor(self) -> QColor:
         if self._is_hovered:
-            return self.palette().color(QPalette.Highlight)
-        return self.palette().color(QPalette.WindowText)
+            return self._styleColor(QPalette.Highlight, hover=True)
+        return self._styleColor(QPalette.WindowText)
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -403,7 +430,7 @@ class SvgLabel(QLabel):
         margins = self.style().pixelMetric(QStyle.PM_DefaultFrameWidth, opt, self)
         
         # Рисуем SVG
-        pixmap = self._renderer.render(self._icon_size, self._getColor())
+        pixmap = self._renderer.render(self._icon_size, self._getColor(), self.devicePixelRatioF())
         icon_rect = QRect(margins, 
                          (self.height() - self._icon_size.height()) // 2,
                          self._icon_size.width(), 
@@ -418,7 +445,7 @@ class SvgLabel(QLabel):
             painter.setPen(self._getColor())
             painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, self.text())
 
-class SvgRadioButton(QRadioButton):
+class SvgRadioButton(IconStyleMixin, QRadioButton):
     """Радио-кнопка с SVG иконкой"""
     def __init__(self, svg_path: str, text: str = "", parent=None):
         super().__init__(text, parent)
@@ -469,9 +496,10 @@ class SvgRadioButton(QRadioButton):
         super().leaveEvent(event)
         
     def _getColor(self) -> QColor:
+        checked = self.isChecked()
         if self._is_hovered:
-            return self.palette().color(QPalette.Highlight)
-        return self.palette().color(QPalette.WindowText)
+            return self._styleColor(QPalette.Highlight, hover=True, checked=checked)
+        return self._styleColor(QPalette.WindowText, checked=checked)
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -493,7 +521,7 @@ class SvgRadioButton(QRadioButton):
         self.style().drawPrimitive(QStyle.PE_IndicatorRadioButton, opt, painter, self)
         
         # Рисуем SVG
-        pixmap = self._renderer.render(self._icon_size, self._getColor())
+        pixmap = self._renderer.render(self._icon_size, self._getColor(), self.devicePixelRatioF())
         icon_rect = QRect(indicator_rect.right() + 5,
                          (self.height() - self._icon_size.height()) // 2,
                          self._icon_size.width(),
@@ -508,7 +536,52 @@ class SvgRadioButton(QRadioButton):
             painter.setPen(self._getColor())
             painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, self.text())
 
-class SvgToolButton(QToolButton):
+class SvgRadioGroup(QObject):
+    """Эксклюзивная группа SvgRadioButton.
+
+    В отличие от autoExclusive не перебирает всех соседей: при смене
+    перерисовываются только предыдущая и новая выбранные кнопки.
+    """
+    changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buttons = []
+        self._index = {}
+        self._checked = None
+
+    def addButton(self, button: 'SvgRadioButton'):
+        button.setAutoExclusive(False)
+        self._index[button] = len(self.buttons)
+        self.buttons.append(button)
+        button.clicked.connect(lambda checked=False, b=button: self._on_clicked(b))
+        if button.isChecked():
+            self.setChecked(button)
+
+    def checkedButton(self):
+        return self._checked
+
+    def checkedIndex(self) -> int:
+        return self._index.get(self._checked, -1)
+
+    def setChecked(self, button):
+        if isinstance(button, int):
+            button = self.buttons[button]
+        previous, self._checked = self._checked, button
+        if previous is not None and previous is not button:
+            previous.setChecked(False)
+        button.setChecked(True)
+        if previous is not button:
+            self.changed.emit(self._index[button])
+
+    def _on_clicked(self, button):
+        if button is self._checked:
+            # Повторный клик не снимает выбор
+            button.setChecked(True)
+            return
+        self.setChecked(button)
+
+class SvgToolButton(IconStyleMixin, QToolButton):
     """Инструментальная кнопка с SVG иконкой"""
     def __init__(self, svg_path: str, text: str = "", parent=None):
         super().__init__(parent)
@@ -572,10 +645,10 @@ class SvgToolButton(QToolButton):
         
     def _getColor(self) -> QColor:
         if self._is_pressed:
-            return self.palette().color(QPalette.ButtonText)
+            return self._styleColor(QPalette.ButtonText, pressed=True)
         elif self._is_hovered:
-            return self.palette().color(QPalette.Highlight)
-        return self.palette().color(QPalette.WindowText)
+            return self._styleColor(QPalette.Highlight, hover=True)
+        return self._styleColor(QPalette.WindowText)
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -601,7 +674,7 @@ class SvgToolButton(QToolButton):
         padding = self.style().pixelMetric(QStyle.PM_DefaultFrameWidth, opt, self)
         
         # Рисуем SVG
-        pixmap = self._renderer.render(self._icon_size, self._getColor())
+        pixmap = self._renderer.render(self._icon_size, self._getColor(), self.devicePixelRatioF())
         icon_rect = QRect(margins + padding,
                          (self.height() - self._icon_size.height()) // 2,
                          self._icon_size.width(),
@@ -682,33 +755,263 @@ class ToggleSwitchGroup(QWidget):
     def currentText(self):
         return self._buttons[self._current].text()
 
+class SegmentedToggleGroup(QWidget):
+    """Группа переключателей, нарисованная одним виджетом.
+
+    Заменяет ToggleSwitchGroup без дочерних кнопок и setStyleSheet:
+    переключение перерисовывает только затронутые сегменты.
+    """
+    toggled = pyqtSignal(int, str)  # индекс, текст
+
+    SPACING = 12
+    PADDING = 24
+    RADIUS = 18
+    CHECKED_BG = QColor('#22c55e')
+    CHECKED_FG = QColor('#fff')
+    UNCHECKED_BG = QColor('#e5e7eb')
+    UNCHECKED_FG = QColor('#444')
+
+    def __init__(self, options, parent=None):
+        super().__init__(parent)
+        self._options = list(options)
+        self._current = 0
+        self._position = 0.0
+        self._rects = []
+        self._pressed = -1
+        self._duration = 180
+        self._animation = QPropertyAnimation(self, b"position", self)
+        self._font_bold = QFont(self.font())
+        self._font_bold.setBold(True)
+        # Раскладка текста кэшируется отдельно для обычного и жирного шрифта
+        self._texts = [QStaticText(text) for text in self._options]
+        self._texts_bold = [QStaticText(text) for text in self._options]
+        for text in self._texts + self._texts_bold:
+            text.setPerformanceHint(QStaticText.AggressiveCaching)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setMinimumHeight(36)
+
+    def setAnimationDuration(self, duration: int):
+        """Длительность перемещения индикатора в мс, 0 - без анимации"""
+        self._duration = duration
+
+    def setChecked(self, idx, animate=False):
+        if not 0 <= idx < len(self._options):
+            return
+        self._animation.stop()
+        if animate and self._duration > 0 and idx != self._current:
+            self._animation.setStartValue(self._position)
+            self._animation.setEndValue(float(idx))
+            self._animation.setDuration(self._duration)
+            self._animation.start()
+        else:
+            self._set_position(float(idx))
+        self._current = idx
+        self.toggled.emit(idx, self._options[idx])
+
+    def currentIndex(self):
+        return self._current
+
+    def currentText(self):
+        return self._options[self._current]
+
+    def _get_position(self):
+        return self._position
+
+    def _set_position(self, value):
+        # Перерисовываем только старое и новое положение индикатора
+        old = self._indicator_rect()
+        self._position = value
+        new = self._indicator_rect()
+        self.update(old.united(new).toAlignedRect().adjusted(-1, -1, 1, 1))
+
+    position = pyqtProperty(float, _get_position, _set_position)
+
+    def sizeHint(self) -> QSize:
+        fm = QFontMetricsF(self._font_bold)
+        width = sum(fm.horizontalAdvance(text) + self.PADDING * 2 for text in self._options)
+        width += self.SPACING * max(0, len(self._options) - 1)
+        return QSize(int(width), 36)
+
+    def resizeEvent(self, event):
+        self._rects = []
+        super().resizeEvent(event)
+
+    def _segment_rects(self):
+        """Геометрия сегментов, пересчитывается только при изменении размера"""
+        if not self._rects and self._options:
+            count = len(self._options)
+            width = (self.width() - self.SPACING * (count - 1)) / count
+            self._rects = [
+                QRectF(i * (width + self.SPACING), 0, width, self.height())
+                for i in range(count)
+            ]
+        return self._rects
+
+    def _indicator_rect(self) -> QRectF:
+        rects = self._segment_rects()
+        if not rects:
+            return QRectF()
+        left = min(int(self._position), len(rects) - 1)
+        right = min(left + 1, len(rects) - 1)
+        t = self._position - left
+        a, b = rects[left], rects[right]
+        return QRectF(a.x() + (b.x() - a.x()) * t, a.y(), a.width() + (b.width() - a.width()) * t, a.height())
+
+    def indexAt(self, pos) -> int:
+        for i, rect in enumerate(self._segment_rects()):
+            if rect.contains(QPointF(pos)):
+                return i
+        return -1
+
+    def mousePressEvent(self, event):
+        self._pressed = self.indexAt(event.pos())
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        idx = self.indexAt(event.pos())
+        if idx >= 0 and idx == self._pressed:
+            self.setChecked(idx, animate=True)
+        self._pressed = -1
+        super().mouseReleaseEvent(event)
+
+    def _draw_texts(self, painter, texts, color, font):
+        painter.setPen(color)
+        painter.setFont(font)
+        for rect, text in zip(self._segment_rects(), texts):
+            size = text.size()
+            painter.drawStaticText(
+                QPointF(rect.center().x() - size.width() / 2, rect.center().y() - size.height() / 2), text
+            )
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setPen(Qt.NoPen)
+
+        # Фон сегментов
+        painter.setBrush(self.UNCHECKED_BG)
+        for rect in self._segment_rects():
+            if rect.intersects(QRectF(event.rect())):
+                painter.drawRoundedRect(rect, self.RADIUS, self.RADIUS)
+        self._draw_texts(painter, self._texts, self.UNCHECKED_FG, self.font())
+
+        # Индикатор выбранного сегмента и текст поверх него
+        indicator = self._indicator_rect()
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.CHECKED_BG)
+        painter.drawRoundedRect(indicator, self.RADIUS, self.RADIUS)
+        painter.setClipRect(indicator)
+        self._draw_texts(painter, self._texts_bold, self.CHECKED_FG, self._font_bold)
+
+class AnimationCoordinator(QObject):
+    """Общий таймер для анимаций переключателей.
+
+    Анимации, запущенные в одном тике, стартуют с одного времени и
+    обновляются одним проходом, перерисовка объединяется Qt в один кадр.
+    """
+    _instance = None
+    FRAME_INTERVAL = 16
+
+    @classmethod
+    def instance(cls) -> "AnimationCoordinator":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.FRAME_INTERVAL)
+        self._timer.timeout.connect(self._tick)
+        self._pending = {}
+        self._active = {}
+        self.skip_hidden = False
+        self.max_animated = None
+
+    def setSkipHidden(self, skip: bool):
+        """Не анимировать невидимые виджеты, сразу ставить конечное значение (по умолчанию выключено)"""
+        self.skip_hidden = skip
+
+    def setMaxAnimated(self, count: Optional[int]):
+        """Если за один тик переключается больше count виджетов, анимация пропускается
+
+        None - без ограничения (по умолчанию)
+        """
+        self.max_animated = count
+
+    def animate(self, target, setter, start: float, end: float, duration: int):
+        self._active.pop(id(target), None)
+        if duration <= 0 or (self.skip_hidden and not target.isVisible()):
+            setter(end)
+            return
+        self._pending[id(target)] = (target, setter, start, end, duration)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self, target):
+        self._pending.pop(id(target), None)
+        self._active.pop(id(target), None)
+
+    def _tick(self):
+        now = self._clock.elapsed()
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            if self.max_animated is not None and len(pending) + len(self._active) > self.max_animated:
+                # Массовое переключение - сразу конечное состояние
+                for target, setter, start, end, duration in pending.values():
+                    self._apply(setter, end)
+            else:
+                for key, (target, setter, start, end, duration) in pending.items():
+                    self._active[key] = (target, setter, start, end, duration, now)
+
+        for key, (target, setter, start, end, duration, started) in list(self._active.items()):
+            progress = min(1.0, (now - started) / duration)
+            if not self._apply(setter, start + (end - start) * progress) or progress >= 1.0:
+                del self._active[key]
+
+        if not self._active and not self._pending:
+            self._timer.stop()
+
+    @staticmethod
+    def _apply(setter, value) -> bool:
+        try:
+            setter(value)
+        except RuntimeError:
+            # Виджет уже удален
+            return False
+        return True
+
+
 class SwitchButton(QAbstractButton):
+    # Слои (дорожка, кружок, иконки) общие для всех переключателей
+    # с одинаковыми размером, цветами и devicePixelRatio
+    _layers = {}
+    _layers_limit = 64
+    _margin = 4
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._offset = 1.0 if self.isChecked() else 0.0
         self.setCheckable(True)
         self.setMinimumSize(64, 36)
-        self._animation = QPropertyAnimation(self, b"offset", self)
         self._icon_size = 20
         self._duration = 180
+        self._colors = None
         self.setCursor(Qt.PointingHandCursor)
         self.setProperty('checked', self.isChecked())
         self.toggled.connect(self._on_toggled)
 
     def _on_toggled(self, checked):
+        # Цвета берутся из кэша, полный unpolish/polish не нужен
         self.setProperty('checked', checked)
-        self.style().unpolish(self)
-        self.style().polish(self)
         self._start_anim(checked)
 
     def _start_anim(self, checked):
-        self._animation.stop()
-        start = self._offset
         end = 1.0 if checked else 0.0
-        self._animation.setStartValue(start)
-        self._animation.setEndValue(end)
-        self._animation.setDuration(self._duration)
-        self._animation.start()
+        AnimationCoordinator.instance().animate(self, self._set_offset, self._offset, end, self._duration)
 
     def _get_offset(self):
         return getattr(self, "_offset", 0.0)
@@ -722,47 +1025,95 @@ class SwitchButton(QAbstractButton):
     def sizeHint(self):
         return QSize(64, 36)
 
+    def event(self, event):
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._colors = None
+        elif event.type() == QEvent.DynamicPropertyChange and event.propertyName() != b'checked':
+            self._colors = None
+        return super().event(event)
+
+    def _get_colors(self):
+        """Цвета обоих состояний, сбрасываются при смене палитры, стиля или свойств"""
+        if self._colors is None:
+            self._colors = {
+                'background_on': self._getStyleColor('background_on', '#16e085'),
+                'background_off': self._getStyleColor('background_off', '#39394a'),
+                'thumb': self._getStyleColor('thumb', '#e5e7eb'),
+                'check': self._getStyleColor('check', '#fff'),
+                'cross': self._getStyleColor('cross', '#fff'),
+            }
+        return self._colors
+
+    def _layer(self, name, size, color, draw):
+        """Возвращает закэшированный слой или рисует его один раз"""
+        dpr = self.devicePixelRatioF()
+        key = (name, size.width(), size.height(), color.rgba(), dpr)
+        pixmap = SwitchButton._layers.get(key)
+        if pixmap is None:
+            if len(SwitchButton._layers) >= SwitchButton._layers_limit:
+                SwitchButton._layers.clear()
+            pixmap = QPixmap(size * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            draw(painter, QRectF(0, 0, size.width(), size.height()), color)
+            painter.end()
+            SwitchButton._layers[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _draw_track(painter, rect, color):
+        radius = rect.height() / 2
+        painter.setBrush(QBrush(color))
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(rect, radius, radius)
+
+    @staticmethod
+    def _draw_thumb(painter, rect, color):
+        painter.setBrush(QBrush(color))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(rect)
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         w, h = self.width(), self.height()
-        margin = 4
-        radius = h / 2
-        # Получаем цвета из стиля
-        bg_color = self._getStyleColor('background', '#16e085' if self.isChecked() else '#39394a')
-        thumb_color = self._getStyleColor('thumb', '#e5e7eb')
-        check_color = self._getStyleColor('check', '#fff')
-        cross_color = self._getStyleColor('cross', '#fff')
+        margin = self._margin
+        colors = self._get_colors()
+        bg_color = colors['background_on'] if self.isChecked() else colors['background_off']
         # Фон
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(QRectF(0, 0, w, h), radius, radius)
+        painter.drawPixmap(0, 0, self._layer('track', QSize(w, h), bg_color, self._draw_track))
         # Кружок
         x = margin + (w - 2 * margin - h + 2 * margin) * self._offset
-        thumb_rect = QRectF(x, margin, h - 2 * margin, h - 2 * margin)
-        painter.setBrush(QBrush(thumb_color))
-        painter.drawEllipse(thumb_rect)
-        # Иконки внутри кружка
-        icon_rect = thumb_rect.adjusted(4, 4, -4, -4)
+        thumb_size = QSize(h - 2 * margin, h - 2 * margin)
+        position = QPointF(x, margin)
+        painter.drawPixmap(position, self._layer('thumb', thumb_size, colors['thumb'], self._draw_thumb))
         # Крестик (затухает вправо)
-        painter.save()
-        painter.setOpacity(1.0 - self._offset)
-        self._draw_cross(painter, icon_rect, cross_color)
-        painter.restore()
+        if self._offset < 1.0:
+            painter.setOpacity(1.0 - self._offset)
+            painter.drawPixmap(position, self._layer(
+                'cross', thumb_size, colors['cross'], lambda p, r, c: self._draw_cross(p, r.adjusted(4, 4, -4, -4), c)
+            ))
         # Галочка (появляется справа)
-        painter.save()
-        painter.setOpacity(self._offset)
-        self._draw_check(painter, icon_rect, check_color)
-        painter.restore()
+        if self._offset > 0.0:
+            painter.setOpacity(self._offset)
+            painter.drawPixmap(position, self._layer(
+                'check', thumb_size, colors['check'], lambda p, r, c: self._draw_check(p, r.adjusted(4, 4, -4, -4), c)
+            ))
 
     def _getStyleColor(self, role, default):
-        # role: 'background', 'thumb', 'check', 'cross'
+        # role: 'background', 'background_on', 'background_off', 'thumb', 'check', 'cross'
         # Чтение из palette или property
         if role == 'background':
-            if self.property('checked'):
-                return self.palette().color(QPalette.Highlight)
-            else:
-                return self.palette().color(QPalette.Mid)
+            role = 'background_on' if self.property('checked') else 'background_off'
+        if role == 'background_on':
+            if self.property('checkedBackground'):
+                return QColor(self.property('checkedBackground'))
+            return self.palette().color(QPalette.Highlight)
+        elif role == 'background_off':
+            if self.property('uncheckedBackground'):
+                return QColor(self.property('uncheckedBackground'))
+            return self.palette().color(QPalette.Mid)
         elif role == 'thumb':
             return self.palette().color(QPalette.Base)
         elif role == 'check':
@@ -778,8 +1129,8 @@ class SwitchButton(QAbstractButton):
         x1, y1 = rect.left() + rect.width() * 0.15, rect.top() + rect.height() * 0.55
         x2, y2 = rect.left() + rect.width() * 0.45, rect.bottom() - rect.height() * 0.2
         x3, y3 = rect.right() - rect.width() * 0.15, rect.top() + rect.height() * 0.25
-        painter.drawLine(x1, y1, x2, y2)
-        painter.drawLine(x2, y2, x3, y3)
+        painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.drawLine(QPointF(x2, y2), QPointF(x3, y3))
 
     def _draw_cross(self, painter, rect, color):
         pen = QPen(color, 3, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
@@ -789,6 +1140,6 @@ class SwitchButton(QAbstractButton):
         x2, y2 = rect.right() - rect.width() * 0.25, rect.bottom() - rect.height() * 0.25
         x3, y3 = rect.right() - rect.width() * 0.25, rect.top() + rect.height() * 0.25
         x4, y4 = rect.left() + rect.width() * 0.25, rect.bottom() - rect.height() * 0.25
-        painter.drawLine(x1, y1, x2, y2)
-        painter.drawLine(x3, y3, x4, y4)
+        painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.drawLine(QPointF(x3, y3), QPointF(x4, y4))
 
@@ -1,96 +1,61 @@
+import math
 import os
-import re
 from functools import partial
 from typing import Optional, Union, Tuple
 import xml.etree.ElementTree as Et
 
-from functools import lru_cache
-
 from PySide6.QtWidgets import (
     QPushButton, QWidget,
     QLabel, QHBoxLayout, QStyle, QStyleOption,
-    QSizePolicy, QSpacerItem, QRadioButton, QToolButton
+    QSizePolicy, QSpacerItem, QRadioButton, QToolButton, QFrame
 )
-from PySide6.QtGui import QPixmap, QPainter, QIcon, QColor
+from PySide6.QtGui import QPixmap, QPainter, QIcon, QColor, QStaticText
 from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import Qt, QTimer, QSize, Signal, QByteArray
+from PySide6.QtCore import Qt, QTimer, QSize, Signal, QByteArray, QPointF, QEvent
 from PySide6.QtSvgWidgets import QSvgWidget
 
-SIZE = 55
-
-
-@lru_cache()
-def get_color(object_name, style_sheet, hover=False, pressed=False, checked=False, style_filter="icon-color"):
-    style_blocks = style_sheet.split('}')
-    for block in style_blocks:
-
-        if not object_name:
-            continue
+from svg_widgets_core import instrument
+from svg_widgets_core.cache import PixmapCache, pixmap_cache
+from svg_widgets_core.render import rasterize
+from svg_widgets_core.style import get_color, get_effective_style  # noqa: F401  (re-exported)
 
-        _filter = any(
-            [
-                (f'{object_name}:hover') in block.strip(),
-                (f'{object_name}:pressed' in block.strip()),
-                (f'{object_name}:checked' in block.strip()),
-            ]
-        )
-        if not any([hover, pressed, checked]) and object_name in block.strip() and not _filter:
-            style_rules = block.split('{')[-1].strip()
-
-        elif hover and f'{object_name}:hover' in block.strip():
-            style_rules = block.split('{')[-1].strip()
-
-        elif checked and f'{object_name}:checked' in block.strip():
-            style_rules = block.split('{')[-1].strip()
+from .transition import HoverTransition, paint_button_transition
+from .loader import SvgLoader
+from .scheduler import IconUpdateScheduler
+from .release import RasterReleasePolicy, RasterReleaseMixin
 
-        elif pressed and f'{object_name}:pressed' in block.strip():
-            style_rules = block.split('{')[-1].strip()
-
-        else:
-            continue
-
-        clear = lambda e: str(e).replace("/*", "").replace("*/", "")
-        style_string = "\n".join(
-            [clear(i).strip() for i in style_rules.split("\n") if clear(i).strip().startswith(style_filter)])
-
-        if style_string:
-            pattern = style_filter + r":\s*([^;]+);"
-            matches = re.findall(pattern, style_string)
-            _match = matches[0] if matches else None
-            return _match, style_sheet
-
-    return None, None
-
-
-def get_effective_style(init_widget: QWidget, hover=False, pressed=False, checked=False, style_filter="icon-color"):
-    """Get the effective style of a widget, considering parent styles."""
-
-    object_name = type(init_widget).__name__
-    current_widget = init_widget
-    while current_widget:
-        try:
-            current_widget
+SIZE = 55
 
-            style_sheet = current_widget.styleSheet()
-            if style_sheet and object_name in style_sheet:
-                x, y = get_color(object_name, style_sheet, hover, pressed, checked, style_filter)
-                if x and y:
-                    return x, y
+# Sent when a widget moves to another screen or its screen changes scale
+SCREEN_EVENTS = tuple(
+    getattr(QEvent.Type, name) for name in ("ScreenChangeInternal", "DevicePixelRatioChange")
+    if hasattr(QEvent.Type, name)
+)
 
-            # Move to the parent widget
-            current_widget = current_widget.parentWidget()
 
-        except RuntimeError:
-            break
-    return None, None
+def rasterize_svg(renderer: QSvgRenderer, width: int, height: int, color: Union[QColor, str],
+                  dpr: float = 1.0, icon=None) -> QPixmap:
+    """Render at ``width`` x ``height`` logical pixels for a screen of ratio ``dpr`` and fill with ``color``."""
+    pixmap = QPixmap(math.ceil(width * dpr), math.ceil(height * dpr))
+    pixmap.fill(Qt.GlobalColor.transparent)
+    rasterize(renderer, pixmap, QPainter, color, icon)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
 
 
 def svg_to_pixmap(
         svg_filename: str,
         width: int,
         height: int,
-        color: Union[QColor, str]
+        color: Union[QColor, str],
+        dpr: Optional[float] = None
 ) -> QPixmap:
+    """Colored raster of an SVG file or inline SVG.
+
+    With ``dpr`` the result is exact for a screen of that ratio; without it
+    the SVG is oversampled 10x, to be scaled down by the caller.
+    """
+    icon = svg_filename
     if svg_filename.startswith("<svg"):
         if "width=" in svg_filename and "height=" in svg_filename:
             w = svg_filename.split("width=\"")[1].split('"')[0]
@@ -107,22 +72,64 @@ def svg_to_pixmap(
     if not isinstance(color, QColor):
         color = QColor(color)
 
+    started = instrument.clock()
     renderer = QSvgRenderer(svg_filename)
+    instrument.record("renderer", started, icon=icon)
+    if dpr is not None:
+        return rasterize_svg(renderer, width, height, color, dpr, icon)
+
     pixmap = QPixmap(width * 10, height * 10)
     pixmap = pixmap.scaled(width * 10, height * 10, Qt.AspectRatioMode.KeepAspectRatio,
                            Qt.TransformationMode.SmoothTransformation)
     pixmap.fill(Qt.GlobalColor.transparent)
-    painter = QPainter(pixmap)
-    renderer.render(painter)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    painter.setCompositionMode(
-        painter.CompositionMode.CompositionMode_SourceIn)
-    painter.fillRect(pixmap.rect(), color)
-    painter.end()
+    return rasterize(renderer, pixmap, QPainter, color, icon)
+
+
+@pixmap_cache("svg_pixmap", maxsize=128)
+def _cached_svg_pixmap(svg_filename: str, width: int, height: int, color: str, dpr: Optional[float]) -> QPixmap:
+    return svg_to_pixmap(svg_filename, width, height, color, dpr)
+
+
+def cached_svg_pixmap(svg_filename: str, width: int, height: int, color: Union[QColor, str],
+                      dpr: Optional[float] = None) -> QPixmap:
+    """svg_to_pixmap memoized by source, size, color and screen ratio.
+
+    Widgets pass their ``devicePixelRatioF()``, so widgets on the same screen
+    share one exact raster and a move to another screen renders a new one.
+    """
+    if isinstance(color, QColor):
+        color = color.name(QColor.NameFormat.HexArgb)
+    return _cached_svg_pixmap(svg_filename, width, height, color, dpr)
+
+
+@pixmap_cache("colored_svg_pixmap", maxsize=128)
+def colored_svg_pixmap(svg_path: str, width: int, height: int, color: str, dpr: float = 1.0) -> QPixmap:
+    """Render an SVG at its final size and fill it with ``color``, memoized."""
+    started = instrument.clock()
+    renderer = QSvgRenderer(svg_path)
+    instrument.record("renderer", started, icon=svg_path)
+    return rasterize_svg(renderer, width, height, color, dpr, svg_path)
+
+
+# Exact-size rasters of QIconSvg and QSvgButton, shared by widgets showing the same icon
+_widget_rasters = PixmapCache("widget_raster", maxsize=256, icon=lambda key: key[1])
+
+
+def widget_raster(key: tuple, render) -> QPixmap:
+    """The raster for ``key`` from the shared cache, rendered by ``render()`` on a miss."""
+    pixmap = _widget_rasters.get(key)
+    if pixmap is None:
+        pixmap = _widget_rasters.put(key, render())
     return pixmap
 
 
-class QDropButton(QWidget):
+instrument.watch_cache("get_color", get_color)
+instrument.watch_cache("svg_pixmap", _cached_svg_pixmap)
+instrument.watch_cache("colored_svg_pixmap", colored_svg_pixmap)
+instrument.watch_cache("widget_raster", _widget_rasters)
+
+
+class QDropButton(RasterReleaseMixin, QWidget):
     changeState = Signal(bool)
     clicked = Signal()
 
@@ -136,9 +143,11 @@ class QDropButton(QWidget):
             save_state: bool = False,
             text_alignment: Optional[str] = "left",
             *args,
+            flat: bool = False,
             **kwargs
     ):
         super().__init__(*args, **kwargs)
+        self.flat = flat
         self.text = text
         self.left_svg = left_svg
         self.right_svg = right_svg
@@ -147,6 +156,11 @@ class QDropButton(QWidget):
         self.save_state = save_state
         self.text_alignment = text_alignment
         self.stylecode = None
+        self.dpr = None
+        self.rasters_released = False
+        self.icon_args = None
+        self.raster = None
+        self.icon_swapped = False
 
         if not self.minus_svg:
             self.save_state = False
@@ -156,29 +170,124 @@ class QDropButton(QWidget):
 
         self.state_release = False
         self.size = (20, 20)
-        self.initWidget()
+        self.left_size = (20, 20)
+        if self.flat:
+            self.initFlatWidget()
+        else:
+            self.initWidget()
+
+    def event(self, e):
+        if e.type() in SCREEN_EVENTS and self.dpr not in (None, self.devicePixelRatioF()):
+            # Moved to a screen with another scale: re-render for it (flat mode paints per screen already)
+            self.leaveEvent(None)
+        return super().event(e)
 
     def paintEvent(self, event):
+        RasterReleasePolicy.instance().painted(self)
+        started = instrument.clock()
         opt = QStyleOption()
         opt.initFrom(self)
         painter = QPainter(self)
 
         style = self.style()
         style.drawPrimitive(QStyle.PrimitiveElement.PE_Widget, opt, painter, self)
-        painter.save()
+        if self.flat:
+            self.paintFlat(painter)
+        painter.end()
+        instrument.record("paint", started, widget=self)
 
     def setIconSize(self, width: Union[int, QSize], height: Optional[int] = None):
         if isinstance(width, QSize):
             width, height = width.width(), width.height()
         self.size = (width, height)
+        if self.flat:
+            self.updateGeometry()
+            self.update()
+            return
         self.right.setSvgSize(*self.size)
 
     def setIconLeftSize(self, width: Union[int, QSize], height: Optional[int] = None):
         if isinstance(width, QSize):
             width, height = width.width(), width.height()
         size = (width, height)
+        self.left_size = size
+        if self.flat:
+            self.updateGeometry()
+            self.update()
+            return
         self.left.setSvgSize(*size)
 
+    def setSpacing(self, space: int):
+        """Distance between the images and the text."""
+        if self.flat:
+            self.spacing = space
+            self.updateGeometry()
+            self.update()
+        else:
+            self.layout().setSpacing(space)
+
+    def initFlatWidget(self):
+        """Initialize the painted mode: no child widgets, no layout."""
+        self.left = self.right = self.label = None
+        self.spacing = 0
+        self.color = None
+        self.current_right_svg = self.right_svg
+        self.static_text = QStaticText(self.text)
+        self.static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        QTimer.singleShot(100, partial(self.leaveEvent, None))
+
+    def flatMargins(self) -> Tuple[int, int, int, int]:
+        style = self.style()
+        return (
+            style.pixelMetric(QStyle.PixelMetric.PM_LayoutLeftMargin),
+            style.pixelMetric(QStyle.PixelMetric.PM_LayoutTopMargin),
+            style.pixelMetric(QStyle.PixelMetric.PM_LayoutRightMargin),
+            style.pixelMetric(QStyle.PixelMetric.PM_LayoutBottomMargin),
+        )
+
+    def sizeHint(self):
+        if not self.flat:
+            return super().sizeHint()
+        left, top, right, bottom = self.flatMargins()
+        text = self.static_text.size()
+        width = left + self.left_size[0] + self.spacing * 2 + int(text.width()) + self.size[0] + right
+        height = top + max(self.left_size[1], self.size[1], int(text.height())) + bottom
+        return QSize(width, height)
+
+    def paintFlat(self, painter: QPainter):
+        """Draw both icons and the text from cached pixmaps and QStaticText."""
+        left, top, right, bottom = self.flatMargins()
+        rect = self.rect().adjusted(left, top, -right, -bottom)
+        center_y = rect.center().y()
+
+        if self.color:
+            if self.left_svg:
+                pixmap = colored_svg_pixmap(self.left_svg, *self.left_size, self.color, self.devicePixelRatioF())
+                painter.drawPixmap(rect.left(), center_y - self.left_size[1] // 2, pixmap)
+            if self.current_right_svg:
+                pixmap = colored_svg_pixmap(self.current_right_svg, *self.size, self.color, self.devicePixelRatioF())
+                painter.drawPixmap(rect.right() - self.size[0] + 1, center_y - self.size[1] // 2, pixmap)
+            painter.setPen(QColor(self.color))
+
+        text_size = self.static_text.size()
+        text_left = rect.left() + self.left_size[0] + self.spacing
+        text_right = rect.right() + 1 - self.size[0] - self.spacing
+        if self.text_alignment == "right":
+            x = text_right - text_size.width()
+        elif self.text_alignment == "center":
+            x = text_left + (text_right - text_left - text_size.width()) / 2
+        else:
+            x = text_left
+        painter.setFont(self.font())
+        painter.drawStaticText(QPointF(x, center_y - text_size.height() / 2), self.static_text)
+
+    def setRightSvg(self, svg_path):
+        if self.flat:
+            self.current_right_svg = svg_path
+        elif svg_path != self.right.svg_path:
+            self.right.setIcon(svg_path)
+            self.icon_swapped = True
+
     def initWidget(self):
         """Initialize the widget."""
         layout = QHBoxLayout()
@@ -217,24 +326,49 @@ class QDropButton(QWidget):
 
     def updateIcon(self, color, hover=False):
         """Update the color of the icons."""
+        self.icon_swapped = False
+        IconUpdateScheduler.instance().apply(self, color, hover)
+
+    def scheduleIcon(self, color, hover=False):
+        """Update the color of the icons on the next frame; used by the event handlers."""
+        scheduler = IconUpdateScheduler.instance()
+        scheduler.schedule(self, color, hover)
+        if self.icon_swapped:
+            # The right child switched its SVG: color it in this frame, not the next one
+            self.icon_swapped = False
+            scheduler.flush(self)
+
+    def applyIcon(self, color, hover=False):
         if not color:
             return
 
+        if self.flat:
+            self.color = color
+            self.current_right_svg = self.right_svg if not hover and not self.state_release else self.minus_svg
+            self.update()
+            return
+
+        self.icon_args = (color, hover)
+        if self.rasters_released:
+            return
+
         svgs = [self.left_svg, self.right_svg if not hover and not self.state_release else self.minus_svg]
+        self.raster = []
         for svg, button in zip(svgs, [self.left, self.right]):
             pixmap = self.generateColoredPixmap(svg, color)
+            button.raster = pixmap
             button.setPixmap(pixmap)
+            self.raster.append(pixmap)
+
+    def clearIcon(self):
+        for button in (self.left, self.right):
+            button.raster = None
+            button.setPixmap(QPixmap())
 
     def generateColoredPixmap(self, svg_path, color):
         """Generate a colored pixmap from an SVG."""
-        renderer = QSvgRenderer(svg_path)
-        pixmap = QPixmap(*self.size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(pixmap.rect(), color)
-        painter.save()
+        self.dpr = self.devicePixelRatioF()
+        pixmap = colored_svg_pixmap(svg_path, *self.size, color, self.dpr)
         self.label.setStyleSheet("* {color: {COLOR};}".replace("{COLOR}", color))
         return pixmap
 
@@ -245,37 +379,37 @@ class QDropButton(QWidget):
         hover = False
         if (self.minus_svg and not self.only_click):
             hover = True
-            self.right.setIcon(self.minus_svg)
+            self.setRightSvg(self.minus_svg)
 
         if not self.stylecode:
             effective_style, self.stylecode = get_effective_style(self, hover=True)
         else:
             effective_style, _ = get_color(type(self).__name__, self.stylecode, hover=True)
-        self.updateIcon(effective_style, hover)
+        self.scheduleIcon(effective_style, hover)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         if self.minus_svg:
-            self.right.setIcon(self.right_svg)
+            self.setRightSvg(self.right_svg)
 
         if not self.stylecode:
             effective_style, self.stylecode = get_effective_style(self)
         else:
             effective_style, _ = get_color(type(self).__name__, self.stylecode)
-        self.updateIcon(effective_style, self.state_release)
+        self.scheduleIcon(effective_style, self.state_release)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
         hover = False
         if self.minus_svg:
             hover = True
-            self.right.setIcon(self.minus_svg)
+            self.setRightSvg(self.minus_svg)
 
         if not self.stylecode:
             effective_style, self.stylecode = get_effective_style(self, pressed=True)
         else:
             effective_style, _ = get_color(type(self).__name__, self.stylecode, pressed=True)
-        self.updateIcon(effective_style, hover)
+        self.scheduleIcon(effective_style, hover)
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event=None):
@@ -290,7 +424,7 @@ class QDropButton(QWidget):
             if (self.minus_svg and not self.only_click) or self.state_release:
                 """ If widget have open svg and not active only_click """
                 hover = True
-                self.right.setIcon(self.minus_svg)
+                self.setRightSvg(self.minus_svg)
 
             if not self.stylecode:
                 effective_style, self.stylecode = get_effective_style(self, hover=True)
@@ -302,26 +436,59 @@ class QDropButton(QWidget):
             else:
                 effective_style, _ = get_color(type(self).__name__, self.stylecode, hover=True)
 
-        self.updateIcon(effective_style, hover)
+        self.scheduleIcon(effective_style, hover)
         if event:
             super().mouseReleaseEvent(event)
 
 
-class QIconSvg(QLabel):
+class QIconSvg(RasterReleaseMixin, QLabel):
     clicked = Signal()
 
     def __init__(self, svg_path: Optional[str] = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.svg_path = svg_path
+        self.svg_data = None
         self.size = (20, 20)
         self.disable = False
         self.stylecode = None
+        self.transition = None
+        self.dpr = None
+        self.rasters_released = False
+        self.icon_args = None
+        self.raster = None
         if self.svg_path:
             self.setIcon(self.svg_path)
 
     def setDisabledAnim(self, disable: bool):
         self.disable = disable
 
+    def event(self, e):
+        if e.type() in SCREEN_EVENTS and self.dpr not in (None, self.devicePixelRatioF()):
+            # Moved to a screen with another scale: re-render for it
+            self.leaveEvent(None)
+        return super().event(e)
+
+    def setHoverTransition(self, duration: int = 150):
+        """Cross-fade between state colors for ``duration`` ms, 0 disables."""
+        if self.transition:
+            self.transition.stop()
+        self.transition = HoverTransition(self, duration) if duration > 0 else None
+
+    def paintEvent(self, event):
+        RasterReleasePolicy.instance().painted(self)
+        started = instrument.clock()
+        if not self.transition or not self.transition.active:
+            super().paintEvent(event)
+            instrument.record("paint", started, widget=self)
+            return
+
+        QFrame.paintEvent(self, event)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmap(self.contentsRect(), self.transition.frame())
+        painter.end()
+        instrument.record("paint", started, widget=self)
+
     def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
         if isinstance(width, QSize):
             width, height = width.width(), width.height()
@@ -331,33 +498,87 @@ class QIconSvg(QLabel):
 
     def setIcon(self, icon):
         self.svg_path = icon
-        self.icon = QIcon(self.svg_path)
-        self.setPixmap(self.icon.pixmap(QSize(*self.size)))
+        self.svg_data = None
+        source = SvgLoader.instance().request(icon, self.sourceReady)
+        if source is not None:
+            self.setSource(source)
+        elif self.raster is None:
+            self.icon = QIcon(SvgLoader.instance().placeholderPixmap(*self.size))
+            self.setPixmap(self.icon.pixmap(QSize(*self.size)))
         self.setScaledContents(True)
         QTimer.singleShot(100, partial(self.leaveEvent, None))
 
-    def updateIcon(self, color):
-        if not color or not self.svg_path:
-            return
+    def setSource(self, source):
+        if source.path != self.svg_path or source.data is None:
+            return False
 
-        # Render SVG with the specified color
-        renderer = QSvgRenderer(self.svg_path)
-        pixmap = QPixmap(*self.size)  # Set desired icon size
+        if source.root is None:
+            # Not an SVG (PNG, ICO...): shown as QIcon reads it, icon-color does not apply
+            self.svg_data = None
+            self.raster = None
+            self.icon = QIcon(self.svg_path)
+            self.setPixmap(self.icon.pixmap(QSize(*self.size)))
+            return True
+
+        self.svg_data = source.data
+        if self.raster is not None or self.rasters_released:
+            # Already colored (by itself or by the QDropButton owning it): keep that until it is recolored
+            return True
+
+        pixmap = QPixmap(*self.size)
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(pixmap.rect(), color)
-        painter.save()
+        QSvgRenderer(self.svg_data).render(painter)
+        painter.end()
+        self.icon = QIcon(pixmap)
+        self.setPixmap(pixmap)
+        return True
+
+    def sourceReady(self, source):
+        """Called by SvgLoader once the file has been read off the GUI thread."""
+        if self.setSource(source):
+            self.leaveEvent(None)
+
+    def updateIcon(self, color):
+        IconUpdateScheduler.instance().apply(self, color)
+
+    def scheduleIcon(self, color):
+        IconUpdateScheduler.instance().schedule(self, color)
+
+    def applyIcon(self, color):
+        if not color or not self.svg_data:
+            return
+
+        self.icon_args = (color,)
+        if self.rasters_released:
+            return
+
+        self.dpr = self.devicePixelRatioF()
+        key = ("QIconSvg", self.svg_path, *self.size, QColor(color).name(QColor.NameFormat.HexArgb), self.dpr)
+        pixmap = widget_raster(key, partial(self.renderIcon, color))
+        if self.transition:
+            self.transition.start(pixmap, self.size)
+        self.raster = pixmap
         self.setPixmap(pixmap)
 
+    def renderIcon(self, color) -> QPixmap:
+        """Render SVG with the specified color"""
+        started = instrument.clock()
+        renderer = QSvgRenderer(self.svg_data)
+        instrument.record("renderer", started, icon=self.svg_path)
+        return rasterize_svg(renderer, *self.size, color, self.dpr, self.svg_path)
+
+    def clearIcon(self):
+        self.icon = QIcon()
+        self.setPixmap(QPixmap())
+
     def enterEvent(self, event):
         if not self.disable:
             if not self.stylecode:
                 effective_style, self.stylecode = get_effective_style(self, hover=True)
             else:
                 effective_style, _ = get_color(type(self).__name__, self.stylecode, hover=True)
-            self.updateIcon(effective_style)
+            self.scheduleIcon(effective_style)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
@@ -366,7 +587,7 @@ class QIconSvg(QLabel):
                 effective_style, self.stylecode = get_effective_style(self)
             else:
                 effective_style, _ = get_color(type(self).__name__, self.stylecode)
-            self.updateIcon(effective_style)
+            self.scheduleIcon(effective_style)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
@@ -375,7 +596,7 @@ class QIconSvg(QLabel):
                 effective_style, self.stylecode = get_effective_style(self, pressed=True)
             else:
                 effective_style, _ = get_color(type(self).__name__, self.stylecode, pressed=True)
-            self.updateIcon(effective_style)
+            self.scheduleIcon(effective_style)
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
@@ -391,13 +612,13 @@ class QIconSvg(QLabel):
                 effective_style, _ = get_color(type(self).__name__, self.stylecode)
 
         if not self.disable:
-            self.updateIcon(effective_style)
+            self.scheduleIcon(effective_style)
 
         self.clicked.emit()
         super().mouseReleaseEvent(event)
 
 
-class QSvgButton(QPushButton):
+class QSvgButton(RasterReleaseMixin, QPushButton):
     enter = Signal()
     leave = Signal()
 
@@ -405,13 +626,23 @@ class QSvgButton(QPushButton):
         super().__init__(*args, **kwargs)
         self.size = (20, 20)
         self.svg_path = svg_path
+        self.svg_data = None
         self.stylecode = None
+        self.dpr = None
+        self.rasters_released = False
+        self.icon_args = None
+        self.raster = None
         if self.svg_path:
             self.setSvg(self.svg_path)
 
     def event(self, e):
         super().event(e)
-        if str(e.type()) == "Type.PaletteChange":
+        if e.type() == QEvent.Type.PaletteChange:
+            started = instrument.clock()
+            self.leaveEvent(None)
+            instrument.record("theme_change", started, widget=self)
+        elif e.type() in SCREEN_EVENTS and self.dpr not in (None, self.devicePixelRatioF()):
+            # Moved to a screen with another scale: re-render for it
             self.leaveEvent(None)
         return True
 
@@ -425,41 +656,65 @@ class QSvgButton(QPushButton):
 
     def setSvg(self, icon):
         self.svg_path = icon
+        self.svg_data = None
+        loader = SvgLoader.instance()
+        source = loader.request(icon, self.sourceReady)
+        if source is not None:
+            self.svg_data = source.data
+        elif loader.placeholder is not None:
+            self.setIcon(QIcon(loader.placeholderPixmap(*self.size)))
         QTimer.singleShot(100, partial(self.leaveEvent, None))
 
+    def sourceReady(self, source):
+        """Called by SvgLoader once the file has been read off the GUI thread."""
+        if source.path != self.svg_path or source.data is None:
+            return
+        self.svg_data = source.data
+        self.leaveEvent(None)
+
     def updateIcon(self, color):
-        if not color or not self.svg_path:
+        IconUpdateScheduler.instance().apply(self, color)
+
+    def scheduleIcon(self, color):
+        IconUpdateScheduler.instance().schedule(self, color)
+
+    def applyIcon(self, color):
+        if not color or not self.svg_data:
             return
 
-        renderer = QSvgRenderer(self.svg_path)
-        pixmap = QPixmap(*self.size)  # Set desired icon size
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
+        self.icon_args = (color,)
+        if self.rasters_released:
+            return
 
+        self.dpr = self.devicePixelRatioF()
+        key = ("QSvgButton", self.svg_path, *self.size, QColor(color).name(QColor.NameFormat.HexArgb), self.dpr)
+        self.raster = widget_raster(key, partial(self.renderIcon, color))
+        self.setIcon(QIcon(self.raster))
+
+    def renderIcon(self, color) -> QPixmap:
+        started = instrument.clock()
+        renderer = QSvgRenderer(self.svg_data)
         renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+        instrument.record("renderer", started, icon=self.svg_path)
+        return rasterize_svg(renderer, *self.size, color, self.dpr, self.svg_path)
 
-        renderer.render(painter)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(pixmap.rect(), color)
-        painter.save()
-        self.setIcon(QIcon(pixmap))
 
     def enterEvent(self, event):
         self.enter.emit()
         effective_style, self.stylecode = get_effective_style(self, hover=True)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         self.leave.emit()
         effective_style, self.stylecode = get_effective_style(self)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         if event:
             super().leaveEvent(event)
 
     def mousePressEvent(self, event):
         effective_style, self.stylecode = get_effective_style(self, pressed=True)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
@@ -468,7 +723,7 @@ class QSvgButton(QPushButton):
         else:
             effective_style, self.stylecode = get_effective_style(self)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mouseReleaseEvent(event)
 
 
@@ -492,8 +747,10 @@ class QSvgButtonIcon(QSvgWidget):
 
     def event(self, e):
         super().event(e)
-        if str(e.type()) == "Type.PaletteChange":
+        if e.type() == QEvent.Type.PaletteChange:
+            started = instrument.clock()
             self.leaveEvent(None)
+            instrument.record("theme_change", started, widget=self)
         return True
 
     def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
@@ -505,13 +762,50 @@ class QSvgButtonIcon(QSvgWidget):
         self.leaveEvent(None)
 
     def setSvg(self, icon):
-        self.tree = Et.parse(icon)
-        self.root = self.tree.getroot()
+        self.tree = None
+        self.root = None
         self.svg_path = icon
+        source = SvgLoader.instance().request(icon, self.sourceReady)
+        if source is not None:
+            self.setSource(source)
+        else:
+            self.update()
         QTimer.singleShot(100, partial(self.leaveEvent, None))
 
+    def paintEvent(self, event):
+        if self.root is not None or not self.svg_path:
+            super().paintEvent(event)
+            return
+
+        # Still loading: the placeholder instead of the previous icon
+        loader = SvgLoader.instance()
+        if loader.placeholder is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(self.rect(), loader.placeholderPixmap(self.width(), self.height()))
+            painter.end()
+
+    def setSource(self, source):
+        if source.path != self.svg_path or source.root is None:
+            return False
+
+        # Sources are shared: every updateIcon sets the fill before serializing
+        self.root = source.root
+        self.tree = Et.ElementTree(self.root)
+        return True
+
+    def sourceReady(self, source):
+        """Called by SvgLoader once the file has been read off the GUI thread."""
+        if self.setSource(source):
+            self.leaveEvent(None)
+
     def updateIcon(self, color):
-        if not color or not self.svg_path:
+        IconUpdateScheduler.instance().apply(self, color)
+
+    def scheduleIcon(self, color):
+        IconUpdateScheduler.instance().schedule(self, color)
+
+    def applyIcon(self, color):
+        if not color or self.root is None:
             return
 
         c = QColor(color)
@@ -530,7 +824,7 @@ class QSvgButtonIcon(QSvgWidget):
     def enterEvent(self, event):
         self.enter.emit()
         effective_style, self.stylecode = get_effective_style(self, hover=True)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
@@ -541,13 +835,13 @@ class QSvgButtonIcon(QSvgWidget):
 
         self.leave.emit()
         effective_style, self.stylecode = get_effective_style(self)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         if event:
             super().leaveEvent(event)
 
     def mousePressEvent(self, event):
         effective_style, self.stylecode = get_effective_style(self, pressed=True)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mousePressEvent(event)
 
     def closeEvent(self, event):
@@ -564,12 +858,12 @@ class QSvgButtonIcon(QSvgWidget):
         else:
             effective_style, self.stylecode = get_effective_style(self)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mouseReleaseEvent(event)
         self.clicked.emit()
 
 
-class SVGRenderRadioButton(QRadioButton):
+class SVGRenderRadioButton(RasterReleaseMixin, QRadioButton):
     enter = Signal()
     leave = Signal()
 
@@ -580,11 +874,22 @@ class SVGRenderRadioButton(QRadioButton):
         self.size_ic = size_ic
         self.svg_string = svg_string
         self.closed = False
+        self.transition = None
+        self.dpr = None
+        self.rasters_released = False
+        self.icon_args = None
+        self.raster = None
+        self.radio_group = None
         self.set_string_svg(self.svg_string)
         self.setCheckable(False)
-        self.toggled.connect(lambda e: self.leaveEvent())
+        self.toggled.connect(self._on_toggled)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
+    def _on_toggled(self, checked):
+        # A SvgRadioGroup refreshes its buttons itself
+        if self.radio_group is None:
+            self.leaveEvent()
+
     def set_name(self, name):
         self.setObjectName(name)
         self.__class__.__name__ = name
@@ -592,11 +897,18 @@ class SVGRenderRadioButton(QRadioButton):
 
     def event(self, e):
         super().event(e)
-        if str(e.type()) == "Type.PaletteChange":
+        if e.type() == QEvent.Type.PaletteChange:
+            started = instrument.clock()
             get_color.cache_clear()
             self.clear_cache = None
+            if self.radio_group is not None:
+                self.radio_group.invalidate()
             self.after_load()
             self.leaveEvent(None)
+            instrument.record("theme_change", started, widget=self)
+        elif e.type() in SCREEN_EVENTS and self.dpr not in (None, self.devicePixelRatioF()):
+            # Moved to a screen with another scale: re-render for it
+            self.leaveEvent(None)
         return True
 
     def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
@@ -621,13 +933,43 @@ class SVGRenderRadioButton(QRadioButton):
         effective_style, self.clear_cache = get_effective_style(self)
 
     def updateIcon(self, color):
+        IconUpdateScheduler.instance().apply(self, color)
+
+    def scheduleIcon(self, color):
+        IconUpdateScheduler.instance().schedule(self, color)
+
+    def applyIcon(self, color):
         if not color or not self.svg_string:
             return
 
-        pixel = svg_to_pixmap(self.svg_string, *self.size_ic, color)
+        self.icon_args = (color,)
+        if self.rasters_released:
+            return
+
+        self.dpr = self.devicePixelRatioF()
+        pixel = cached_svg_pixmap(self.svg_string, *self.size_ic, color, self.dpr)
+        if self.transition:
+            self.transition.start(pixel, self.size_ic)
+        self.raster = pixel
         self.setIcon(QIcon(pixel))
         self.setIconSize(QSize(*self.size_ic))
 
+
+    def setHoverTransition(self, duration: int = 150):
+        """Cross-fade between state colors for ``duration`` ms, 0 disables."""
+        if self.transition:
+            self.transition.stop()
+        self.transition = HoverTransition(self, duration) if duration > 0 else None
+
+    def paintEvent(self, event):
+        RasterReleasePolicy.instance().painted(self)
+        started = instrument.clock()
+        if self.transition and self.transition.active:
+            paint_button_transition(self, self.transition)
+        else:
+            super().paintEvent(event)
+        instrument.record("paint", started, widget=self)
+
     def enterEvent(self, event=None):
         self.enter.emit()
         if self.clear_cache:
@@ -638,7 +980,7 @@ class SVGRenderRadioButton(QRadioButton):
                                                                     checked=self.isChecked())
         if event:
             super().enterEvent(event)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
 
     def leaveEvent(self, event=None):
         if self.closed:
@@ -656,7 +998,7 @@ class SVGRenderRadioButton(QRadioButton):
             effective_style, self.clear_cache = get_effective_style(self, checked=self.isChecked())
         if event:
             super().leaveEvent(event)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
 
     def mousePressEvent(self, event):
         if self.clear_cache:
@@ -664,7 +1006,7 @@ class SVGRenderRadioButton(QRadioButton):
         else:
             effective_style, self.clear_cache = get_effective_style(self, pressed=True)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mousePressEvent(event)
 
     def closeEvent(self, event):
@@ -687,11 +1029,11 @@ class SVGRenderRadioButton(QRadioButton):
             else:
                 effective_style, self.clear_cache = get_effective_style(self)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mouseReleaseEvent(event)
 
 
-class SVGRenderButton(QToolButton):
+class SVGRenderButton(RasterReleaseMixin, QToolButton):
     enter = Signal()
     leave = Signal()
 
@@ -702,6 +1044,11 @@ class SVGRenderButton(QToolButton):
         self.size_ic = size_ic
         self.svg_string = svg_string
         self.closed = False
+        self.transition = None
+        self.dpr = None
+        self.rasters_released = False
+        self.icon_args = None
+        self.raster = None
         self.set_string_svg(self.svg_string)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
@@ -713,11 +1060,16 @@ class SVGRenderButton(QToolButton):
     def event(self, e):
         super().event(e)
 
-        if str(e.type()) == "Type.PaletteChange":
+        if e.type() == QEvent.Type.PaletteChange:
+            started = instrument.clock()
             get_color.cache_clear()
             self.clear_cache = None
             self.after_load()
             self.leaveEvent(None)
+            instrument.record("theme_change", started, widget=self)
+        elif e.type() in SCREEN_EVENTS and self.dpr not in (None, self.devicePixelRatioF()):
+            # Moved to a screen with another scale: re-render for it
+            self.leaveEvent(None)
         return True
 
     def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
@@ -736,6 +1088,17 @@ class SVGRenderButton(QToolButton):
         QTimer.singleShot(100, partial(self.leaveEvent))
         QTimer.singleShot(100, partial(self.after_load))
 
+    def reassign(self, svg_string: str, size_ic: Optional[Tuple[int, int]] = None, object_name: Optional[str] = None):
+        """Reuse the widget for another icon without timers or a new style walk."""
+        self.closed = False
+        self.svg_string = svg_string
+        if size_ic:
+            self.size_ic = tuple(size_ic)
+        if object_name is not None:
+            self.setObjectName(object_name)
+        self.setDown(False)
+        self.leaveEvent()
+
     def after_load(self):
         if self.closed:
             return
@@ -746,13 +1109,43 @@ class SVGRenderButton(QToolButton):
         effective_style, self.clear_cache = get_effective_style(self)
 
     def updateIcon(self, color):
+        IconUpdateScheduler.instance().apply(self, color)
+
+    def scheduleIcon(self, color):
+        IconUpdateScheduler.instance().schedule(self, color)
+
+    def applyIcon(self, color):
         if not color or not self.svg_string:
             return
 
-        pixel = svg_to_pixmap(self.svg_string, *self.size_ic, color)
+        self.icon_args = (color,)
+        if self.rasters_released:
+            return
+
+        self.dpr = self.devicePixelRatioF()
+        pixel = cached_svg_pixmap(self.svg_string, *self.size_ic, color, self.dpr)
+        if self.transition:
+            self.transition.start(pixel, self.size_ic)
+        self.raster = pixel
         self.setIcon(QIcon(pixel))
         self.setIconSize(QSize(*self.size_ic))
 
+
+    def setHoverTransition(self, duration: int = 150):
+        """Cross-fade between state colors for ``duration`` ms, 0 disables."""
+        if self.transition:
+            self.transition.stop()
+        self.transition = HoverTransition(self, duration) if duration > 0 else None
+
+    def paintEvent(self, event):
+        RasterReleasePolicy.instance().painted(self)
+        started = instrument.clock()
+        if self.transition and self.transition.active:
+            paint_button_transition(self, self.transition)
+        else:
+            super().paintEvent(event)
+        instrument.record("paint", started, widget=self)
+
     def enterEvent(self, event=None):
         self.enter.emit()
         if self.clear_cache:
@@ -761,7 +1154,7 @@ class SVGRenderButton(QToolButton):
             effective_style, self.clear_cache = get_effective_style(self, hover=True)
         if event:
             super().enterEvent(event)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
 
     def leaveEvent(self, event=None):
         if self.closed:
@@ -780,7 +1173,7 @@ class SVGRenderButton(QToolButton):
             effective_style, self.clear_cache = get_effective_style(self, checked=self.isChecked())
         if event:
             super().leaveEvent(event)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
 
     def mousePressEvent(self, event):
         if self.clear_cache:
@@ -788,7 +1181,7 @@ class SVGRenderButton(QToolButton):
         else:
             effective_style, self.clear_cache = get_effective_style(self, pressed=True)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mousePressEvent(event)
 
     def closeEvent(self, event):
@@ -811,11 +1204,11 @@ class SVGRenderButton(QToolButton):
             else:
                 effective_style, self.clear_cache = get_effective_style(self)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mouseReleaseEvent(event)
 
 
-class SVGRenderIcon(QPushButton):
+class SVGRenderIcon(RasterReleaseMixin, QPushButton):
     enter = Signal()
     leave = Signal()
 
@@ -826,6 +1219,11 @@ class SVGRenderIcon(QPushButton):
         self.size_ic = size_ic
         self.svg_string = svg_string
         self.closed = False
+        self.transition = None
+        self.dpr = None
+        self.rasters_released = False
+        self.icon_args = None
+        self.raster = None
         self.set_string_svg(self.svg_string)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
@@ -836,11 +1234,16 @@ class SVGRenderIcon(QPushButton):
 
     def event(self, e):
         super().event(e)
-        if str(e.type()) == "Type.PaletteChange":
+        if e.type() == QEvent.Type.PaletteChange:
+            started = instrument.clock()
             get_color.cache_clear()
             self.clear_cache = None
             self.after_load()
             self.leaveEvent(None)
+            instrument.record("theme_change", started, widget=self)
+        elif e.type() in SCREEN_EVENTS and self.dpr not in (None, self.devicePixelRatioF()):
+            # Moved to a screen with another scale: re-render for it
+            self.leaveEvent(None)
         return True
 
     def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
@@ -859,6 +1262,17 @@ class SVGRenderIcon(QPushButton):
         QTimer.singleShot(100, partial(self.leaveEvent))
         QTimer.singleShot(100, partial(self.after_load))
 
+    def reassign(self, svg_string: str, size_ic: Optional[Tuple[int, int]] = None, object_name: Optional[str] = None):
+        """Reuse the widget for another icon without timers or a new style walk."""
+        self.closed = False
+        self.svg_string = svg_string
+        if size_ic:
+            self.size_ic = tuple(size_ic)
+        if object_name is not None:
+            self.setObjectName(object_name)
+        self.setDown(False)
+        self.leaveEvent()
+
     def after_load(self):
         effective_style, self.clear_cache = get_effective_style(self, checked=True)
         effective_style, self.clear_cache = get_effective_style(self, hover=True)
@@ -866,13 +1280,43 @@ class SVGRenderIcon(QPushButton):
         effective_style, self.clear_cache = get_effective_style(self)
 
     def updateIcon(self, color):
+        IconUpdateScheduler.instance().apply(self, color)
+
+    def scheduleIcon(self, color):
+        IconUpdateScheduler.instance().schedule(self, color)
+
+    def applyIcon(self, color):
         if not color or not self.svg_string:
             return
 
-        pixel = svg_to_pixmap(self.svg_string, *self.size_ic, color)
+        self.icon_args = (color,)
+        if self.rasters_released:
+            return
+
+        self.dpr = self.devicePixelRatioF()
+        pixel = cached_svg_pixmap(self.svg_string, *self.size_ic, color, self.dpr)
+        if self.transition:
+            self.transition.start(pixel, self.size_ic)
+        self.raster = pixel
         self.setIcon(QIcon(pixel))
         self.setIconSize(QSize(*self.size_ic))
 
+
+    def setHoverTransition(self, duration: int = 150):
+        """Cross-fade between state colors for ``duration`` ms, 0 disables."""
+        if self.transition:
+            self.transition.stop()
+        self.transition = HoverTransition(self, duration) if duration > 0 else None
+
+    def paintEvent(self, event):
+        RasterReleasePolicy.instance().painted(self)
+        started = instrument.clock()
+        if self.transition and self.transition.active:
+            paint_button_transition(self, self.transition)
+        else:
+            super().paintEvent(event)
+        instrument.record("paint", started, widget=self)
+
     def enterEvent(self, event=None):
         self.enter.emit()
         if self.clear_cache:
@@ -881,7 +1325,7 @@ class SVGRenderIcon(QPushButton):
             effective_style, self.clear_cache = get_effective_style(self, hover=True)
         if event:
             super().enterEvent(event)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
 
     def leaveEvent(self, event=None):
         if self.closed:
@@ -900,7 +1344,7 @@ class SVGRenderIcon(QPushButton):
             effective_style, self.clear_cache = get_effective_style(self, checked=self.isChecked())
         if event:
             super().leaveEvent(event)
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
 
     def mousePressEvent(self, event):
         if self.clear_cache:
@@ -908,7 +1352,7 @@ class SVGRenderIcon(QPushButton):
         else:
             effective_style, self.clear_cache = get_effective_style(self, pressed=True)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mousePressEvent(event)
 
     def closeEvent(self, event):
@@ -935,5 +1379,5 @@ class SVGRenderIcon(QPushButton):
             else:
                 effective_style, self.clear_cache = get_effective_style(self)
 
-        self.updateIcon(effective_style)
+        self.scheduleIcon(effective_style)
         super().mouseReleaseEvent(event)
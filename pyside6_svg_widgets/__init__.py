@@ -1,4 +1,80 @@
-from .QAbstract import (
-    QSvgButton, QIconSvg, QDropButton, QSvgButtonIcon,
-    SVGRenderButton, SVGRenderIcon, SVGRenderRadioButton
-)
+"""SVG widgets for PySide6.
+
+Names are resolved on first access, so ``import pyside6_svg_widgets`` costs
+next to nothing and e.g. ``from pyside6_svg_widgets import SvgIconView``
+loads only the modules that class needs. Qt itself is imported by the
+first widget module that is touched.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "QSvgButton": ".QAbstract",
+    "QIconSvg": ".QAbstract",
+    "QDropButton": ".QAbstract",
+    "QSvgButtonIcon": ".QAbstract",
+    "SVGRenderButton": ".QAbstract",
+    "SVGRenderIcon": ".QAbstract",
+    "SVGRenderRadioButton": ".QAbstract",
+    "SvgIconModel": ".svg_view",
+    "SvgIconDelegate": ".svg_view",
+    "SvgIconView": ".svg_view",
+    "SvgRole": ".svg_view",
+    "SvgIconEngine": ".icon_engine",
+    "themed_icon": ".icon_engine",
+    "QDropTree": ".drop_tree",
+    "DropTreeModel": ".drop_tree",
+    "DropTreeNode": ".drop_tree",
+    "DropTreeDelegate": ".drop_tree",
+    "SvgIconStrip": ".icon_strip",
+    "SvgRadioGroup": ".radio_group",
+    "SvgWidgetPool": ".pool",
+    "SvgWidgetSpec": ".factory",
+    "build_svg_widgets": ".factory",
+    "deferred_updates": ".factory",
+    "SvgLoader": ".loader",
+    "SvgSource": ".loader",
+    "IconUpdateScheduler": ".scheduler",
+    "RasterReleasePolicy": ".release",
+    "RasterReleaseMixin": ".release",
+}
+_SUBMODULES = {
+    "instrument": "svg_widgets_core.instrument",
+    "memory": ".memory",
+}
+
+__all__ = list(_EXPORTS) + list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(_SUBMODULES[name], __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .QAbstract import (
+        QSvgButton, QIconSvg, QDropButton, QSvgButtonIcon,
+        SVGRenderButton, SVGRenderIcon, SVGRenderRadioButton
+    )
+    from .svg_view import SvgIconModel, SvgIconDelegate, SvgIconView, SvgRole
+    from .icon_engine import SvgIconEngine, themed_icon
+    from .drop_tree import QDropTree, DropTreeModel, DropTreeNode, DropTreeDelegate
+    from .icon_strip import SvgIconStrip
+    from .radio_group import SvgRadioGroup
+    from .pool import SvgWidgetPool
+    from .factory import SvgWidgetSpec, build_svg_widgets, deferred_updates
+    from .loader import SvgLoader, SvgSource
+    from .scheduler import IconUpdateScheduler
+    from .release import RasterReleasePolicy, RasterReleaseMixin
+    from svg_widgets_core import instrument
+    from . import memory
@@ -0,0 +1,230 @@
+from typing import Optional, Union, Tuple, Sequence, Callable
+
+from PySide6.QtWidgets import (
+    QTreeView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QAbstractItemView
+)
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtCore import (
+    Qt, QSize, QAbstractItemModel, QModelIndex, QPersistentModelIndex, QRect, Signal
+)
+
+from .svg_view import SvgIconDelegate, SvgRole
+
+
+class DropTreeNode:
+    """One row of a DropTreeModel.
+
+    ``loader`` is called once, the first time the row is expanded, and must
+    return the children as ``(text, svg)`` or ``(text, svg, loader)`` tuples.
+    """
+
+    __slots__ = ("text", "svg", "parent", "row", "children", "loader")
+
+    def __init__(self, text: str, svg: Optional[str] = None, parent: Optional["DropTreeNode"] = None,
+                 loader: Optional[Callable[[], Sequence]] = None):
+        self.text = text
+        self.svg = svg
+        self.parent = parent
+        self.row = 0
+        self.children = []
+        self.loader = loader
+
+    def add(self, text: str, svg: Optional[str] = None,
+            loader: Optional[Callable[[], Sequence]] = None) -> "DropTreeNode":
+        node = DropTreeNode(text, svg, self, loader)
+        node.row = len(self.children)
+        self.children.append(node)
+        return node
+
+
+class DropTreeModel(QAbstractItemModel):
+    """Tree of sections whose children are built only when a section is expanded."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = DropTreeNode("")
+
+    def addSection(self, text: str, svg: Optional[str] = None,
+                   children: Union[Sequence, Callable[[], Sequence], None] = None) -> DropTreeNode:
+        """Append a top-level section; ``children`` may be a list or a loader."""
+        loader = children if callable(children) or children is None else (lambda: children)
+        row = len(self.root.children)
+        self.beginInsertRows(QModelIndex(), row, row)
+        node = self.root.add(text, svg, loader)
+        self.endInsertRows()
+        return node
+
+    def node(self, index: QModelIndex) -> DropTreeNode:
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node(parent)
+        if column != 0 or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        return bool(node.children) or node.loader is not None
+
+    def canFetchMore(self, parent):
+        return self.node(parent).loader is not None
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        loader, node.loader = node.loader, None
+        if loader is None:
+            return
+
+        items = list(loader())
+        if not items:
+            return
+        first = len(node.children)
+        self.beginInsertRows(parent, first, first + len(items) - 1)
+        for item in items:
+            node.add(*item)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.text
+        if role == SvgRole:
+            return node.svg
+        return None
+
+
+class DropTreeDelegate(SvgIconDelegate):
+    """Paints a row the way QDropButton looks: left icon, text, right or minus icon.
+
+    The text takes the icon color, like the QDropButton label does.
+    """
+
+    def __init__(self, parent=None, right_svg: Optional[str] = None, minus_svg: Optional[str] = None,
+                 only_click: bool = True, icon_size: Tuple[int, int] = (20, 20), row_height: int = 36):
+        super().__init__(parent, icon_size)
+        self.right_svg = right_svg
+        self.minus_svg = minus_svg
+        self.only_click = only_click
+        self.row_height = row_height
+        self.spacing = 10
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), max(self.row_height, self.size_ic[1], option.fontMetrics.height()))
+
+    def initStyleOption(self, option, index):
+        # Icons are painted by paint(), not by the style
+        QStyledItemDelegate.initStyleOption(self, option, index)
+
+    def paint(self, painter, option, index):
+        view = option.widget
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = view.style() if view else None
+        if style:
+            style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, view)
+        if view is None:
+            return
+
+        self.watch(view)
+        state = opt.state
+        hover = bool(state & QStyle.StateFlag.State_MouseOver)
+        pressed = self._pressed.isValid() and self._pressed == index
+        expanded = isinstance(view, QTreeView) and view.isExpanded(index)
+        color = self.iconColor(view, hover=hover and not pressed, pressed=pressed,
+                               checked=bool(state & QStyle.StateFlag.State_Selected) or expanded)
+        if not color and (hover or pressed or expanded):
+            color = self.iconColor(view)
+
+        rect = opt.rect.adjusted(self.spacing, 0, -self.spacing, 0)
+        width, height = self.size_ic
+        top = rect.top() + (rect.height() - height) // 2
+        left = rect.left()
+
+        svg = index.data(SvgRole)
+        if svg and color:
+            painter.drawPixmap(left, top, self.pixmap(svg, color, view.devicePixelRatioF()))
+            left += width + self.spacing
+
+        right = rect.right()
+        if index.model().hasChildren(index):
+            open_icon = expanded or (hover and not self.only_click)
+            right_svg = self.minus_svg if open_icon and self.minus_svg else self.right_svg
+            if right_svg and color:
+                painter.drawPixmap(right - width + 1, top, self.pixmap(right_svg, color, view.devicePixelRatioF()))
+            right -= width + self.spacing
+
+        painter.save()
+        painter.setFont(opt.font)
+        painter.setPen(QColor(color) if color else opt.palette.color(QPalette.ColorRole.Text))
+        text_rect = QRect(left, rect.top(), right - left + 1, rect.height())
+        text = opt.fontMetrics.elidedText(opt.text or "", Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+        painter.restore()
+
+
+class QDropTree(QTreeView):
+    """Accordion navigation with QDropButton behaviour for large menus.
+
+    Rows are painted by DropTreeDelegate, so no widget exists per entry and
+    children of a section are loaded only when it is expanded. Clicking a
+    section toggles it and emits ``changeState(expanded)``, the signal
+    QDropButton has, and ``sectionToggled(index, expanded)``, which also
+    says which section it was.
+    """
+
+    changeState = Signal(bool)
+    sectionToggled = Signal(QModelIndex, bool)
+
+    def __init__(self, right_svg: Optional[str] = None, minus_svg: Optional[str] = None,
+                 only_click: bool = True, parent=None):
+        super().__init__(parent)
+        self._pressed = QPersistentModelIndex()
+        self.delegate = DropTreeDelegate(self, right_svg, minus_svg, only_click)
+        self.setItemDelegate(self.delegate)
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        self.setRootIsDecorated(False)
+        self.setExpandsOnDoubleClick(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setMouseTracking(True)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def setIconSize(self, width: Union[int, QSize], height: Optional[int] = None):
+        self.delegate.setSvgSize(width, height)
+        super().setIconSize(QSize(*self.delegate.size_ic))
+        self.viewport().update()
+
+    def drawBranches(self, painter, rect, index):
+        # The right/minus icons already show the section state
+        return
+
+    def mousePressEvent(self, event):
+        self._pressed = QPersistentModelIndex(self.indexAt(event.position().toPoint()))
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        index = self.indexAt(event.position().toPoint())
+        pressed, self._pressed = self._pressed, QPersistentModelIndex()
+        super().mouseReleaseEvent(event)
+        if index.isValid() and pressed == index and self.model().hasChildren(index):
+            expanded = not self.isExpanded(index)
+            self.setExpanded(index, expanded)
+            self.changeState.emit(expanded)
+            self.sectionToggled.emit(index, expanded)
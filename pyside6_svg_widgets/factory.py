@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+from typing import Optional, Tuple, Type, List, Sequence, NamedTuple, Union, Dict
+
+from PySide6.QtWidgets import QWidget
+
+from .QAbstract import SVGRenderButton, SVGRenderIcon, SVGRenderRadioButton, get_color, get_effective_style
+
+
+class SvgWidgetSpec(NamedTuple):
+    svg: str
+    size: Tuple[int, int] = (25, 25)
+    object_name: Optional[str] = None
+    text: Optional[str] = None
+    parent: Optional[QWidget] = None
+
+
+@contextmanager
+def deferred_updates(*widgets: Optional[QWidget]):
+    """Disable repaints of ``widgets`` for the block and restore them afterwards."""
+    paused = []
+    for widget in dict.fromkeys(w for w in widgets if w is not None):
+        if widget.updatesEnabled():
+            widget.setUpdatesEnabled(False)
+            paused.append(widget)
+    try:
+        yield
+    finally:
+        for widget in paused:
+            try:
+                widget.setUpdatesEnabled(True)
+            except RuntimeError:
+                pass
+
+
+def build_svg_widgets(
+        specs: Sequence[Union[SvgWidgetSpec, tuple, dict]],
+        widget_class: Type[QWidget] = SVGRenderButton,
+        parent: Optional[QWidget] = None
+) -> List[QWidget]:
+    """Construct one widget per spec with a single style resolve and render pass.
+
+    Widgets are created without the per-widget 100 ms load timers while the
+    parents have updates disabled. The stylesheet chain is walked once per
+    distinct parent, and every distinct (svg, size, color) is rendered once
+    and shared by all widgets that show it. ``parent`` is used for specs that
+    do not name one. Widgets whose color cannot be resolved yet (no styled
+    parent) fall back to the usual deferred load.
+    """
+    if not issubclass(widget_class, (SVGRenderButton, SVGRenderIcon, SVGRenderRadioButton)):
+        raise TypeError(f"{widget_class.__name__} is not supported by build_svg_widgets")
+
+    specs = [
+        spec if isinstance(spec, SvgWidgetSpec)
+        else SvgWidgetSpec(**spec) if isinstance(spec, dict)
+        else SvgWidgetSpec(*spec)
+        for spec in specs
+    ]
+    parents = [spec.parent or parent for spec in specs]
+    object_name = widget_class.__name__
+
+    widgets = []
+    with deferred_updates(*parents):
+        styles: Dict[int, Optional[str]] = {}
+        for spec, owner in zip(specs, parents):
+            widget = widget_class(None, tuple(spec.size), owner)
+            widget.svg_string = spec.svg
+            if spec.object_name is not None:
+                widget.setObjectName(spec.object_name)
+            if spec.text is not None:
+                widget.setText(spec.text)
+            widgets.append(widget)
+
+            key = id(owner)
+            if key not in styles:
+                styles[key] = get_effective_style(widget)[1]
+            widget.clear_cache = styles[key]
+            if not widget.clear_cache:
+                widget.set_string_svg(spec.svg)
+                continue
+
+            color, _ = get_color(object_name, widget.clear_cache, checked=widget.isChecked())
+            if not color or not spec.svg:
+                continue
+
+            # Renders each (svg, size, color, ratio) once through the shared cache, and
+            # records the state for the raster release
+            widget.applyIcon(color)
+
+    return widgets
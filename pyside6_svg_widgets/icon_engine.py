@@ -0,0 +1,94 @@
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QIconEngine, QIcon, QPixmap, QPainter, QColor
+from PySide6.QtCore import Qt, QSize
+
+from svg_widgets_core.cache import PixmapCache
+
+from .QAbstract import get_effective_style, svg_to_pixmap
+
+
+class SvgIconEngine(QIconEngine):
+    """QIconEngine that colors one SVG per QIcon.Mode and QIcon.State.
+
+    Pixmaps are rendered lazily, the first time a (size, mode, state) is
+    requested, and reused afterwards. Colors map to the ``icon-color`` states:
+    Normal -> normal, Active -> hover, Selected -> checked (falls back to
+    hover), State On -> checked, Disabled -> disabled (falls back to normal
+    drawn at reduced opacity).
+    """
+
+    DISABLED_OPACITY = 0.4
+
+    def __init__(
+            self,
+            svg: str,
+            normal: str,
+            hover: Optional[str] = None,
+            checked: Optional[str] = None,
+            disabled: Optional[str] = None
+    ):
+        super().__init__()
+        self.svg = svg
+        self.colors = {"normal": normal, "hover": hover, "checked": checked, "disabled": disabled}
+        self._cache = PixmapCache("SvgIconEngine", maxsize=None, icon=lambda key: svg)
+
+    def color(self, mode: QIcon.Mode, state: QIcon.State) -> str:
+        colors = self.colors
+        if mode == QIcon.Mode.Disabled:
+            return colors["disabled"] or colors["normal"]
+        if state == QIcon.State.On and colors["checked"]:
+            return colors["checked"]
+        if mode == QIcon.Mode.Selected:
+            return colors["checked"] or colors["hover"] or colors["normal"]
+        if mode == QIcon.Mode.Active:
+            return colors["hover"] or colors["normal"]
+        return colors["normal"]
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        key = (size.width(), size.height(), mode, state)
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        # QIcon asks for device pixels already (size * devicePixelRatio), so render exactly that
+        pixmap = svg_to_pixmap(self.svg, size.width(), size.height(), self.color(mode, state), 1.0)
+        if mode == QIcon.Mode.Disabled and not self.colors["disabled"]:
+            faded = QPixmap(pixmap.size())
+            faded.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(faded)
+            painter.setOpacity(self.DISABLED_OPACITY)
+            painter.drawPixmap(0, 0, pixmap)
+            painter.end()
+            pixmap = faded
+
+        return self._cache.put(key, pixmap)
+
+    def paint(self, painter: QPainter, rect, mode: QIcon.Mode, state: QIcon.State):
+        dpr = painter.device().devicePixelRatioF()
+        painter.drawPixmap(rect, self.pixmap(rect.size() * dpr, mode, state))
+
+    def actualSize(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QSize:
+        return size
+
+    def clone(self) -> "SvgIconEngine":
+        engine = SvgIconEngine(self.svg, **self.colors)
+        engine._cache = self._cache
+        return engine
+
+    def key(self) -> str:
+        return "SvgIconEngine"
+
+
+def themed_icon(svg: str, widget: QWidget, object_name: Optional[str] = None,
+                fallback: QColor = QColor("black")) -> QIcon:
+    """Build a QIcon whose modes follow the ``icon-color`` rules visible from ``widget``.
+
+    ``object_name`` is the selector to look up, ``type(widget).__name__`` by
+    default. Call it again after a theme switch to pick up the new colors.
+    """
+    normal, _ = get_effective_style(widget, object_name=object_name)
+    hover, _ = get_effective_style(widget, hover=True, object_name=object_name)
+    checked, _ = get_effective_style(widget, checked=True, object_name=object_name)
+    return QIcon(SvgIconEngine(svg, normal or fallback.name(), hover, checked))
@@ -0,0 +1,197 @@
+from typing import Optional, Union, Tuple, Sequence, List
+
+from PySide6.QtWidgets import QWidget, QStyle, QStyleOption, QSizePolicy
+from PySide6.QtGui import QPainter
+from PySide6.QtCore import Qt, QSize, QRect, QEvent, Signal
+
+from svg_widgets_core import instrument
+
+from .QAbstract import get_color, get_effective_style, cached_svg_pixmap
+
+
+class SvgIconStrip(QWidget):
+    """A row (or column) of SVG icons in a single widget.
+
+    Replaces dozens of QSvgButton / SVGRenderButton siblings: icons come from
+    the shared pixmap cache, hover and press are hit-tested here and a state
+    change repaints only the rect of the icon it touched. Colors follow the
+    ``icon-color`` rules of ``SvgIconStrip`` (or the object name given to
+    ``set_name``) for normal, :hover, :pressed and :checked.
+    """
+
+    clicked = Signal(int)
+    hovered = Signal(int)
+
+    def __init__(
+            self,
+            icons: Optional[Sequence[str]] = None,
+            size_ic: Tuple[int, int] = (25, 25),
+            orientation: Qt.Orientation = Qt.Orientation.Horizontal,
+            *args,
+            **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.icons: List[str] = list(icons or [])
+        self.size_ic = size_ic
+        self.orientation = orientation
+        self.spacing = 8
+        self.padding = 4
+        self.object_name = None
+        self.clear_cache = None
+        self.checked = set()
+        self._hover = -1
+        self._pressed = -1
+        self.setMouseTracking(True)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+
+    def set_name(self, name):
+        self.setObjectName(name)
+        self.object_name = name
+        self.clear_cache = None
+        self.update()
+
+    def setIcons(self, icons: Sequence[str]):
+        self.icons = list(icons)
+        self._hover = self._pressed = -1
+        self.checked = {i for i in self.checked if i < len(self.icons)}
+        self.updateGeometry()
+        self.update()
+
+    def setIcon(self, index: int, icon: str):
+        self.icons[index] = icon
+        self.update(self.iconRect(index))
+
+    def setChecked(self, index: int, checked: bool = True):
+        if checked:
+            self.checked.add(index)
+        else:
+            self.checked.discard(index)
+        self.update(self.iconRect(index))
+
+    def isChecked(self, index: int) -> bool:
+        return index in self.checked
+
+    def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
+        if isinstance(width, QSize):
+            width, height = width.width(), width.height()
+        self.size_ic = (width, height)
+        self.updateGeometry()
+        self.update()
+
+    def setSpacing(self, spacing: int):
+        self.spacing = spacing
+        self.updateGeometry()
+        self.update()
+
+    def cellSize(self) -> QSize:
+        return QSize(self.size_ic[0] + self.padding * 2, self.size_ic[1] + self.padding * 2)
+
+    def sizeHint(self) -> QSize:
+        cell = self.cellSize()
+        count = len(self.icons)
+        length = count * (cell.width() if self.isHorizontal() else cell.height())
+        length += max(0, count - 1) * self.spacing
+        if self.isHorizontal():
+            return QSize(length, cell.height())
+        return QSize(cell.width(), length)
+
+    def isHorizontal(self) -> bool:
+        return self.orientation == Qt.Orientation.Horizontal
+
+    def iconRect(self, index: int) -> QRect:
+        """Cell of the icon at ``index``, including its padding."""
+        cell = self.cellSize()
+        if self.isHorizontal():
+            return QRect(index * (cell.width() + self.spacing), 0, cell.width(), cell.height())
+        return QRect(0, index * (cell.height() + self.spacing), cell.width(), cell.height())
+
+    def indexAt(self, pos) -> int:
+        cell = self.cellSize()
+        x, y = pos.x(), pos.y()
+        step = (cell.width() if self.isHorizontal() else cell.height()) + self.spacing
+        offset = x if self.isHorizontal() else y
+        index = int(offset // step) if offset >= 0 else -1
+        if 0 <= index < len(self.icons) and self.iconRect(index).contains(pos):
+            return index
+        return -1
+
+    def iconColor(self, hover=False, pressed=False, checked=False):
+        object_name = self.object_name or type(self).__name__
+        if self.clear_cache:
+            effective_style, _ = get_color(object_name, self.clear_cache, hover, pressed, checked)
+        else:
+            effective_style, self.clear_cache = get_effective_style(
+                self, hover=hover, pressed=pressed, checked=checked, object_name=object_name
+            )
+        if not effective_style and (hover or pressed or checked):
+            return self.iconColor()
+        return effective_style
+
+    def _setHover(self, index: int):
+        if index == self._hover:
+            return
+        for i in (self._hover, index):
+            if i >= 0:
+                self.update(self.iconRect(i))
+        self._hover = index
+        if index >= 0:
+            self.hovered.emit(index)
+
+    def event(self, e):
+        if e.type() == QEvent.Type.PaletteChange:
+            started = instrument.clock()
+            get_color.cache_clear()
+            self.clear_cache = None
+            self.update()
+            instrument.record("theme_change", started, widget=self)
+        return super().event(e)
+
+    def mouseMoveEvent(self, event):
+        self._setHover(self.indexAt(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self._setHover(-1)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        self._pressed = self.indexAt(event.position().toPoint())
+        if self._pressed >= 0:
+            self.update(self.iconRect(self._pressed))
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        pressed, self._pressed = self._pressed, -1
+        index = self.indexAt(event.position().toPoint())
+        if pressed >= 0:
+            self.update(self.iconRect(pressed))
+        super().mouseReleaseEvent(event)
+        if index >= 0 and index == pressed:
+            self.clicked.emit(index)
+
+    def paintEvent(self, event):
+        started = instrument.clock()
+        painter = QPainter(self)
+        opt = QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, opt, painter, self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        region = event.rect()
+        for index, icon in enumerate(self.icons):
+            rect = self.iconRect(index)
+            if not rect.intersects(region) or not icon:
+                continue
+
+            color = self.iconColor(
+                hover=index == self._hover and self._pressed < 0,
+                pressed=index == self._pressed,
+                checked=index in self.checked,
+            )
+            if not color:
+                continue
+            target = rect.adjusted(self.padding, self.padding, -self.padding, -self.padding)
+            painter.drawPixmap(target, cached_svg_pixmap(icon, *self.size_ic, color, self.devicePixelRatioF()))
+        painter.end()
+        instrument.record("paint", started, widget=self)
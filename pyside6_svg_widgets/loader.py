@@ -0,0 +1,137 @@
+import xml.etree.ElementTree as Et
+from typing import Optional, Callable, Dict, List, NamedTuple
+
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QFile, QIODevice, QByteArray, Signal
+from PySide6.QtGui import QPixmap
+
+from svg_widgets_core import instrument
+
+
+class SvgSource(NamedTuple):
+    path: str
+    data: Optional[QByteArray]
+    root: Optional[Et.Element]
+
+
+def is_inline_svg(source: str) -> bool:
+    return source.lstrip().startswith(("<svg", "<?xml"))
+
+
+def read_svg(path: str) -> SvgSource:
+    """Read and parse an SVG file (or Qt resource); safe to call off the GUI thread."""
+    started = instrument.clock()
+    if is_inline_svg(path):
+        raw = path.encode("utf-8")
+    else:
+        file = QFile(path)
+        if not file.open(QIODevice.OpenModeFlag.ReadOnly):
+            instrument.record("svg_read", started, icon=path)
+            return SvgSource(path, None, None)
+        raw = bytes(file.readAll().data())
+        file.close()
+
+    try:
+        root = Et.fromstring(raw)
+    except Et.ParseError:
+        root = None
+    instrument.record("svg_read", started, icon=path)
+    return SvgSource(path, QByteArray(raw), root)
+
+
+class _Relay(QObject):
+    finished = Signal(str, object)
+
+
+class _ReadTask(QRunnable):
+    def __init__(self, path: str, relay: _Relay):
+        super().__init__()
+        self.path = path
+        self.relay = relay
+
+    def run(self):
+        self.relay.finished.emit(self.path, read_svg(self.path))
+
+
+class SvgLoader(QObject):
+    """Reads SVG files on a worker pool so slow disks never block the GUI thread.
+
+    Sources are kept once read. Requests for a file already being read are
+    coalesced: the file is opened once and every waiting callback is called
+    on the GUI thread with the same SvgSource. ``max_threads`` bounds how
+    many files are read at the same time.
+    """
+
+    ready = Signal(str)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "SvgLoader":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, max_threads: int = 2, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._relay = _Relay()
+        self._relay.finished.connect(self._finished)
+        self._sources: Dict[str, SvgSource] = {}
+        self._waiting: Dict[str, List[Callable[[SvgSource], None]]] = {}
+        self.placeholder: Optional[QPixmap] = None
+
+    def setMaxThreads(self, count: int):
+        self._pool.setMaxThreadCount(max(1, count))
+
+    def setPlaceholder(self, pixmap: Optional[QPixmap]):
+        """Pixmap shown by path-based widgets until their file is read; transparent by default."""
+        self.placeholder = pixmap
+
+    def placeholderPixmap(self, width: int, height: int) -> QPixmap:
+        if self.placeholder is not None:
+            return self.placeholder.scaled(
+                width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+
+    def source(self, path: str) -> Optional[SvgSource]:
+        return self._sources.get(path)
+
+    def request(self, path: str, callback: Callable[[SvgSource], None]) -> Optional[SvgSource]:
+        """Return the source if it is known, otherwise read it and call ``callback`` later."""
+        source = self._sources.get(path)
+        if source is not None:
+            return source
+        if is_inline_svg(path):
+            source = self._sources[path] = read_svg(path)
+            return source
+
+        waiting = self._waiting.get(path)
+        if waiting is not None:
+            waiting.append(callback)
+            return None
+
+        self._waiting[path] = [callback]
+        self._pool.start(_ReadTask(path, self._relay))
+        return None
+
+    def clear(self):
+        """Forget read sources, e.g. after the files changed on disk."""
+        self._sources.clear()
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def _finished(self, path: str, source: SvgSource):
+        if source.data is not None:
+            self._sources[path] = source
+        for callback in self._waiting.pop(path, []):
+            try:
+                callback(source)
+            except RuntimeError:
+                # The widget was deleted while its file was being read
+                pass
+        self.ready.emit(path)
@@ -0,0 +1,71 @@
+"""Byte accounting and a hard memory budget for icon pixmaps.
+
+The caches and the budget live in ``svg_widgets_core.cache`` and are shared
+with pyqt5_svg_widgets; this module adds what the PySide6 widgets hold.
+``report()`` gives bytes per cache (with per-icon breakdown) and an estimate
+per widget class of the icon pixmaps the live widgets reference; ``dump()``
+prints or writes all of it::
+
+    from pyside6_svg_widgets import memory
+
+    memory.set_budget(32 * 1024 * 1024)
+    print(memory.format_report())
+"""
+import json
+from typing import Optional, Dict
+
+from PySide6.QtWidgets import QApplication, QLabel, QAbstractButton
+
+from svg_widgets_core import cache
+from svg_widgets_core.cache import (  # noqa: F401  (re-exported)
+    DEFAULT_BUDGET, CacheInfo, PixmapCache, pixmap_cache, pixmap_bytes,
+    set_budget, budget, total_bytes, enforce_budget
+)
+
+
+def widget_bytes(widget) -> int:
+    """Estimated bytes of the icon pixmaps ``widget`` references.
+
+    Pixmaps shared with a cache or with other widgets are counted for every
+    reference, so this is an upper bound of what releasing the widget frees.
+    """
+    if isinstance(widget, QAbstractButton):
+        icon = widget.icon()
+        return sum(s.width() * s.height() * 4 for s in icon.availableSizes()) if not icon.isNull() else 0
+    if isinstance(widget, QLabel):
+        return pixmap_bytes(widget.pixmap())
+    return 0
+
+
+def report(widgets: bool = True) -> dict:
+    """Bytes per cache (with per-icon breakdown) and per widget class."""
+    data = cache.report()
+
+    classes: Dict[str, dict] = {}
+    app = QApplication.instance()
+    if widgets and app is not None:
+        for widget in app.allWidgets():
+            module = type(widget).__module__ or ""
+            if not module.startswith(__package__):
+                continue
+            size = widget_bytes(widget)
+            entry = classes.setdefault(type(widget).__name__, {"widgets": 0, "bytes": 0})
+            entry["widgets"] += 1
+            entry["bytes"] += size
+
+    data["widget_classes"] = classes
+    return data
+
+
+def format_report(data: Optional[dict] = None) -> str:
+    return cache.format_report(data or report())
+
+
+def dump(path: Optional[str] = None):
+    """Print the report, or write it as JSON to ``path``."""
+    data = report()
+    if path is None:
+        print(format_report(data))
+        return
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2)
@@ -0,0 +1,82 @@
+import warnings
+from typing import Optional, Tuple, Type, List
+
+from PySide6.QtWidgets import QWidget
+
+from .QAbstract import SVGRenderButton, SVGRenderIcon
+
+
+class SvgWidgetPool:
+    """Recycles SVGRenderButton / SVGRenderIcon rows of dynamic lists.
+
+    ``acquire`` hands out an idle widget reassigned to the new SVG, size and
+    objectName, and only constructs one when the pool is empty. A reused
+    widget keeps its resolved stylesheet while it stays under the same
+    parent, and its pixmaps come from the shared render cache, so the hot
+    path has no timers, cursor setup, signal wiring or parent walk.
+    ``release`` hides the widget, drops the connections made by the user on
+    ``clicked``, ``enter`` and ``leave`` and keeps it for the next acquire;
+    above ``limit`` idle widgets it is deleted instead.
+    """
+
+    def __init__(self, widget_class: Type[QWidget] = SVGRenderButton, limit: int = 256):
+        if not issubclass(widget_class, (SVGRenderButton, SVGRenderIcon)):
+            raise TypeError(f"{widget_class.__name__} cannot be pooled")
+        self.widget_class = widget_class
+        self.limit = limit
+        self._idle: List[QWidget] = []
+
+    def __len__(self):
+        return len(self._idle)
+
+    def acquire(
+            self,
+            svg_string: str,
+            size_ic: Tuple[int, int] = (25, 25),
+            object_name: Optional[str] = None,
+            parent: Optional[QWidget] = None
+    ) -> QWidget:
+        while self._idle:
+            widget = self._idle.pop()
+            try:
+                if parent is not None and widget.parentWidget() is not parent:
+                    widget.setParent(parent)
+                    widget.clear_cache = None
+                widget.reassign(svg_string, size_ic, object_name)
+                widget.show()
+                return widget
+            except RuntimeError:
+                # Deleted together with its former parent
+                continue
+
+        widget = self.widget_class(svg_string, size_ic, parent)
+        if object_name is not None:
+            widget.setObjectName(object_name)
+        return widget
+
+    def release(self, widget: QWidget):
+        try:
+            widget.hide()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                for signal in (widget.clicked, widget.enter, widget.leave):
+                    try:
+                        signal.disconnect()
+                    except (RuntimeError, TypeError):
+                        pass
+        except RuntimeError:
+            return
+
+        if len(self._idle) >= self.limit:
+            widget.deleteLater()
+            return
+        self._idle.append(widget)
+
+    def clear(self):
+        """Delete every idle widget."""
+        for widget in self._idle:
+            try:
+                widget.deleteLater()
+            except RuntimeError:
+                pass
+        self._idle.clear()
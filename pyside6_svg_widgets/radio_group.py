@@ -0,0 +1,90 @@
+from typing import Optional, Union, Dict, List
+
+from PySide6.QtCore import QObject, Signal
+
+from .QAbstract import SVGRenderRadioButton, get_color, get_effective_style
+from .scheduler import IconUpdateScheduler
+
+
+class SvgRadioGroup(QObject):
+    """Exclusive group of SVGRenderRadioButton.
+
+    A change touches only the previously and the newly checked button. Their
+    colors are resolved once per (stylesheet, checked) and their pixmaps come
+    from the shared render cache through ``applyIcon``. Other buttons of the group are not
+    repainted, restyled or re-rendered.
+    """
+
+    changed = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buttons: List[SVGRenderRadioButton] = []
+        self._index: Dict[SVGRenderRadioButton, int] = {}
+        self._checked: Optional[SVGRenderRadioButton] = None
+        self._colors: Dict[tuple, Optional[str]] = {}
+
+    def addButton(self, button: SVGRenderRadioButton):
+        button.radio_group = self
+        button.setCheckable(True)
+        button.setAutoExclusive(False)
+        self._index[button] = len(self.buttons)
+        self.buttons.append(button)
+        button.clicked.connect(lambda checked=False, b=button: self._on_clicked(b))
+        if button.isChecked():
+            self.setChecked(button)
+
+    def checkedButton(self) -> Optional[SVGRenderRadioButton]:
+        return self._checked
+
+    def checkedIndex(self) -> int:
+        return self._index.get(self._checked, -1)
+
+    def setChecked(self, button: Union[int, SVGRenderRadioButton]):
+        if isinstance(button, int):
+            button = self.buttons[button]
+
+        previous, self._checked = self._checked, button
+        if previous is not None and previous is not button:
+            previous.setChecked(False)
+            self.refresh(previous)
+        button.setChecked(True)
+        self.refresh(button)
+        if previous is not button:
+            self.changed.emit(self._index[button])
+
+    def _on_clicked(self, button: SVGRenderRadioButton):
+        if button is self._checked:
+            # Exclusive: a click on the checked button keeps it checked
+            button.setChecked(True)
+            self.refresh(button)
+            return
+        self.setChecked(button)
+
+    def invalidate(self):
+        """Forget resolved colors, e.g. after a theme switch."""
+        self._colors.clear()
+
+    def color(self, button: SVGRenderRadioButton, checked: bool) -> Optional[str]:
+        # The button's own resolved stylesheet: buttons of one group may sit under differently styled parents
+        object_name = type(button).__name__
+        if not button.clear_cache:
+            _, button.clear_cache = get_effective_style(button, checked=checked)
+        style_sheet = button.clear_cache
+        if not style_sheet:
+            return None
+
+        key = (object_name, style_sheet, checked)
+        if key not in self._colors:
+            self._colors[key] = get_color(object_name, style_sheet, checked=checked)[0]
+        return self._colors[key]
+
+    def refresh(self, button: SVGRenderRadioButton):
+        if button.closed:
+            return
+        # The click also scheduled an update with the button's own (unchecked) state
+        IconUpdateScheduler.instance().cancel(button)
+        color = self.color(button, button.isChecked())
+        if color:
+            # Through applyIcon, so the raster release restores this state
+            button.applyIcon(color)
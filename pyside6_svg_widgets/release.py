@@ -0,0 +1,158 @@
+import weakref
+
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QWidget
+
+
+class RasterReleasePolicy(QObject):
+    """Drops the icon rasters of widgets nobody sees and restores them on demand.
+
+    A widget releases its rasters in ``hideEvent`` (closed tabs, collapsed
+    panels, stacked pages) and, with an idle timeout set, when it has not been
+    painted for that long. The rasters stay in the shared pixmap caches,
+    which keep them under the memory budget or, once evicted, weakly while
+    another widget still shows them. ``showEvent`` restores the icon from
+    there or by rendering it again; a widget released by the idle timeout and
+    painted again is restored on the next event loop pass, outside its
+    paintEvent. Updates that arrive while a widget is released only record
+    the latest state.
+
+    Widgets take part through ``RasterReleaseMixin``; a widget without
+    ``icon_args`` has nothing to restore from and is left alone.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "RasterReleasePolicy":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.enabled = True
+        self.idle_timeout = 0
+        self.releases = 0
+        self.restores = 0
+        self._painted = weakref.WeakKeyDictionary()
+        self._pending = weakref.WeakSet()
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.sweep)
+        self._restore_timer = QTimer(self)
+        self._restore_timer.setSingleShot(True)
+        self._restore_timer.setInterval(0)
+        self._restore_timer.timeout.connect(self.restorePending)
+
+    def setEnabled(self, enabled: bool):
+        """With the policy disabled widgets keep their rasters; released ones come back on show."""
+        self.enabled = enabled
+        if not enabled:
+            self._timer.stop()
+        elif self.idle_timeout:
+            self._timer.start()
+
+    def setIdleTimeout(self, msec: int):
+        """Also release shown widgets scrolled out of view and not painted for ``msec`` ms; 0 disables."""
+        self.idle_timeout = msec
+        if msec and self.enabled:
+            self._timer.start(max(msec // 2, 100))
+        else:
+            self._timer.stop()
+
+    def hidden(self, widget: QWidget):
+        if self.enabled:
+            self.release(widget)
+
+    def shown(self, widget: QWidget):
+        if widget.rasters_released:
+            self.restore(widget)
+        if self.enabled:
+            self._painted[widget] = self._clock.elapsed()
+
+    def painted(self, widget: QWidget):
+        """Called from paintEvent; a released widget is queued for restorePending() rather than changed mid-paint."""
+        if widget.rasters_released:
+            self._pending.add(widget)
+            self._restore_timer.start()
+        if self.enabled:
+            self._painted[widget] = self._clock.elapsed()
+
+    def release(self, widget: QWidget):
+        if widget.rasters_released or widget.icon_args is None:
+            return
+        widget.rasters_released = True
+        widget.releaseRasters()
+        self._painted.pop(widget, None)
+        self.releases += 1
+
+    def restore(self, widget: QWidget):
+        widget.rasters_released = False
+        widget.restoreRasters()
+        self.restores += 1
+
+    def restorePending(self):
+        """Restore the released widgets painted since the last pass; hidden ones wait for their showEvent."""
+        pending, self._pending = list(self._pending), weakref.WeakSet()
+        for widget in pending:
+            try:
+                if widget.rasters_released and widget.isVisible():
+                    self.restore(widget)
+            except RuntimeError:
+                # Deleted in the meantime
+                pass
+
+    def sweep(self):
+        """Release the widgets not painted within the idle timeout and not on screen now.
+
+        Releasing a widget that is still exposed would only repaint and restore it.
+        """
+        if not self.enabled or not self.idle_timeout:
+            return
+        deadline = self._clock.elapsed() - self.idle_timeout
+        for widget, painted in list(self._painted.items()):
+            if painted > deadline:
+                continue
+            try:
+                if widget.visibleRegion().isEmpty():
+                    self.release(widget)
+            except RuntimeError:
+                # Deleted in the meantime
+                self._painted.pop(widget, None)
+
+
+class RasterReleaseMixin:
+    """The RasterReleasePolicy hooks of an icon widget; put it before the Qt base class.
+
+    The widget keeps its shown raster in ``raster``, the last ``applyIcon``
+    arguments in ``icon_args`` and ``rasters_released``, and drops what it
+    displays in ``clearIcon``. ``applyIcon`` of a released widget only
+    records ``icon_args``.
+    """
+    transition = None
+
+    def clearIcon(self):
+        self.setIcon(QIcon())
+
+    def releaseRasters(self):
+        """Drop the icon raster; it stays in the shared caches for restoreRasters()."""
+        if self.transition:
+            self.transition.stop()
+            self.transition.target = None
+        self.raster = None
+        self.clearIcon()
+
+    def restoreRasters(self):
+        if self.icon_args:
+            self.applyIcon(*self.icon_args)
+
+    def hideEvent(self, event):
+        RasterReleasePolicy.instance().hidden(self)
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        RasterReleasePolicy.instance().shown(self)
+        super().showEvent(event)
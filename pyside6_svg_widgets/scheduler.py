@@ -0,0 +1,91 @@
+from typing import Dict, Tuple
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QWidget
+
+from svg_widgets_core import instrument
+
+from .transition import FRAME_INTERVAL
+
+
+class IconUpdateScheduler(QObject):
+    """Applies icon state changes at most once per widget per frame.
+
+    The widgets' event handlers call ``scheduleIcon``, which only records the
+    latest target here. On the next frame tick each widget's ``applyIcon``
+    runs once with the last arguments it was given, so the states a fast
+    mouse sweep passes through in between are never rendered. Calls with an
+    empty color are dropped, as ``applyIcon`` would ignore them anyway.
+    A public ``updateIcon`` call goes through ``apply`` and takes effect
+    before it returns.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "IconUpdateScheduler":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.enabled = True
+        self._pending: Dict[QWidget, Tuple] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_INTERVAL)
+        self._timer.timeout.connect(self.flush)
+
+    def setEnabled(self, enabled: bool):
+        """With coalescing disabled every update is applied immediately."""
+        self.enabled = enabled
+        if not enabled:
+            self.flush()
+
+    def schedule(self, widget: QWidget, color, *args):
+        if not color:
+            return
+        if not self.enabled:
+            self._apply(widget, (color,) + args)
+            return
+
+        self._pending[widget] = (color,) + args
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def apply(self, widget: QWidget, color, *args):
+        """Apply an update now, in place of the one pending for ``widget``."""
+        self._pending.pop(widget, None)
+        if color:
+            self._apply(widget, (color,) + args)
+
+    def cancel(self, widget: QWidget):
+        self._pending.pop(widget, None)
+
+    def flush(self, widget: QWidget = None):
+        """Apply pending updates now, of one widget or of all of them."""
+        if widget is not None:
+            pending = {widget: self._pending.pop(widget)} if widget in self._pending else {}
+        else:
+            pending, self._pending = self._pending, {}
+            self._timer.stop()
+
+        for target, args in pending.items():
+            try:
+                self._apply(target, args)
+            except RuntimeError:
+                # Deleted before its frame came
+                pass
+
+    @staticmethod
+    def _apply(widget: QWidget, args: Tuple):
+        if not instrument.active:
+            widget.applyIcon(*args)
+            return
+
+        with instrument.scope(type(widget).__name__):
+            started = instrument.clock()
+            widget.applyIcon(*args)
+            instrument.record("update_icon", started, widget=widget,
+                              icon=getattr(widget, "svg_string", None) or getattr(widget, "svg_path", None))
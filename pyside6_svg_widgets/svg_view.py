@@ -0,0 +1,208 @@
+from typing import Optional, Union, Tuple, Sequence
+
+from PySide6.QtWidgets import (
+    QListView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QAbstractItemView
+)
+from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import (
+    Qt, QSize, QAbstractListModel, QModelIndex, QPersistentModelIndex, QEvent
+)
+
+from svg_widgets_core.cache import PixmapCache
+
+from .QAbstract import get_color, get_effective_style, svg_to_pixmap
+
+SvgRole = Qt.ItemDataRole.UserRole + 1
+
+
+class SvgIconModel(QAbstractListModel):
+    """Flat list of (svg, text) items. Holds data only, no pixmaps or widgets."""
+
+    def __init__(self, items: Optional[Sequence] = None, parent=None):
+        super().__init__(parent)
+        self._items = [self._item(i) for i in items or []]
+
+    @staticmethod
+    def _item(item) -> Tuple[str, str]:
+        if isinstance(item, str):
+            return item, ""
+        svg, text = item
+        return svg, text
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+
+        svg, text = self._items[index.row()]
+        if role == SvgRole:
+            return svg
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return text or None
+        return None
+
+    def setItems(self, items: Sequence):
+        self.beginResetModel()
+        self._items = [self._item(i) for i in items]
+        self.endResetModel()
+
+    def appendItems(self, items: Sequence):
+        items = [self._item(i) for i in items]
+        if not items:
+            return
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._items.extend(items)
+        self.endInsertRows()
+
+
+class SvgIconDelegate(QStyledItemDelegate):
+    """Paints the SVG from ``svg_role`` colored by the view's ``icon-color`` rules.
+
+    Works for any item view (list, table, tree). Colors are looked up like the
+    widgets do, with ``object_name`` (the view's class name by default) as the
+    selector: hover follows the mouse, pressed follows the mouse button and
+    checked is used for selected or check-marked items. Rasters are kept in a
+    bounded LRU, so memory follows the number of distinct icons on screen and
+    not the size of the model.
+    """
+
+    def __init__(
+            self,
+            parent=None,
+            icon_size: Tuple[int, int] = (25, 25),
+            cache_limit: int = 512,
+            svg_role: int = SvgRole,
+            object_name: Optional[str] = None,
+            alignment: Optional[Qt.AlignmentFlag] = None
+    ):
+        super().__init__(parent)
+        self.size_ic = icon_size
+        self.cache_limit = cache_limit
+        self.svg_role = svg_role
+        self.object_name = object_name
+        self.alignment = alignment
+        self.stylecode = None
+        self._pixmaps = PixmapCache(type(self).__name__, cache_limit)
+        self._pressed = QPersistentModelIndex()
+        self._view = None
+        if isinstance(parent, QAbstractItemView):
+            self.watch(parent)
+
+    def watch(self, view: QAbstractItemView):
+        """Track presses and theme changes of ``view``. Done on first paint otherwise."""
+        if self._view is view:
+            return
+        if self._view is not None:
+            self._view.removeEventFilter(self)
+            self._view.viewport().removeEventFilter(self)
+        self._view = view
+        view.installEventFilter(self)
+        view.viewport().installEventFilter(self)
+        view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+
+    def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
+        if isinstance(width, QSize):
+            width, height = width.width(), width.height()
+        self.size_ic = (width, height)
+
+    def invalidate(self):
+        """Forget resolved styles and rasters, e.g. after a theme switch."""
+        self.stylecode = None
+        self._pixmaps.clear()
+
+    def pressedIndex(self) -> QModelIndex:
+        return QModelIndex(self._pressed)
+
+    def eventFilter(self, obj, event):
+        view = self._view
+        if view is None:
+            return False
+
+        etype = event.type()
+        if obj is view and etype in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            get_color.cache_clear()
+            self.invalidate()
+        elif obj is view.viewport() and etype == QEvent.Type.MouseButtonPress:
+            self._setPressed(view, view.indexAt(event.position().toPoint()))
+        elif obj is view.viewport() and etype == QEvent.Type.MouseButtonRelease:
+            self._setPressed(view, QModelIndex())
+        return False
+
+    def _setPressed(self, view, index):
+        previous = self.pressedIndex()
+        self._pressed = QPersistentModelIndex(index)
+        for i in (previous, index):
+            if i.isValid():
+                view.viewport().update(view.visualRect(i))
+
+    def iconColor(self, view, hover=False, pressed=False, checked=False):
+        object_name = self.object_name or type(view).__name__
+        if self.stylecode:
+            color, _ = get_color(object_name, self.stylecode, hover, pressed, checked)
+        else:
+            color, self.stylecode = get_effective_style(
+                view, hover=hover, pressed=pressed, checked=checked, object_name=object_name
+            )
+        return color
+
+    def pixmap(self, svg: str, color: str, dpr: float = 1.0) -> QPixmap:
+        key = (svg, self.size_ic, color, dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+        return self._pixmaps.put(key, svg_to_pixmap(svg, *self.size_ic, color, dpr))
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        svg = index.data(self.svg_role)
+        view = option.widget
+        if not isinstance(svg, str) or not svg or view is None:
+            return
+
+        self.watch(view)
+        state = option.state
+        check_state = index.data(Qt.ItemDataRole.CheckStateRole)
+        checked = bool(state & QStyle.StateFlag.State_Selected) or (
+            check_state is not None and Qt.CheckState(check_state) == Qt.CheckState.Checked
+        )
+        color = self.iconColor(
+            view,
+            hover=bool(state & QStyle.StateFlag.State_MouseOver),
+            pressed=self._pressed.isValid() and self._pressed == index,
+            checked=checked,
+        )
+        if not color:
+            return
+
+        option.icon = QIcon(self.pixmap(svg, color, view.devicePixelRatioF()))
+        option.decorationSize = QSize(*self.size_ic)
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+        if self.alignment is not None:
+            option.decorationAlignment = self.alignment
+
+
+class SvgIconView(QListView):
+    """Icon grid over a SvgIconModel; only visible cells are ever rasterized."""
+
+    def __init__(self, parent=None, icon_size: Tuple[int, int] = (48, 48)):
+        super().__init__(parent)
+        self.delegate = SvgIconDelegate(self, icon_size)
+        self.setItemDelegate(self.delegate)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setIconSize(QSize(*icon_size))
+        self.setMouseTracking(True)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def setSvgSize(self, width: Union[int, QSize], height: Optional[int] = None):
+        self.delegate.setSvgSize(width, height)
+        self.setIconSize(QSize(*self.delegate.size_ic))
+        self.viewport().update()
@@ -0,0 +1,157 @@
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer, QSize, Qt
+from PySide6.QtGui import QPixmap, QPainter, QIcon
+from PySide6.QtWidgets import (
+    QWidget, QStyle, QStylePainter, QStyleOptionButton, QStyleOptionToolButton,
+    QRadioButton, QToolButton
+)
+
+FRAME_INTERVAL = 16
+
+
+class TransitionDriver(QObject):
+    """One timer that advances every running HoverTransition."""
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "TransitionDriver":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._active = set()
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._timer = QTimer(self)
+        self._timer.setInterval(FRAME_INTERVAL)
+        self._timer.timeout.connect(self._tick)
+
+    def now(self) -> int:
+        return self._clock.elapsed()
+
+    def add(self, transition: "HoverTransition"):
+        self._active.add(transition)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def remove(self, transition: "HoverTransition"):
+        self._active.discard(transition)
+        if not self._active:
+            self._timer.stop()
+
+    def _tick(self):
+        now = self.now()
+        for transition in list(self._active):
+            if transition.advance(now):
+                self._active.discard(transition)
+
+        if not self._active:
+            self._timer.stop()
+
+
+class HoverTransition:
+    """Cross-fade between two already rendered state pixmaps.
+
+    Only the two pixmaps passed to ``start`` are ever drawn, so a running
+    fade costs compositing and never re-renders the SVG.
+    """
+
+    def __init__(self, widget: QWidget, duration: int = 150):
+        self.widget = widget
+        self.duration = duration
+        self.source: Optional[QPixmap] = None
+        self.target: Optional[QPixmap] = None
+        self.progress = 1.0
+        self._started = 0
+
+    @property
+    def active(self) -> bool:
+        return self.progress < 1.0 and self.source is not None
+
+    def start(self, pixmap: QPixmap, size: Tuple[int, int]):
+        """Fade from the currently shown pixmap to ``pixmap``."""
+        if self.target is not None and self.target.cacheKey() == pixmap.cacheKey():
+            return
+
+        dpr = pixmap.devicePixelRatio()
+        device_size = QSize(*size) * dpr
+        if pixmap.size() != device_size:
+            pixmap = pixmap.scaled(
+                device_size, Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            pixmap.setDevicePixelRatio(dpr)
+
+        driver = TransitionDriver.instance()
+        if self.target is None or self.target.size() != pixmap.size():
+            self.stop()
+            self.target = pixmap
+            return
+
+        self.source = self.frame() if self.active else self.target
+        self.target = pixmap
+        self.progress = 0.0
+        self._started = driver.now()
+        driver.add(self)
+
+    def stop(self):
+        self.progress = 1.0
+        self.source = None
+        TransitionDriver.instance().remove(self)
+
+    def advance(self, now: int) -> bool:
+        """Move the fade to ``now``; returns True once it has finished."""
+        if self.duration <= 0:
+            self.progress = 1.0
+        else:
+            self.progress = min(1.0, (now - self._started) / self.duration)
+
+        try:
+            self.widget.update()
+        except RuntimeError:
+            self.progress = 1.0
+
+        if self.progress >= 1.0:
+            self.source = None
+            return True
+        return False
+
+    def frame(self) -> QPixmap:
+        """Blend source and target at the current progress."""
+        if not self.active:
+            return self.target
+
+        pixmap = QPixmap(self.target.size())
+        pixmap.setDevicePixelRatio(self.target.devicePixelRatio())
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Plus)
+        painter.setOpacity(1.0 - self.progress)
+        painter.drawPixmap(0, 0, self.source)
+        painter.setOpacity(self.progress)
+        painter.drawPixmap(0, 0, self.target)
+        painter.end()
+        return pixmap
+
+
+def paint_button_transition(button, transition: HoverTransition):
+    """Draw a style-painted button with the blended frame as its icon."""
+    painter = QStylePainter(button)
+    if isinstance(button, QToolButton):
+        opt = QStyleOptionToolButton()
+        button.initStyleOption(opt)
+        opt.icon = QIcon(transition.frame())
+        painter.drawComplexControl(QStyle.ComplexControl.CC_ToolButton, opt)
+        return
+
+    opt = QStyleOptionButton()
+    button.initStyleOption(opt)
+    opt.icon = QIcon(transition.frame())
+    if isinstance(button, QRadioButton):
+        painter.drawControl(QStyle.ControlElement.CE_RadioButton, opt)
+    else:
+        painter.drawControl(QStyle.ControlElement.CE_PushButton, opt)
@@ -0,0 +1,9 @@
+"""Binding-independent core of pyside6_svg_widgets and pyqt5_svg_widgets.
+
+Nothing here imports Qt. The widget packages are thin adapters on top:
+
+- ``instrument``: counters, timings and Chrome traces of the render pipeline
+- ``style``: stylesheet parsing and the memoized ``icon-color`` lookup
+- ``cache``: byte-accounted pixmap caches under one global memory budget
+- ``render``: rendering an SVG into a pixmap and filling it with the icon color
+"""
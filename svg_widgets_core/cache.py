@@ -0,0 +1,220 @@
+"""Byte-accounted pixmap caches under one global memory budget.
+
+Every PixmapCache registers itself here and reports how many bytes it holds,
+in total and per icon. When the caches together exceed the budget, the least
+recently used pixmaps are evicted, starting with the cache holding the most
+bytes. Pixmaps are only asked for ``width()``, ``height()``, ``depth()`` and
+``isNull()``, so the caches hold QPixmap or QImage of either binding.
+
+Behind the LRU every cache keeps a weak reference to each pixmap it handed
+out. A pixmap that was evicted but is still held elsewhere, e.g. by a
+visible widget, is taken back on the next lookup instead of being rendered
+again, and is not counted against the budget while it is out.
+"""
+import weakref
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from typing import Callable, Optional, Dict, Hashable
+
+from . import instrument
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_budget: Optional[int] = DEFAULT_BUDGET
+_caches = weakref.WeakSet()
+
+
+def pixmap_bytes(pixmap) -> int:
+    """Bytes of the raster behind a QPixmap or QImage."""
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+def set_budget(limit: Optional[int]):
+    """Cap the bytes held by all pixmap caches together; ``None`` removes the cap."""
+    global _budget
+    _budget = limit
+    enforce_budget()
+
+
+def budget() -> Optional[int]:
+    return _budget
+
+
+def total_bytes() -> int:
+    return sum(cache.bytes for cache in list(_caches))
+
+
+def enforce_budget():
+    if _budget is None:
+        return
+    total = total_bytes()
+    while total > _budget:
+        caches = [cache for cache in list(_caches) if cache.bytes]
+        if not caches:
+            return
+        total -= max(caches, key=lambda cache: cache.bytes).evict_oldest()
+
+
+class PixmapCache:
+    """LRU of pixmaps that knows their size in bytes.
+
+    Usable as an object (``get``/``put``) or, through ``pixmap_cache``, as a
+    drop-in for ``functools.lru_cache`` on render functions. ``icon`` maps
+    a key to the icon it belongs to, for the per-icon breakdown.
+    ``revived`` counts lookups answered from the weak references.
+    """
+
+    def __init__(self, name: str, maxsize: Optional[int] = 128,
+                 icon: Callable[[Hashable], object] = lambda key: key[0]):
+        self.name = name
+        self.maxsize = maxsize
+        self.icon = icon
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revived = 0
+        self._items: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._weak = weakref.WeakValueDictionary()
+        _caches.add(self)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return item[0]
+
+        pixmap = self._weak.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.revived += 1
+        return self.put(key, pixmap)
+
+    def put(self, key, pixmap):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+
+        size = pixmap_bytes(pixmap)
+        self._items[key] = (pixmap, size)
+        self.bytes += size
+        try:
+            self._weak[key] = pixmap
+        except TypeError:
+            # Not weakly referenceable (e.g. None): only the LRU keeps it
+            pass
+        while self.maxsize is not None and len(self._items) > self.maxsize:
+            self.evict_oldest()
+        enforce_budget()
+        return pixmap
+
+    def evict_oldest(self) -> int:
+        """Drop the least recently used pixmap; returns the bytes freed."""
+        if not self._items:
+            return 0
+        _, (_, size) = self._items.popitem(last=False)
+        self.bytes -= size
+        self.evictions += 1
+        return size
+
+    def clear(self):
+        self._items.clear()
+        self._weak.clear()
+        self.bytes = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._items))
+
+    def per_icon(self) -> Dict[str, int]:
+        icons: Dict[str, int] = {}
+        for key, (_, size) in self._items.items():
+            name = instrument.icon_name(self.icon(key))
+            icons[name] = icons.get(name, 0) + size
+        return icons
+
+    def report(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "bytes": self.bytes,
+            "entries": len(self._items),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "revived": self.revived,
+            "per_icon": self.per_icon(),
+        }
+
+
+def pixmap_cache(name: str, maxsize: Optional[int] = 128):
+    """Memoize a ``(svg, ...) -> QPixmap`` function in a PixmapCache.
+
+    The wrapper keeps the ``cache_info()`` / ``cache_clear()`` interface of
+    ``functools.lru_cache``.
+    """
+    def decorate(function):
+        cache = PixmapCache(name, maxsize)
+
+        @wraps(function)
+        def cached(*args):
+            pixmap = cache.get(args)
+            if pixmap is None:
+                pixmap = cache.put(args, function(*args))
+            return pixmap
+
+        cached.cache = cache
+        cached.cache_info = cache.cache_info
+        cached.cache_clear = cache.clear
+        return cached
+
+    return decorate
+
+
+def report() -> dict:
+    """Bytes per cache name, with the per-icon breakdown."""
+    caches: Dict[str, dict] = {}
+    for cache in list(_caches):
+        entry = cache.report()
+        merged = caches.get(cache.name)
+        if merged is None:
+            caches[cache.name] = entry
+            continue
+        for field in ("bytes", "entries", "hits", "misses", "evictions", "revived"):
+            merged[field] += entry[field]
+        for icon, size in entry["per_icon"].items():
+            merged["per_icon"][icon] = merged["per_icon"].get(icon, 0) + size
+
+    return {
+        "budget": _budget,
+        "cache_bytes": sum(c["bytes"] for c in caches.values()),
+        "caches": caches,
+    }
+
+
+def format_report(data: dict) -> str:
+    lines = [f"pixmap caches: {data['cache_bytes'] / 1024:.1f} KiB"
+             + (f" of {data['budget'] / 1024:.0f} KiB budget" if data["budget"] else "")]
+    for name, cache in sorted(data["caches"].items(), key=lambda item: -item[1]["bytes"]):
+        lines.append(f"  {name:<24} {cache['bytes'] / 1024:>10.1f} KiB  {cache['entries']:>5} entries  "
+                     f"{cache['evictions']:>5} evicted")
+        for icon, size in sorted(cache["per_icon"].items(), key=lambda item: -item[1])[:10]:
+            lines.append(f"    {icon[:40]:<40} {size / 1024:>10.1f} KiB")
+    if data.get("widget_classes"):
+        lines.append("widgets (icon bytes referenced):")
+        for name, entry in sorted(data["widget_classes"].items(), key=lambda item: -item[1]["bytes"]):
+            lines.append(f"  {name:<24} {entry['bytes'] / 1024:>10.1f} KiB  {entry['widgets']:>5} widgets")
+    return "\n".join(lines)
@@ -0,0 +1,294 @@
+"""Opt-in counters and timings for the style lookup and render pipeline.
+
+Shared by both bindings (``pyside6_svg_widgets.instrument`` is this module).
+Disabled by default. While disabled, ``clock()`` returns 0 and ``record()``
+returns immediately, which is all the instrumented code pays::
+
+    from pyside6_svg_widgets import instrument
+
+    instrument.enable()
+    ...                     # use the UI
+    print(instrument.stats())
+    instrument.reset()
+
+Stages recorded: ``style_walk`` (get_effective_style, with parent-walk
+depth), ``get_color`` (stylesheet parses, i.e. cache misses), ``renderer``
+(QSvgRenderer construction), ``rasterize`` (render and color fill),
+``update_icon`` (one icon update of a widget), ``paint``, ``theme_change``
+and ``svg_read`` (file reads of SvgLoader). Each stage is also broken down
+per widget class and per icon when those are known.
+
+Every span can also be kept in a bounded ring buffer and saved as Chrome
+trace-event JSON, which chrome://tracing and https://ui.perfetto.dev open::
+
+    instrument.start_trace(capacity=200_000)
+    ...
+    instrument.export_trace("ui.trace.json")
+"""
+import json
+import os
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+enabled = False
+tracing = False
+active = False
+
+_trace: Optional[deque] = None
+_thread_names: Dict[int, str] = {}
+
+_scope: Optional[str] = None
+_stages: Dict[str, "Stat"] = {}
+_by_class: Dict[tuple, "Stat"] = {}
+_by_icon: Dict[tuple, "Stat"] = {}
+_depths: Counter = Counter()
+_caches: Dict[str, Callable] = {}
+_cache_base: Dict[str, tuple] = {}
+
+
+class Stat:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 4) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+def _update_active():
+    global active
+    active = enabled or tracing
+
+
+def enable(on: bool = True):
+    global enabled
+    enabled = on
+    _update_active()
+
+
+def disable():
+    enable(False)
+
+
+def clock() -> float:
+    """Start of a measured span, 0 when instrumentation is off."""
+    return time.perf_counter() if active else 0.0
+
+
+def icon_name(svg) -> str:
+    """Short label of an icon: the file path, or a checksum of inline SVG."""
+    if not isinstance(svg, str):
+        return type(svg).__name__
+    return _icon_label(svg)
+
+
+# Bounded: inline SVG strings are the keys, and a long session sees many of them
+@lru_cache(maxsize=1024)
+def _icon_label(svg: str) -> str:
+    if svg.lstrip().startswith("<"):
+        return "<svg %08x>" % zlib.crc32(svg.encode("utf-8"))
+    return svg
+
+
+def widget_label(widget) -> str:
+    try:
+        name = widget.objectName()
+    except RuntimeError:
+        name = ""
+    return f"{type(widget).__name__}#{name or '%x' % id(widget)}"
+
+
+def record(stage: str, started: float, widget_class: Optional[str] = None, icon=None,
+           depth: Optional[int] = None, widget=None):
+    """Close the span opened by ``clock()``; no-op when it was opened while disabled."""
+    if not started:
+        return
+    elapsed = time.perf_counter() - started
+    if widget is not None and widget_class is None:
+        widget_class = type(widget).__name__
+
+    trace = _trace
+    if tracing and trace is not None:
+        args = {}
+        if widget is not None:
+            args["widget"] = widget_label(widget)
+        if widget_class or _scope:
+            args["class"] = widget_class or _scope
+        if icon is not None:
+            args["icon"] = icon_name(icon)
+        if depth is not None:
+            args["depth"] = depth
+        tid = threading.get_ident()
+        if tid not in _thread_names:
+            _thread_names[tid] = threading.current_thread().name
+        trace.append((stage, started, elapsed, tid, args))
+
+    if not enabled:
+        return
+
+    stat = _stages.get(stage)
+    if stat is None:
+        stat = _stages[stage] = Stat()
+    stat.add(elapsed)
+
+    widget_class = widget_class or _scope
+    if widget_class:
+        key = (stage, widget_class)
+        stat = _by_class.get(key)
+        if stat is None:
+            stat = _by_class[key] = Stat()
+        stat.add(elapsed)
+
+    if icon is not None:
+        key = (stage, icon_name(icon))
+        stat = _by_icon.get(key)
+        if stat is None:
+            stat = _by_icon[key] = Stat()
+        stat.add(elapsed)
+
+    if depth is not None:
+        _depths[depth] += 1
+
+
+@contextmanager
+def scope(widget_class: str):
+    """Attribute spans recorded inside the block to ``widget_class``."""
+    global _scope
+    previous, _scope = _scope, widget_class
+    try:
+        yield
+    finally:
+        _scope = previous
+
+
+def watch_cache(name: str, cached: Callable):
+    """Report hit rates of an ``lru_cache`` decorated function under ``name``."""
+    _caches[name] = cached
+    info = cached.cache_info()
+    _cache_base[name] = (info.hits, info.misses)
+
+
+def start_trace(capacity: int = 100_000):
+    """Keep the last ``capacity`` spans; older ones are dropped as new ones arrive."""
+    global _trace, tracing
+    _trace = deque(_trace or (), maxlen=capacity)
+    _thread_names.setdefault(threading.main_thread().ident, "GUI")
+    tracing = True
+    _update_active()
+
+
+def stop_trace():
+    """Stop recording spans; the buffer is kept for export_trace()."""
+    global tracing
+    tracing = False
+    _update_active()
+
+
+def clear_trace():
+    if _trace is not None:
+        _trace.clear()
+
+
+def trace_events() -> list:
+    """The buffered spans as Chrome trace events (``ph: X``, microseconds)."""
+    pid = os.getpid()
+    events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "svg widgets"}}]
+    for tid, name in _thread_names.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+
+    for stage, started, elapsed, tid, args in list(_trace or ()):
+        events.append({
+            "name": stage,
+            "cat": "svg",
+            "ph": "X",
+            "ts": round(started * 1e6, 3),
+            "dur": round(elapsed * 1e6, 3),
+            "pid": pid,
+            "tid": tid,
+            "args": args,
+        })
+    return events
+
+
+def export_trace(path: str) -> int:
+    """Write the buffered spans to ``path`` as Chrome trace JSON; returns the span count."""
+    events = trace_events()
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+    return sum(1 for e in events if e["ph"] == "X")
+
+
+def reset():
+    """Drop every counter and the icon labels; cache hit rates restart from the current totals."""
+    _stages.clear()
+    _by_class.clear()
+    _by_icon.clear()
+    _depths.clear()
+    _icon_label.cache_clear()
+    for name, cached in _caches.items():
+        info = cached.cache_info()
+        _cache_base[name] = (info.hits, info.misses)
+
+
+def stats() -> dict:
+    """Snapshot of everything recorded since the last reset."""
+    stages = {}
+    for stage, stat in _stages.items():
+        entry = stat.snapshot()
+        entry["by_class"] = {
+            cls: s.snapshot() for (st, cls), s in _by_class.items() if st == stage
+        }
+        entry["by_icon"] = {
+            icon: s.snapshot() for (st, icon), s in _by_icon.items() if st == stage
+        }
+        stages[stage] = entry
+
+    caches = {}
+    for name, cached in _caches.items():
+        info = cached.cache_info()
+        base_hits, base_misses = _cache_base.get(name, (0, 0))
+        hits = info.hits - base_hits
+        misses = info.misses - base_misses
+        # A cache_clear() resets the lru counters below the baseline
+        if hits < 0 or misses < 0:
+            hits, misses = info.hits, info.misses
+        lookups = hits + misses
+        caches[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+
+    walks = sum(_depths.values())
+    return {
+        "enabled": enabled,
+        "tracing": tracing,
+        "stages": stages,
+        "caches": caches,
+        "style_walk_depth": {
+            "max": max(_depths) if _depths else 0,
+            "mean": round(sum(d * n for d, n in _depths.items()) / walks, 3) if walks else 0.0,
+            "histogram": dict(sorted(_depths.items())),
+        },
+    }
@@ -0,0 +1,27 @@
+"""Rasterizing shared by both bindings.
+
+Qt is not imported here either: the caller passes its binding's ``QPainter``
+class and the transparent ``QPixmap`` to paint into. The enum names used
+(``QPainter.CompositionMode_SourceIn``) resolve on PyQt5 and PySide6 alike.
+"""
+from . import instrument
+
+
+def rasterize(renderer, target, painter_class, color=None, icon=None):
+    """Render ``renderer`` over all of ``target`` and fill what it painted with ``color``.
+
+    ``target`` is sized in physical pixels and filled transparent by the
+    caller, who also sets its device pixel ratio. Without ``color`` the SVG
+    keeps its own colors.
+    """
+    started = instrument.clock()
+    painter = painter_class(target)
+    painter.setRenderHint(painter_class.Antialiasing)
+    painter.setRenderHint(painter_class.SmoothPixmapTransform)
+    renderer.render(painter)
+    if color is not None:
+        painter.setCompositionMode(painter_class.CompositionMode_SourceIn)
+        painter.fillRect(target.rect(), color)
+    painter.end()
+    instrument.record("rasterize", started, icon=icon)
+    return target
@@ -0,0 +1,113 @@
+"""Stylesheet lookup shared by both bindings.
+
+Only ``styleSheet()`` and ``parentWidget()`` of the widgets are used, so the
+functions work on PySide6 and PyQt5 widgets alike. ``get_color`` answers
+"which ``icon-color`` applies to this selector and state" for one stylesheet
+string and is memoized on it; ``get_effective_style`` walks up the parents
+to the first stylesheet that answers. ``parse_style_sheet`` splits a
+stylesheet into ``{selector: {property: value}}``.
+"""
+import re
+from functools import lru_cache
+from typing import Optional, Dict
+
+from . import instrument
+
+
+@lru_cache()
+def get_color(object_name, style_sheet, hover=False, pressed=False, checked=False, style_filter="icon-color"):
+    started = instrument.clock()
+    result = _find_color(object_name, style_sheet, hover, pressed, checked, style_filter)
+    instrument.record("get_color", started, widget_class=object_name)
+    return result
+
+
+def _find_color(object_name, style_sheet, hover, pressed, checked, style_filter):
+    style_blocks = style_sheet.split('}')
+    for block in style_blocks:
+
+        if not object_name:
+            continue
+
+        _filter = any(
+            [
+                (f'{object_name}:hover') in block.strip(),
+                (f'{object_name}:pressed' in block.strip()),
+                (f'{object_name}:checked' in block.strip()),
+            ]
+        )
+        if not any([hover, pressed, checked]) and object_name in block.strip() and not _filter:
+            style_rules = block.split('{')[-1].strip()
+
+        elif hover and f'{object_name}:hover' in block.strip():
+            style_rules = block.split('{')[-1].strip()
+
+        elif checked and f'{object_name}:checked' in block.strip():
+            style_rules = block.split('{')[-1].strip()
+
+        elif pressed and f'{object_name}:pressed' in block.strip():
+            style_rules = block.split('{')[-1].strip()
+
+        else:
+            continue
+
+        clear = lambda e: str(e).replace("/*", "").replace("*/", "")
+        style_string = "\n".join(
+            [clear(i).strip() for i in style_rules.split("\n") if clear(i).strip().startswith(style_filter)])
+
+        if style_string:
+            pattern = style_filter + r":\s*([^;]+);"
+            matches = re.findall(pattern, style_string)
+            _match = matches[0] if matches else None
+            return _match, style_sheet
+
+    return None, None
+
+
+def get_effective_style(init_widget, hover=False, pressed=False, checked=False, style_filter="icon-color",
+                        object_name: Optional[str] = None):
+    """Get the effective style of a widget, considering parent styles."""
+
+    object_name = object_name or type(init_widget).__name__
+    started = instrument.clock()
+    depth = 0
+    current_widget = init_widget
+    while current_widget:
+        try:
+            current_widget
+
+            style_sheet = current_widget.styleSheet()
+            if style_sheet and object_name in style_sheet:
+                x, y = get_color(object_name, style_sheet, hover, pressed, checked, style_filter)
+                if x and y:
+                    instrument.record("style_walk", started, widget_class=object_name, depth=depth)
+                    return x, y
+
+            # Move to the parent widget
+            current_widget = current_widget.parentWidget()
+            depth += 1
+
+        except RuntimeError:
+            break
+    instrument.record("style_walk", started, widget_class=object_name, depth=depth)
+    return None, None
+
+
+@lru_cache(maxsize=128)
+def parse_style_sheet(style_sheet: str) -> Dict[str, Dict[str, str]]:
+    if not style_sheet:
+        return {}
+
+    result: Dict[str, Dict[str, str]] = {}
+    for block in style_sheet.split('}'):
+        if '{' not in block:
+            continue
+
+        selector, rules = block.split('{', 1)
+        properties = result.setdefault(selector.strip(), {})
+        for rule in rules.split(';'):
+            if ':' in rule:
+                prop, value = rule.split(':', 1)
+                properties[prop.strip()] = value.strip()
+
+    return result
@@ -0,0 +1,58 @@
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QPointF  # noqa: E402
+from PySide6.QtGui import QEnterEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+SQUARE = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M2 2h20v20H2z"/></svg>'
+CIRCLE = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/></svg>'
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def wait(qapp):
+    """Run the event loop for ``ms`` milliseconds."""
+    def run(ms):
+        end = time.monotonic() + ms / 1000
+        while time.monotonic() < end:
+            qapp.processEvents()
+            time.sleep(0.002)
+        qapp.processEvents()
+    return run
+
+
+@pytest.fixture
+def svg_file(tmp_path):
+    """Write an SVG to a fresh path, so no loader or render cache has seen it."""
+    count = iter(range(1000))
+
+    def write(content=SQUARE):
+        path = tmp_path / f"icon{next(count)}.svg"
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+    return write
+
+
+def colors(pixmap):
+    """Names of the opaque colors in ``pixmap``."""
+    image = pixmap.toImage()
+    return {
+        image.pixelColor(x, y).name()
+        for x in range(image.width()) for y in range(image.height())
+        if image.pixelColor(x, y).alpha() == 255
+    }
+
+
+def enter(widget):
+    """Send ``widget`` the cursor entering it; Qt 6 hands enterEvent a QEnterEvent, not a bare QEvent."""
+    pos = QPointF(1, 1)
+    QApplication.sendEvent(widget, QEnterEvent(pos, pos, widget.mapToGlobal(pos)))
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtWidgets import QWidget
+
+from pyside6_svg_widgets import loader, QDropButton, QIconSvg, QSvgButtonIcon, SvgLoader
+from conftest import CIRCLE, colors, enter
+
+
+@pytest.fixture
+def slow_loader(monkeypatch):
+    """A fresh SvgLoader whose reads take 50 ms."""
+    read_svg = loader.read_svg
+
+    def slow(path):
+        time.sleep(0.05)
+        return read_svg(path)
+
+    monkeypatch.setattr(loader, "read_svg", slow)
+    monkeypatch.setattr(SvgLoader, "_instance", None)
+    yield SvgLoader.instance()
+    SvgLoader.instance().waitForDone()
+
+
+def test_duplicate_requests_share_one_read(qapp, wait, slow_loader, svg_file, monkeypatch):
+    path = svg_file()
+    reads = []
+    read_svg = loader.read_svg
+    monkeypatch.setattr(loader, "read_svg", lambda p: reads.append(p) or read_svg(p))
+
+    delivered = []
+    assert slow_loader.request(path, delivered.append) is None
+    assert slow_loader.request(path, delivered.append) is None
+    wait(150)
+
+    assert reads == [path]
+    assert len(delivered) == 2 and delivered[0] is delivered[1]
+    assert slow_loader.request(path, delivered.append) is delivered[0]
+
+
+def test_icon_shows_placeholder_then_colored_source(qapp, wait, slow_loader, svg_file):
+    placeholder = QPixmap(8, 8)
+    placeholder.fill(QColor("#00ff00"))
+    slow_loader.setPlaceholder(placeholder)
+
+    parent = QWidget()
+    parent.setStyleSheet("QIconSvg { icon-color: #0000ff; }")
+    icon = QIconSvg(svg_file(), parent)
+    assert colors(icon.pixmap()) == {"#00ff00"}
+
+    wait(250)
+    assert colors(icon.pixmap()) == {"#0000ff"}
+
+
+def test_icon_shows_non_svg_files_as_is(qapp, wait, tmp_path):
+    image = QPixmap(8, 8)
+    image.fill(QColor("#00ff00"))
+    path = str(tmp_path / "icon.png")
+    assert image.save(path)
+
+    parent = QWidget()
+    parent.setStyleSheet("QIconSvg { icon-color: #0000ff; }")
+    icon = QIconSvg(path, parent)
+    wait(250)
+    assert colors(icon.pixmap()) == {"#00ff00"}
+
+
+def test_late_source_keeps_drop_button_colors(qapp, wait, slow_loader, svg_file):
+    parent = QWidget()
+    parent.setStyleSheet("QDropButton { icon-color: #0000ff; } QDropButton:hover { icon-color: #ff0000; }")
+    button = QDropButton("Item", svg_file(), svg_file(), svg_file(CIRCLE), parent=parent)
+    parent.show()
+    wait(250)
+    assert colors(button.right.pixmap()) == {"#0000ff"}
+
+    # The minus icon is read again now, and arrives after the hover colors were applied
+    slow_loader.clear()
+    enter(button)
+    wait(150)
+    assert colors(button.right.pixmap()) == {"#ff0000"}
+    assert colors(button.left.pixmap()) == {"#ff0000"}
+
+
+def test_svg_button_icon_paints_placeholder_while_loading(qapp, wait, slow_loader, svg_file):
+    placeholder = QPixmap(8, 8)
+    placeholder.fill(QColor("#00ff00"))
+    slow_loader.setPlaceholder(placeholder)
+
+    parent = QWidget()
+    parent.setStyleSheet("QSvgButtonIcon { icon-color: #0000ff; }")
+    icon = QSvgButtonIcon(svg_file(), parent)
+    icon.setSvgSize(16, 16)
+    assert colors(icon.grab()) == {"#00ff00"}
+
+    wait(250)
+    assert "#00ff00" not in colors(icon.grab())
+    assert "#0000ff" in colors(icon.grab())
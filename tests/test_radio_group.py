@@ -0,0 +1,76 @@
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+from pyside6_svg_widgets import SvgRadioGroup, SVGRenderRadioButton
+from conftest import SQUARE, colors
+
+STYLE = "SVGRenderRadioButton { icon-color: #ff0000; } SVGRenderRadioButton:checked { icon-color: #0000ff; }"
+
+
+def make_group(count=3, style=STYLE):
+    parent = QWidget()
+    parent.setStyleSheet(style)
+    layout = QVBoxLayout(parent)
+    group = SvgRadioGroup(parent)
+    for _ in range(count):
+        button = SVGRenderRadioButton(SQUARE, (16, 16))
+        layout.addWidget(button)
+        group.addButton(button)
+    return parent, group
+
+
+def icon_colors(button):
+    return colors(button.icon().pixmap(16, 16))
+
+
+def test_click_checks_one_button(qapp, wait):
+    parent, group = make_group()
+    parent.show()
+    wait(150)
+
+    QTest.mouseClick(group.buttons[1], Qt.MouseButton.LeftButton)
+    wait(50)
+    assert group.checkedIndex() == 1
+    assert icon_colors(group.buttons[1]) == {"#0000ff"}
+    assert icon_colors(group.buttons[0]) == {"#ff0000"}
+
+    QTest.mouseClick(group.buttons[2], Qt.MouseButton.LeftButton)
+    wait(50)
+    assert group.checkedIndex() == 2
+    assert icon_colors(group.buttons[1]) == {"#ff0000"}
+    assert icon_colors(group.buttons[2]) == {"#0000ff"}
+
+
+def test_click_on_checked_button_keeps_it_checked(qapp, wait):
+    parent, group = make_group()
+    parent.show()
+    wait(150)
+    group.setChecked(0)
+
+    QTest.mouseClick(group.buttons[0], Qt.MouseButton.LeftButton)
+    wait(50)
+    assert group.buttons[0].isChecked()
+    assert icon_colors(group.buttons[0]) == {"#0000ff"}
+
+
+def test_buttons_under_differently_styled_parents(qapp, wait):
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    group = SvgRadioGroup(root)
+    for style in (STYLE, STYLE.replace("#0000ff", "#00ff00")):
+        panel = QWidget()
+        panel.setStyleSheet(style)
+        button = SVGRenderRadioButton(SQUARE, (16, 16), panel)
+        layout.addWidget(panel)
+        group.addButton(button)
+    root.show()
+    wait(150)
+
+    group.setChecked(0)
+    group.setChecked(1)
+    wait(50)
+    assert icon_colors(group.buttons[1]) == {"#00ff00"}
+    group.setChecked(0)
+    wait(50)
+    assert icon_colors(group.buttons[0]) == {"#0000ff"}
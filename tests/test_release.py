@@ -0,0 +1,183 @@
+import pytest
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
+
+from pyside6_svg_widgets import (
+    QIconSvg, QSvgButton, SVGRenderButton, SVGRenderIcon, SvgRadioGroup, SVGRenderRadioButton,
+    RasterReleasePolicy, build_svg_widgets
+)
+from svg_widgets_core.cache import set_budget, DEFAULT_BUDGET
+from conftest import SQUARE, colors
+
+STYLE = "".join(
+    f"{name} {{ icon-color: #0000ff; }} {name}:checked {{ icon-color: #00ff00; }}"
+    for name in ("QIconSvg", "QSvgButton", "SVGRenderButton", "SVGRenderRadioButton")
+)
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    monkeypatch.setattr(RasterReleasePolicy, "_instance", None)
+    policy = RasterReleasePolicy.instance()
+    yield policy
+    policy.setIdleTimeout(0)
+
+
+def shown_colors(widget):
+    if isinstance(widget, QIconSvg):
+        return colors(widget.pixmap())
+    return colors(widget.icon().pixmap(16, 16))
+
+
+def test_hidden_widgets_release_and_restore(qapp, wait, policy, svg_file):
+    parent = QWidget()
+    parent.setStyleSheet(STYLE)
+    layout = QVBoxLayout(parent)
+    widgets = [QIconSvg(svg_file()), QSvgButton(svg_file()), SVGRenderButton(SQUARE, (16, 16))]
+    for widget in widgets:
+        layout.addWidget(widget)
+    parent.show()
+    wait(200)
+    assert all(shown_colors(widget) == {"#0000ff"} for widget in widgets)
+
+    parent.hide()
+    assert all(widget.rasters_released and widget.raster is None for widget in widgets)
+    assert all(not shown_colors(widget) for widget in widgets)
+
+    parent.show()
+    assert not any(widget.rasters_released for widget in widgets)
+    assert all(shown_colors(widget) == {"#0000ff"} for widget in widgets)
+    assert (policy.releases, policy.restores) == (3, 3)
+
+
+def test_buttons_keep_their_released_signal(qapp, svg_file):
+    buttons = [QSvgButton(svg_file()), SVGRenderButton(SQUARE, (16, 16)), SVGRenderIcon(SQUARE, (16, 16)),
+               SVGRenderRadioButton(SQUARE, (16, 16))]
+    for button in buttons:
+        calls = []
+        button.released.connect(lambda: calls.append(True))
+        button.released.emit()
+        assert calls == [True]
+
+
+def test_create_show_hide_delete_in_a_loop(qapp, wait, policy, svg_file):
+    path = svg_file()
+    for _ in range(6):
+        root = QWidget()
+        root.setStyleSheet(STYLE)
+        layout = QVBoxLayout(root)
+        buttons = [QSvgButton(path) for _ in range(40)]
+        for button in buttons:
+            layout.addWidget(button)
+        root.show()
+        assert QTest.qWaitForWindowExposed(root)
+        wait(150)
+        assert all(shown_colors(button) == {"#0000ff"} for button in buttons)
+        root.hide()
+        assert all(button.rasters_released for button in buttons)
+        root.deleteLater()
+        wait(10)
+
+
+def test_update_while_hidden_applies_on_show(qapp, wait, policy):
+    parent = QWidget()
+    parent.setStyleSheet(STYLE)
+    button = SVGRenderButton(SQUARE, (16, 16), parent)
+    parent.show()
+    wait(200)
+    parent.hide()
+
+    button.updateIcon("#ff0000")
+    wait(50)
+    assert button.rasters_released and button.icon().isNull()
+
+    parent.show()
+    assert shown_colors(button) == {"#ff0000"}
+
+
+def test_checked_radio_restores_checked_color(qapp, wait, policy):
+    parent = QWidget()
+    parent.setStyleSheet(STYLE)
+    layout = QVBoxLayout(parent)
+    group = SvgRadioGroup(parent)
+    for _ in range(2):
+        button = SVGRenderRadioButton(SQUARE, (16, 16))
+        layout.addWidget(button)
+        group.addButton(button)
+    parent.show()
+    wait(200)
+    group.setChecked(1)
+
+    parent.hide()
+    parent.show()
+    assert shown_colors(group.buttons[1]) == {"#00ff00"}
+    assert shown_colors(group.buttons[0]) == {"#0000ff"}
+
+
+def test_factory_widgets_take_part(qapp, wait, policy):
+    parent = QWidget()
+    parent.setStyleSheet(STYLE)
+    widgets = build_svg_widgets([(SQUARE, (16, 16))] * 3, parent=parent)
+    parent.show()
+    assert all(shown_colors(widget) == {"#0000ff"} for widget in widgets)
+
+    parent.hide()
+    assert all(widget.rasters_released for widget in widgets)
+    parent.show()
+    assert all(shown_colors(widget) == {"#0000ff"} for widget in widgets)
+
+
+def test_evicted_raster_is_revived_while_shown(qapp, wait, policy):
+    parent = QWidget()
+    parent.setStyleSheet(STYLE)
+    layout = QVBoxLayout(parent)
+    first, second = SVGRenderButton(SQUARE, (16, 16)), SVGRenderButton(SQUARE, (16, 16))
+    layout.addWidget(first)
+    layout.addWidget(second)
+    parent.show()
+    wait(200)
+
+    set_budget(0)
+    set_budget(DEFAULT_BUDGET)
+    second.hide()
+    second.show()
+    assert second.raster is first.raster
+
+
+def test_paint_queues_the_restore(qapp, wait, policy):
+    parent = QWidget()
+    parent.setStyleSheet(STYLE)
+    button = SVGRenderButton(SQUARE, (16, 16), parent)
+    parent.show()
+    wait(200)
+
+    policy.release(button)
+    button.repaint()
+    assert button.rasters_released and button.icon().isNull()
+    wait(10)
+    assert not button.rasters_released
+    assert shown_colors(button) == {"#0000ff"}
+
+
+def test_idle_timeout_releases_only_widgets_out_of_view(qapp, wait, policy):
+    area = QScrollArea()
+    inner = QWidget()
+    inner.setStyleSheet(STYLE)
+    layout = QVBoxLayout(inner)
+    buttons = [SVGRenderButton(SQUARE, (16, 16)) for _ in range(40)]
+    for button in buttons:
+        layout.addWidget(button)
+    area.setWidget(inner)
+    area.resize(120, 120)
+    area.show()
+    wait(200)
+
+    policy.setIdleTimeout(100)
+    wait(400)
+    assert not buttons[0].rasters_released
+    assert buttons[-1].rasters_released
+
+    area.verticalScrollBar().setValue(area.verticalScrollBar().maximum())
+    wait(50)
+    assert not buttons[-1].rasters_released
+    assert shown_colors(buttons[-1]) == {"#0000ff"}
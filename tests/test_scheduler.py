@@ -0,0 +1,86 @@
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from pyside6_svg_widgets import IconUpdateScheduler, QDropButton, SVGRenderButton
+from conftest import CIRCLE, SQUARE, colors, enter
+
+
+class Recorder(SVGRenderButton):
+    def __init__(self, *args, **kwargs):
+        self.applied = []
+        super().__init__(*args, **kwargs)
+
+    def applyIcon(self, color):
+        self.applied.append(color)
+        super().applyIcon(color)
+
+
+def test_updates_coalesce_to_the_last_state(qapp, wait):
+    button = Recorder(SQUARE, (16, 16))
+    wait(150)
+    button.applied.clear()
+
+    for color in ("#ff0000", "#00ff00", "#0000ff"):
+        button.scheduleIcon(color)
+    assert button.applied == []
+
+    wait(50)
+    assert button.applied == ["#0000ff"]
+    assert colors(button.icon().pixmap(16, 16)) == {"#0000ff"}
+
+
+def test_disabled_scheduler_applies_immediately(qapp, wait):
+    scheduler = IconUpdateScheduler.instance()
+    button = Recorder(SQUARE, (16, 16))
+    wait(150)
+    button.applied.clear()
+
+    scheduler.setEnabled(False)
+    try:
+        button.scheduleIcon("#ff0000")
+        button.scheduleIcon("#0000ff")
+    finally:
+        scheduler.setEnabled(True)
+    assert button.applied == ["#ff0000", "#0000ff"]
+
+
+def test_empty_color_is_dropped(qapp, wait):
+    button = Recorder(SQUARE, (16, 16))
+    wait(150)
+    button.applied.clear()
+
+    button.scheduleIcon(None)
+    button.updateIcon(None)
+    wait(50)
+    assert button.applied == []
+
+
+def test_update_icon_applies_before_returning(qapp, wait):
+    button = Recorder(SQUARE, (16, 16))
+    wait(150)
+    button.applied.clear()
+
+    button.scheduleIcon("#ff0000")
+    button.updateIcon("#0000ff")
+    assert button.applied == ["#0000ff"]
+    assert colors(button.icon().pixmap(16, 16)) == {"#0000ff"}
+
+    # The scheduled update it replaced is not applied afterwards
+    wait(50)
+    assert button.applied == ["#0000ff"]
+
+
+def test_drop_button_swaps_right_icon_colored_in_one_call(qapp, wait, svg_file):
+    parent = QWidget()
+    parent.setStyleSheet("QDropButton { icon-color: #0000ff; } QDropButton:hover { icon-color: #ff0000; }")
+    button = QDropButton("Item", svg_file(), svg_file(), svg_file(CIRCLE), parent=parent)
+    parent.show()
+    wait(250)
+    QApplication.sendEvent(button, QEvent(QEvent.Type.Leave))
+    wait(50)
+    assert colors(button.right.pixmap()) == {"#0000ff"}
+
+    # No event processing in between: the next paint already shows the colored minus icon
+    enter(button)
+    assert button.right.svg_path == button.minus_svg
+    assert colors(button.right.pixmap()) == {"#ff0000"}